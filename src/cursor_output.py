@@ -0,0 +1,124 @@
+import threading
+import time
+from collections import deque
+
+class CursorOutput:
+    """
+    Classe responsável por mover o cursor numa taxa própria, independente da taxa da câmera.
+
+    Cada frame processado entrega uma amostra da posição do cursor com o instante em que o frame foi
+    capturado. Uma thread move o cursor rate vezes por segundo para a posição estimada no instante
+    atual menos delay: entre duas amostras, a posição é interpolada linearmente; depois da última
+    amostra, é extrapolada com a velocidade entre as duas últimas, por no máximo max_extrapolation
+    segundos. Com delay igual a zero, o cursor antecipa o movimento da mão e a latência percebida cai;
+    com delay de cerca de um frame, o movimento só é interpolado, mais suave mas um frame atrasado.
+
+    Os cliques e scrolls continuam sendo pedidos pela thread do rastreamento, então o MouseController
+    precisa ter a thread de saída ativa (output_rate): assim todos os eventos passam pela mesma fila e
+    o backend só é chamado por uma thread.
+    """
+
+    def __init__(self, mouse_controller, rate=120, delay=0.0, max_extrapolation=0.05, max_gap=0.25):
+        """
+        Inicializa a saída do cursor e inicia a sua thread.
+
+        Args:
+            mouse_controller: Instância de MouseController que move o cursor, com output_rate definido
+            rate (float): Movimentos do cursor por segundo
+            delay (float): Atraso, em segundos, do instante mostrado em relação ao instante atual
+            max_extrapolation (float): Tempo máximo, em segundos, de extrapolação além da última amostra.
+                Depois disso o cursor para, por exemplo quando a mão sai de vista ou o gesto deixa de mover o cursor
+            max_gap (float): Intervalo, em segundos, entre amostras acima do qual as amostras anteriores são descartadas,
+                para que o cursor não deslize a partir de uma posição antiga quando a mão reaparece
+        """
+        if mouse_controller.output_thread is None:
+            raise ValueError("CursorOutput requires a MouseController with output_rate set")
+        self.mouse_controller = mouse_controller
+        self.interval = 1 / rate
+        self.delay = delay
+        self.max_extrapolation = max_extrapolation
+        self.max_gap = max_gap
+        self.samples = deque(maxlen=8)  # (instante, x, y), da mais antiga para a mais recente
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.ticks = 0   # Iterações da thread
+        self.moves = 0   # Iterações em que a posição estimada mudou e o cursor foi movido
+        self.last_position = None
+        self.thread = threading.Thread(target=self.__loop, daemon=True)
+        self.thread.start()
+
+    def add_sample(self, x, y, timestamp=None):
+        """
+        Registra uma posição do cursor.
+
+        Args:
+            x (float): Coordenada X normalizada, já espelhada
+            y (float): Coordenada Y normalizada
+            timestamp (float): Instante de captura do frame, em time.perf_counter(). Se None, usa o instante atual
+        """
+        timestamp = time.perf_counter() if timestamp is None else timestamp
+        with self.lock:
+            if self.samples and (timestamp - self.samples[-1][0] > self.max_gap or timestamp < self.samples[-1][0]):
+                self.samples.clear()
+            self.samples.append((timestamp, x, y))
+
+    def reset(self):
+        """
+        Descarta as amostras, por exemplo quando outra mão passa a controlar o cursor.
+        """
+        with self.lock:
+            self.samples.clear()
+
+    def position_at(self, now):
+        """
+        Estima a posição do cursor num instante.
+
+        Args:
+            now (float): Instante, em time.perf_counter()
+
+        Returns:
+            tuple: Coordenadas (x, y) normalizadas, ou None se não há amostras
+        """
+        with self.lock:
+            if not self.samples:
+                return None
+            samples = list(self.samples)
+
+        target_time = now - self.delay
+        if len(samples) == 1 or target_time <= samples[0][0]:
+            return samples[-1][1:] if len(samples) == 1 else samples[0][1:]
+
+        # Par de amostras que contém o instante, ou as duas últimas para extrapolar
+        target_time = min(target_time, samples[-1][0] + self.max_extrapolation)
+        for index in range(1, len(samples)):
+            if samples[index][0] >= target_time:
+                break
+        start_time, start_x, start_y = samples[index - 1]
+        end_time, end_x, end_y = samples[index]
+        if end_time <= start_time:
+            return end_x, end_y
+        progress = (target_time - start_time) / (end_time - start_time)
+        return start_x + (end_x - start_x) * progress, start_y + (end_y - start_y) * progress
+
+    def __loop(self):
+        """
+        Loop da thread: move o cursor para a posição estimada a cada intervalo, sem acumular atraso
+        quando uma iteração demora mais que o intervalo.
+        """
+        next_tick = time.perf_counter()
+        while not self.stop_event.wait(max(0.0, next_tick - time.perf_counter())):
+            now = time.perf_counter()
+            next_tick = max(next_tick + self.interval, now)
+            self.ticks += 1
+            position = self.position_at(now)
+            if position is not None and position != self.last_position:
+                self.last_position = position
+                self.mouse_controller.move_cursor(*position)
+                self.moves += 1
+
+    def close(self):
+        """
+        Encerra a thread.
+        """
+        self.stop_event.set()
+        self.thread.join()
@@ -0,0 +1,94 @@
+import argparse
+import time
+import cv2
+import numpy as np
+from gesture_recognizer import GestureRecognizer
+from landmark_bus import NO_HAND, LandmarkBusReader
+
+# Conexões entre os landmarks da mão, as mesmas de mediapipe.solutions.hands.HAND_CONNECTIONS
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+)
+
+GESTURE_NAMES = {
+    NO_HAND: 'NO HAND',
+    GestureRecognizer.NO_GESTURE: 'NO GESTURE',
+    GestureRecognizer.MOUSE_BUTTONS_UP: 'BUTTONS UP',
+    GestureRecognizer.MOUSE_RIGHT_DOWN: 'RIGHT DOWN',
+    GestureRecognizer.MOUSE_LEFT_DOWN: 'LEFT DOWN',
+    GestureRecognizer.SCROLL_UP: 'SCROLL UP',
+    GestureRecognizer.SCROLL_DOWN: 'SCROLL DOWN',
+}
+
+class DebugViewer:
+    """
+    Janela de debug que roda num processo separado, lendo os resultados publicados pelo HandTracker num LandmarkBus.
+    Como a renderização e o cv2.waitKey ficam fora do loop de rastreamento, abrir a janela não deixa o rastreamento mais lento.
+    """
+
+    def __init__(self, bus_name, window_size=(640, 480)):
+        """
+        Args:
+            bus_name (str): Nome da memória compartilhada do barramento
+            window_size (tuple): (largura, altura) da janela quando o barramento não publica frames
+        """
+        self.reader = LandmarkBusReader(bus_name)
+        self.window_size = window_size
+
+    def run(self):
+        """
+        Mostra a mensagem mais recente do barramento até o publicador encerrar ou o usuário apertar ESC,
+        que pede ao HandTracker para encerrar o rastreamento.
+        """
+        try:
+            while not self.reader.is_closed():
+                message = self.reader.read_latest()
+                if message is not None:
+                    cv2.imshow("Handy Input Debugger", self.__render(message))
+                if cv2.waitKey(5) & 0xFF == 27:
+                    self.reader.request_stop()
+                    break
+        finally:
+            cv2.destroyAllWindows()
+            self.reader.close()
+
+    def __render(self, message):
+        """
+        Desenha os landmarks, o gesto e a latência sobre o frame da mensagem.
+
+        Args:
+            message (LandmarkMessage): Mensagem lida do barramento
+
+        Returns:
+            np.ndarray: Imagem BGR espelhada, pronta para ser mostrada
+        """
+        if message.frame is not None:
+            image = message.frame
+        else:
+            width, height = self.window_size
+            image = np.zeros((height, width, 3), dtype=np.uint8)
+        height, width = image.shape[:2]
+
+        if message.landmarks is not None:
+            points = [(int(x * width), int(y * height)) for x, y, _ in message.landmarks]
+            for start, end in HAND_CONNECTIONS:
+                cv2.line(image, points[start], points[end], (224, 224, 224), 2)
+            for point in points:
+                cv2.circle(image, point, 3, (0, 0, 255), -1)
+
+        image = cv2.flip(image, 1)
+        latency = (time.perf_counter() - message.capture_time) * 1000
+        label = f"{GESTURE_NAMES.get(message.gesture, message.gesture)}  {latency:.0f} ms"
+        cv2.putText(image, label, (10, 25), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+        return image
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Janela de debug do Handy Input, lida de um barramento de landmarks")
+    parser.add_argument("bus_name", help="Nome da memória compartilhada do barramento")
+    args = parser.parse_args()
+
+    DebugViewer(args.bus_name).run()
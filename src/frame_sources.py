@@ -0,0 +1,219 @@
+import os
+import time
+import cv2
+import numpy as np
+
+class FrameSource:
+    """
+    Interface das fontes de frames usadas pelo HandTracker.
+    Toda fonte entrega frames BGR, como o cv2.VideoCapture, e indica quando não há mais frames.
+    """
+
+    def is_opened(self):
+        """
+        Returns:
+            bool: True enquanto a fonte ainda pode entregar frames
+        """
+        raise NotImplementedError
+
+    def read(self, image=None):
+        """
+        Lê o próximo frame.
+
+        Args:
+            image (np.ndarray): Array onde o frame deve ser escrito, quando a fonte suporta reaproveitá-lo.
+                Fontes que não suportam ignoram este argumento
+
+        Returns:
+            tuple: (sucesso, frame BGR)
+        """
+        raise NotImplementedError
+
+    def release(self):
+        """
+        Libera os recursos da fonte.
+        """
+        pass
+
+class WebcamSource(FrameSource):
+    """
+    Fonte de frames de uma webcam, através do cv2.VideoCapture.
+    """
+
+    def __init__(self, index=0, width=None, height=None, fps=None, fourcc=None):
+        """
+        Abre a câmera e aplica as configurações de captura informadas. Configurações None mantêm o padrão da câmera.
+
+        Args:
+            index (int): Índice da câmera
+            width (int): Largura de captura
+            height (int): Altura de captura
+            fps (int): Taxa de captura
+            fourcc (str): Codec de captura com quatro caracteres, por exemplo 'MJPG'
+        """
+        self.cap = cv2.VideoCapture(index)
+        if fourcc:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        if width:
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        if height:
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        if fps:
+            self.cap.set(cv2.CAP_PROP_FPS, fps)
+
+    def is_opened(self):
+        return self.cap.isOpened()
+
+    def read(self, image=None):
+        return self.cap.read(image)
+
+    def release(self):
+        self.cap.release()
+
+class VideoFileSource(FrameSource):
+    """
+    Fonte de frames de um arquivo de vídeo.
+    """
+
+    def __init__(self, video_path, is_looping=False, fps=None):
+        """
+        Abre o arquivo de vídeo.
+
+        Args:
+            video_path (str): Caminho do arquivo de vídeo
+            is_looping (bool): Se True, volta ao início do vídeo ao chegar no fim
+            fps (float): Se informado, entrega os frames nessa taxa, como uma câmera. Se None, entrega o mais rápido possível
+        """
+        self.video_path = video_path
+        self.is_looping = is_looping
+        self.frame_pacer = FramePacer(fps)
+        self.cap = cv2.VideoCapture(video_path)
+        self.is_finished = not self.cap.isOpened()
+
+    def is_opened(self):
+        return not self.is_finished
+
+    def read(self, image=None):
+        self.frame_pacer.wait()
+        success, image = self.cap.read(image)
+        if not success and self.is_looping:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            success, image = self.cap.read(image)
+        if not success:
+            self.is_finished = True
+        return success, image
+
+    def release(self):
+        self.cap.release()
+
+class ImageDirectorySource(FrameSource):
+    """
+    Fonte de frames de um diretório de imagens, lidas em ordem alfabética.
+    """
+
+    def __init__(self, folder, is_looping=False, fps=None):
+        """
+        Lista as imagens do diretório.
+
+        Args:
+            folder (str): Diretório com as imagens (.png, .jpg ou .jpeg)
+            is_looping (bool): Se True, volta à primeira imagem ao chegar na última
+            fps (float): Se informado, entrega os frames nessa taxa. Se None, entrega o mais rápido possível
+        """
+        self.image_paths = sorted(
+            os.path.join(folder, filename) for filename in os.listdir(folder)
+            if filename.endswith(('.png', '.jpg', '.jpeg'))
+        )
+        self.is_looping = is_looping
+        self.frame_pacer = FramePacer(fps)
+        self.index = 0
+
+    def is_opened(self):
+        return self.index < len(self.image_paths)
+
+    def read(self, image=None):
+        if not self.is_opened():
+            return False, None
+        self.frame_pacer.wait()
+        image = cv2.imread(self.image_paths[self.index])
+        self.index += 1
+        if self.is_looping and self.index == len(self.image_paths):
+            self.index = 0
+        return image is not None, image
+
+class SyntheticSource(FrameSource):
+    """
+    Fonte de frames sintéticos (ruído fixo), útil para medir o custo do pipeline sem câmera nem arquivos.
+    Nenhuma mão é detectada nesses frames.
+    """
+
+    def __init__(self, width=640, height=480, frame_count=300, fps=None, seed=0):
+        """
+        Gera o frame sintético.
+
+        Args:
+            width (int): Largura dos frames
+            height (int): Altura dos frames
+            frame_count (int): Número de frames entregues antes de a fonte se fechar. None para não ter fim
+            fps (float): Se informado, entrega os frames nessa taxa. Se None, entrega o mais rápido possível
+            seed (int): Semente do gerador do ruído
+        """
+        self.image = np.random.default_rng(seed).integers(0, 256, (height, width, 3), dtype=np.uint8)
+        self.frame_count = frame_count
+        self.frame_pacer = FramePacer(fps)
+        self.frames_read = 0
+
+    def is_opened(self):
+        return self.frame_count is None or self.frames_read < self.frame_count
+
+    def read(self, image=None):
+        if not self.is_opened():
+            return False, None
+        self.frame_pacer.wait()
+        self.frames_read += 1
+        return True, self.image
+
+class FramePacer:
+    """
+    Limita a entrega de frames a uma taxa fixa, imitando o ritmo de uma câmera.
+    """
+
+    def __init__(self, fps):
+        """
+        Args:
+            fps (float): Taxa desejada. Se None, wait() nunca espera
+        """
+        self.interval = 1 / fps if fps else None
+        self.next_frame_time = None
+
+    def wait(self):
+        """
+        Aguarda até o instante do próximo frame.
+        """
+        if self.interval is None:
+            return
+        now = time.perf_counter()
+        if self.next_frame_time is not None and now < self.next_frame_time:
+            time.sleep(self.next_frame_time - now)
+            now = self.next_frame_time
+        self.next_frame_time = now + self.interval
+
+def open_frame_source(spec, fps=None, frame_count=300):
+    """
+    Abre uma fonte de frames a partir de uma descrição textual, como as passadas pela linha de comando.
+
+    Args:
+        spec: Índice de uma webcam (int ou texto com dígitos), diretório de imagens, 'synthetic' ou arquivo de vídeo
+        fps (float): Taxa de entrega dos frames para as fontes que não são webcams. None para entregar o mais rápido possível
+        frame_count (int): Número de frames da fonte sintética
+
+    Returns:
+        FrameSource: Fonte de frames correspondente
+    """
+    if isinstance(spec, int) or spec.isdigit():
+        return WebcamSource(int(spec))
+    if spec == 'synthetic':
+        return SyntheticSource(frame_count=frame_count, fps=fps)
+    if os.path.isdir(spec):
+        return ImageDirectorySource(spec, fps=fps)
+    return VideoFileSource(spec, fps=fps)
@@ -0,0 +1,54 @@
+from gesture_recognizer import GestureRecognizer
+
+class GestureActions:
+    """
+    Classe responsável por traduzir os gestos reconhecidos em ações do mouse.
+    É usada tanto pelo rastreamento ao vivo (HandTracker) quanto pela reprodução de gravações (LandmarkReplay).
+    """
+
+    def __init__(self, mouse_controller, cursor_output=None):
+        """
+        Inicializa o executor de ações.
+
+        Args:
+            mouse_controller: Instância de MouseController que executará as ações
+            cursor_output: Instância opcional de CursorOutput. Se informada, as posições do cursor são entregues
+                a ela, que move o cursor na sua própria taxa, em vez de irem direto ao MouseController
+        """
+        self.mouse_controller = mouse_controller
+        self.cursor_output = cursor_output
+
+    def run(self, gesture, coordinates, timestamp=None):
+        """
+        Executa a ação correspondente ao gesto detectado.
+        Inverte a coordenada X para corresponder ao movimento natural da mão (espelhado).
+
+        Args:
+            gesture: Constante que identifica o gesto reconhecido
+            coordinates: PointerCoordinates com as coordenadas x,y normalizadas do cursor
+            timestamp (float): Instante de captura do frame, em time.perf_counter(), usado pelo CursorOutput
+        """
+        inverse_coordinate_x = abs(1 - coordinates.x)
+        
+        if gesture == GestureRecognizer.MOUSE_BUTTONS_UP:
+            self.__move_cursor(inverse_coordinate_x, coordinates.y, timestamp)
+            self.mouse_controller.buttons_up()
+        elif gesture == GestureRecognizer.MOUSE_LEFT_DOWN:
+            self.__move_cursor(inverse_coordinate_x, coordinates.y, timestamp)
+            self.mouse_controller.left_button_down()
+        elif gesture == GestureRecognizer.MOUSE_RIGHT_DOWN:
+            self.__move_cursor(inverse_coordinate_x, coordinates.y, timestamp)
+            self.mouse_controller.right_button_down()
+        elif gesture == GestureRecognizer.SCROLL_UP:
+            self.mouse_controller.scroll_up(1)
+        elif gesture == GestureRecognizer.SCROLL_DOWN:
+            self.mouse_controller.scroll_down(1)
+
+    def __move_cursor(self, x, y, timestamp):
+        """
+        Move o cursor diretamente ou entrega a posição ao CursorOutput.
+        """
+        if self.cursor_output is None:
+            self.mouse_controller.move_cursor(x, y)
+        else:
+            self.cursor_output.add_sample(x, y, timestamp)
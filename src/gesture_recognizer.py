@@ -1,6 +1,69 @@
-import math
-import mediapipe as mp
+from enum import IntEnum
 import numpy as np
+from pointer_filters import EmaFilter
+from rule_engine import RuleEngine
+
+class HandLandmark(IntEnum):
+    """
+    Índices dos 21 landmarks da mão, iguais aos de mediapipe.solutions.hands.HandLandmark.
+    Definidos aqui para que o reconhecimento de gestos não precise importar o MediaPipe, que é lento de carregar.
+    """
+    WRIST = 0
+    THUMB_CMC = 1
+    THUMB_MCP = 2
+    THUMB_IP = 3
+    THUMB_TIP = 4
+    INDEX_FINGER_MCP = 5
+    INDEX_FINGER_PIP = 6
+    INDEX_FINGER_DIP = 7
+    INDEX_FINGER_TIP = 8
+    MIDDLE_FINGER_MCP = 9
+    MIDDLE_FINGER_PIP = 10
+    MIDDLE_FINGER_DIP = 11
+    MIDDLE_FINGER_TIP = 12
+    RING_FINGER_MCP = 13
+    RING_FINGER_PIP = 14
+    RING_FINGER_DIP = 15
+    RING_FINGER_TIP = 16
+    PINKY_MCP = 17
+    PINKY_PIP = 18
+    PINKY_DIP = 19
+    PINKY_TIP = 20
+
+def landmarks_to_array(hand_landmarks, out=None):
+    """
+    Converte os landmarks de uma mão detectada pelo MediaPipe para um array contíguo.
+
+    Args:
+        hand_landmarks: Landmarks de uma única mão (NormalizedLandmarkList)
+        out (np.ndarray): Array float32 (21, 3) pré-alocado onde o resultado será escrito. Se None, um novo array é criado
+
+    Returns:
+        np.ndarray: Array float32 (21, 3) com as coordenadas x, y, z de cada landmark
+    """
+    if out is None:
+        return np.array([(landmark.x, landmark.y, landmark.z) for landmark in hand_landmarks.landmark], dtype=np.float32)
+
+    for index, landmark in enumerate(hand_landmarks.landmark):
+        out[index, 0] = landmark.x
+        out[index, 1] = landmark.y
+        out[index, 2] = landmark.z
+    return out
+
+class PointerCoordinates:
+    """
+    Coordenadas normalizadas do cursor.
+    Usa __slots__ para ser mais leve que um dicionário, mas continua aceitando coordinates['x'] e coordinates['y'].
+    """
+
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __getitem__(self, key):
+        return getattr(self, key)
 
 class GestureRecognizer:
     """
@@ -17,194 +80,162 @@ class GestureRecognizer:
     SCROLL_UP = 4        
     SCROLL_DOWN = 5       
 
-    def __init__(self):
-        """
-        Inicializa o reconhecedor de gestos.
-        Define variáveis para suavização do cursor.
-        """
-        self.mp_hands = mp.solutions.hands
-        self.cursor_smoothing_factor = 0.8  # Fator de suavização do movimento do cursor
-        self.prev_x_coordinate = 0          # Coordenada X anterior para suavização
-        self.prev_y_coordinate = 0          # Coordenada Y anterior para suavização
+    # Indicador levantado, anelar e mindinho dobrados
+    MOUSE_GESTURE_CONDITIONS = [
+        ('y_gt', HandLandmark.PINKY_TIP, HandLandmark.PINKY_MCP),
+        ('y_gt', HandLandmark.RING_FINGER_TIP, HandLandmark.RING_FINGER_MCP),
+        ('y_lt', HandLandmark.INDEX_FINGER_TIP, HandLandmark.INDEX_FINGER_MCP),
+    ]
+
+    # Distância máxima, em coordenadas normalizadas, entre as pontas dos dedos para considerar que estão juntas
+    PINCH_THRESHOLD = 0.08
 
-    def __get_distance(self, point1, point2):
+    @classmethod
+    def gesture_rules(cls, pinch_threshold=PINCH_THRESHOLD, right_pinch_threshold=None):
         """
-        Calcula a distância euclidiana entre dois pontos.
-        
+        Monta as regras dos gestos, avaliadas em ordem: a primeira regra satisfeita define o gesto.
+
         Args:
-            point1: Primeiro ponto com coordenadas x,y
-            point2: Segundo ponto com coordenadas x,y
-            
+            pinch_threshold (float): Distância máxima entre as pontas do polegar e do indicador no clique esquerdo
+            right_pinch_threshold (float): Distância máxima entre as pontas do polegar e do médio no clique direito.
+                Se None, usa pinch_threshold
+
         Returns:
-            float: Distância entre os pontos
+            list: Pares (gesto, condições) no formato do RuleEngine
+        """
+        if right_pinch_threshold is None:
+            right_pinch_threshold = pinch_threshold
+        return [
+            # Ponta do polegar junto da ponta do indicador
+            (cls.MOUSE_LEFT_DOWN, cls.MOUSE_GESTURE_CONDITIONS + [
+                ('distance_lt', HandLandmark.THUMB_TIP, HandLandmark.INDEX_FINGER_TIP, pinch_threshold, 'pinch_threshold'),
+            ]),
+            # Ponta do polegar junto da ponta do dedo médio
+            (cls.MOUSE_RIGHT_DOWN, cls.MOUSE_GESTURE_CONDITIONS + [
+                ('distance_lt', HandLandmark.THUMB_TIP, HandLandmark.MIDDLE_FINGER_TIP, right_pinch_threshold, 'right_pinch_threshold'),
+            ]),
+            (cls.MOUSE_BUTTONS_UP, cls.MOUSE_GESTURE_CONDITIONS),
+            # Mindinho dobrado, indicador, médio e anelar esticados para cima
+            (cls.SCROLL_UP, [
+                ('y_gt', HandLandmark.PINKY_TIP, HandLandmark.PINKY_PIP),
+                ('y_lt', HandLandmark.RING_FINGER_TIP, HandLandmark.RING_FINGER_MCP),
+                ('y_lt', HandLandmark.INDEX_FINGER_TIP, HandLandmark.INDEX_FINGER_MCP),
+                ('y_lt', HandLandmark.MIDDLE_FINGER_TIP, HandLandmark.MIDDLE_FINGER_MCP),
+                ('y_lt', HandLandmark.MIDDLE_FINGER_TIP, HandLandmark.MIDDLE_FINGER_PIP),
+            ]),
+            # Indicador, médio e anelar esticados para baixo
+            (cls.SCROLL_DOWN, [
+                ('y_gt', HandLandmark.RING_FINGER_TIP, HandLandmark.RING_FINGER_MCP),
+                ('y_gt', HandLandmark.INDEX_FINGER_TIP, HandLandmark.INDEX_FINGER_MCP),
+                ('y_gt', HandLandmark.MIDDLE_FINGER_TIP, HandLandmark.MIDDLE_FINGER_MCP),
+                ('y_gt', HandLandmark.MIDDLE_FINGER_TIP, HandLandmark.MIDDLE_FINGER_PIP),
+            ]),
+        ]
+
+    def __init__(self, pinch_threshold=PINCH_THRESHOLD, right_pinch_threshold=None, cursor_smoothing_factor=0.8, pointer_filter=None,
+                 classifier=None):
         """
-        return math.sqrt((point1.x - point2.x)**2 + (point1.y - point2.y)**2)
+        Inicializa o reconhecedor de gestos.
+        Compila as regras dos gestos e define o filtro da posição do cursor.
 
-    def __is_mouse_gesture(self, hand_landmarks):
-        """
-        Verifica se a posição da mão corresponde ao gesto de controle do mouse.
-        O gesto é reconhecido quando o dedo indicador está levantado e os dedos anelar e mindinho estão dobrados.
-        
         Args:
-            hand_landmarks: Lista de pontos de referência da mão detectados
-            
-        Returns:
-            bool: True se o gesto for reconhecido, False caso contrário
+            pinch_threshold (float): Distância máxima entre as pontas do polegar e do indicador no clique esquerdo
+            right_pinch_threshold (float): Distância máxima entre as pontas do polegar e do médio no clique direito.
+                Se None, usa pinch_threshold
+            cursor_smoothing_factor (float): Peso da posição anterior na suavização exponencial do cursor (0 desliga a suavização).
+                Usado apenas quando pointer_filter é None
+            pointer_filter (PointerFilter): Filtro da posição do cursor. Se None, usa um EmaFilter com cursor_smoothing_factor
+            classifier: Classificador usado no lugar das regras, com o mesmo método evaluate do RuleEngine, como o
+                TemplateClassifier. Se None, usa as regras de gesture_rules
         """
-        hand_landmarks = hand_landmarks[0]
-
-        pinky_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.PINKY_TIP]
-        pinky_mcp = hand_landmarks.landmark[self.mp_hands.HandLandmark.PINKY_MCP]
-
-        ring_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.RING_FINGER_TIP]
-        ring_mcp = hand_landmarks.landmark[self.mp_hands.HandLandmark.RING_FINGER_MCP]
+        self.rule_engine = RuleEngine(self.gesture_rules(pinch_threshold, right_pinch_threshold), self.NO_GESTURE)
+        self.classifier = self.rule_engine if classifier is None else classifier
+        self.pointer_filter = EmaFilter(cursor_smoothing_factor) if pointer_filter is None else pointer_filter
 
-        index_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.INDEX_FINGER_TIP]
-        index_mcp = hand_landmarks.landmark[self.mp_hands.HandLandmark.INDEX_FINGER_MCP]
-
-        return pinky_tip.y > pinky_mcp.y and ring_tip.y > ring_mcp.y and index_tip.y < index_mcp.y
-
-    def __is_mouse_left_down(self, hand_landmarks):
+    def clone(self):
         """
-        Verifica se o gesto corresponde ao clique do botão esquerdo do mouse.
-        O gesto é reconhecido quando a distância entre a ponta do polegar e do indicador é pequena.
-        
-        Args:
-            hand_landmarks: Lista de pontos de referência da mão detectados
-            
+        Cria um reconhecedor com as mesmas regras e configurações, mas com o seu próprio filtro do cursor.
+        Usado para dar a cada mão rastreada um reconhecedor independente.
+
         Returns:
-            bool: True se o gesto for reconhecido, False caso contrário
+            GestureRecognizer: Novo reconhecedor, que compartilha as regras já compiladas e o classificador
         """
-        hand_landmarks = hand_landmarks[0]
-
-        thumb_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.THUMB_TIP]
-        index_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.INDEX_FINGER_TIP]
+        recognizer = GestureRecognizer.__new__(type(self))
+        recognizer.rule_engine = self.rule_engine
+        recognizer.classifier = self.classifier
+        recognizer.pointer_filter = self.pointer_filter.clone()
+        return recognizer
 
-        distance_thumb_index = self.__get_distance(thumb_tip, index_tip)
-        return distance_thumb_index < 0.08
-    
-    def __is_mouse_right_down(self, hand_landmarks):
+    def observe_latency(self, latency):
         """
-        Verifica se o gesto corresponde ao clique do botão direito do mouse.
-        O gesto é reconhecido quando a distância entre a ponta do polegar e do dedo médio é pequena.
-        
+        Informa a latência de um frame, entre a captura e o envio ao mouse, usada pelo filtro do cursor na previsão.
+
         Args:
-            hand_landmarks: Lista de pontos de referência da mão detectados
-            
-        Returns:
-            bool: True se o gesto for reconhecido, False caso contrário
+            latency (float): Latência em segundos
         """
-        hand_landmarks = hand_landmarks[0]
-
-        thumb_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.THUMB_TIP]
-        middle_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-
-        distance_thumb_index = self.__get_distance(thumb_tip, middle_tip)
-        return distance_thumb_index < 0.08
+        self.pointer_filter.observe_latency(latency)
 
-    def get_pointer_coordinates(self, hand_landmarks):
+    def get_pointer_coordinates(self, hand_landmarks, timestamp=None):
         """
         Obtém as coordenadas normalizadas do cursor baseadas na posição da mão.
-        Aplica suavização ao movimento para evitar tremulações.
+        Filtra o movimento para evitar tremulações.
         
         Args:
             hand_landmarks: Lista de pontos de referência da mão detectados
+            timestamp (float): Instante de captura do frame, em segundos. Se None, usa o instante atual
             
         Returns:
-            dict: Dicionário com as coordenadas x e y normalizadas do cursor
-
-        TODO: Considerar mover a lógica de suavizar o cursor para fora dessa classe, já que sai do escopo de "Reconhecer gestos".
+            PointerCoordinates: Coordenadas x e y normalizadas do cursor
         """
-        hand_landmarks = hand_landmarks[0]
-
-        ring_mcp = hand_landmarks.landmark[self.mp_hands.HandLandmark.RING_FINGER_MCP]
-
-        smoother_x_coordinate = self.prev_x_coordinate * self.cursor_smoothing_factor + ring_mcp.x * (1 - self.cursor_smoothing_factor)
-        smoother_y_coordinate = self.prev_y_coordinate * self.cursor_smoothing_factor + ring_mcp.y * (1 - self.cursor_smoothing_factor)
-
-        self.prev_x_coordinate = smoother_x_coordinate
-        self.prev_y_coordinate = smoother_y_coordinate
-
-        return {'x': smoother_x_coordinate, 'y': smoother_y_coordinate}
+        ring_mcp = hand_landmarks[0].landmark[HandLandmark.RING_FINGER_MCP]
+        return PointerCoordinates(*self.pointer_filter.update(ring_mcp.x, ring_mcp.y, timestamp))
 
-    def __is_scroll_up(self, hand_landmarks):
+    def get_pointer_coordinates_array(self, landmarks, timestamp=None):
         """
-        Verifica se o gesto corresponde ao scroll para cima.
-        O gesto é reconhecido quando o dedo mindinho está dobrado para baixo
-        e os dedos indicador, médio e anelar estão esticados para cima.
-        
+        Obtém as coordenadas filtradas do cursor a partir dos landmarks de uma mão já convertidos para array.
+
         Args:
-            hand_landmarks: Lista de pontos de referência da mão detectados
-            
+            landmarks (np.ndarray): Array (21, 3) com os landmarks da mão
+            timestamp (float): Instante de captura do frame, em segundos. Se None, usa o instante atual
+
         Returns:
-            bool: True se o gesto for reconhecido, False caso contrário
+            PointerCoordinates: Coordenadas x e y normalizadas do cursor
         """
-        hand_landmarks = hand_landmarks[0]
-
-        pinky_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.PINKY_TIP]
-        pinky_pip = hand_landmarks.landmark[self.mp_hands.HandLandmark.PINKY_PIP]
-
-        index_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.INDEX_FINGER_TIP]
-        index_mcp = hand_landmarks.landmark[self.mp_hands.HandLandmark.INDEX_FINGER_MCP]
-
-        middle_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-        middle_mcp = hand_landmarks.landmark[self.mp_hands.HandLandmark.MIDDLE_FINGER_MCP]
-
-        ring_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.RING_FINGER_TIP]
-        ring_mcp = hand_landmarks.landmark[self.mp_hands.HandLandmark.RING_FINGER_MCP]
-
-        middle_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-        middle_pip = hand_landmarks.landmark[self.mp_hands.HandLandmark.MIDDLE_FINGER_PIP]
+        ring_mcp = landmarks[HandLandmark.RING_FINGER_MCP]
+        return PointerCoordinates(*self.pointer_filter.update(float(ring_mcp[0]), float(ring_mcp[1]), timestamp))
 
-        return pinky_tip.y > pinky_pip.y and ring_tip.y < ring_mcp.y and index_tip.y < index_mcp.y and middle_tip.y < middle_mcp.y and middle_tip.y < middle_pip.y
-
-    def __is_scroll_down(self, hand_landmarks):
+    def recognize(self, hand_landmarks):
         """
-        Verifica se o gesto corresponde ao scroll para baixo.
-        O gesto é reconhecido quando os dedos indicador, médio e anelar 
-        estão esticados para baixo.
+        Método principal que identifica qual gesto está sendo realizado.
         
         Args:
             hand_landmarks: Lista de pontos de referência da mão detectados
             
         Returns:
-            bool: True se o gesto for reconhecido, False caso contrário
+            int: Constante que identifica o gesto reconhecido
         """
-        hand_landmarks = hand_landmarks[0]
-
-        index_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.INDEX_FINGER_TIP]
-        index_mcp = hand_landmarks.landmark[self.mp_hands.HandLandmark.INDEX_FINGER_MCP]
+        return self.recognize_array(landmarks_to_array(hand_landmarks[0]))
 
-        middle_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-        middle_mcp = hand_landmarks.landmark[self.mp_hands.HandLandmark.MIDDLE_FINGER_MCP]
-
-        ring_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.RING_FINGER_TIP]
-        ring_mcp = hand_landmarks.landmark[self.mp_hands.HandLandmark.RING_FINGER_MCP]
+    def recognize_array(self, landmarks):
+        """
+        Identifica o gesto a partir dos landmarks de uma mão já convertidos para array.
 
-        middle_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-        middle_pip = hand_landmarks.landmark[self.mp_hands.HandLandmark.MIDDLE_FINGER_PIP]
+        Args:
+            landmarks (np.ndarray): Array (21, 3) com os landmarks da mão
 
-        return ring_tip.y > ring_mcp.y and index_tip.y > index_mcp.y and middle_tip.y > middle_mcp.y and middle_tip.y > middle_pip.y
+        Returns:
+            int: Constante que identifica o gesto reconhecido
+        """
+        return int(self.classifier.evaluate(landmarks[np.newaxis])[0])
 
-    def recognize(self, hand_landmarks):
+    def recognize_batch(self, landmarks):
         """
-        Método principal que identifica qual gesto está sendo realizado.
-        
+        Identifica os gestos de vários frames de uma só vez.
+
         Args:
-            hand_landmarks: Lista de pontos de referência da mão detectados
-            
+            landmarks (np.ndarray): Array (N, 21, 3) com os landmarks de uma mão em cada frame
+
         Returns:
-            int: Constante que identifica o gesto reconhecido
+            np.ndarray: Array (N,) com a constante do gesto reconhecido em cada frame
         """
-        if(self.__is_mouse_gesture(hand_landmarks)):
-            if(self.__is_mouse_left_down(hand_landmarks)):
-                return self.MOUSE_LEFT_DOWN
-            elif(self.__is_mouse_right_down(hand_landmarks)):
-                return self.MOUSE_RIGHT_DOWN
-            else:
-                return self.MOUSE_BUTTONS_UP
-        elif(self.__is_scroll_up(hand_landmarks)):
-            return self.SCROLL_UP
-        elif(self.__is_scroll_down(hand_landmarks)):
-            return self.SCROLL_DOWN
-        return self.NO_GESTURE
\ No newline at end of file
+        return self.classifier.evaluate(np.asarray(landmarks, dtype=np.float32))
@@ -0,0 +1,134 @@
+import time
+from gesture_actions import GestureActions
+
+class HandTrack:
+    """
+    Estado de uma mão rastreada: o seu próprio reconhecedor (e, portanto, a sua própria suavização do cursor)
+    e o último resultado reconhecido.
+    """
+
+    __slots__ = ('key', 'recognizer', 'wrist', 'first_seen', 'last_seen', 'gesture', 'coordinates')
+
+    def __init__(self, key, recognizer, wrist, timestamp):
+        self.key = key                  # (câmera, lateralidade, id de rastreamento)
+        self.recognizer = recognizer
+        self.wrist = wrist              # Posição (x, y) do pulso no último frame em que a mão apareceu
+        self.first_seen = timestamp
+        self.last_seen = timestamp
+        self.gesture = None
+        self.coordinates = None
+
+class HandArbiter:
+    """
+    Classe responsável por juntar as mãos detectadas por uma ou mais câmeras e decidir qual delas controla o mouse.
+
+    Em cada câmera, as mãos de um frame são associadas às mãos do frame anterior com a mesma lateralidade
+    pela menor distância entre os pulsos. Cada mão rastreada, identificada por (câmera, lateralidade, id),
+    tem o seu próprio reconhecedor, criado com GestureRecognizer.clone(). O mouse é controlado por uma
+    única mão por vez: a que apareceu primeiro continua no controle até ficar lost_timeout segundos sem
+    aparecer, quando os botões são liberados e a mão mais antiga entre as restantes assume.
+    """
+
+    def __init__(self, gesture_recognizer, mouse_controller, max_match_distance=0.15, lost_timeout=0.5, cursor_output=None):
+        """
+        Inicializa o árbitro.
+
+        Args:
+            gesture_recognizer: Instância de GestureRecognizer usada como modelo para os reconhecedores de cada mão
+            mouse_controller: Instância de MouseController controlada pela mão ativa
+            max_match_distance (float): Maior distância, em coordenadas normalizadas, entre os pulsos de dois
+                frames para que sejam considerados a mesma mão
+            lost_timeout (float): Tempo, em segundos, sem aparecer após o qual uma mão deixa de ser rastreada
+            cursor_output: Instância opcional de CursorOutput, que move o cursor na sua própria taxa
+        """
+        self.gesture_recognizer = gesture_recognizer
+        self.mouse_controller = mouse_controller
+        self.cursor_output = cursor_output
+        self.gesture_actions = GestureActions(mouse_controller, cursor_output)
+        self.max_match_distance = max_match_distance
+        self.lost_timeout = lost_timeout
+        self.tracks = {}
+        self.active_key = None
+        self.next_track_id = 0
+
+    def process(self, camera_id, timestamp, handedness, landmarks):
+        """
+        Processa as mãos detectadas num frame de uma câmera e, se a mão ativa estiver entre elas, executa o seu gesto.
+
+        Args:
+            camera_id: Identificador da câmera
+            timestamp (float): Instante de captura do frame, em time.perf_counter()
+            handedness (list): Lateralidade ('Left' ou 'Right') de cada mão detectada
+            landmarks (np.ndarray): Array (N, 21, 3) com os landmarks de cada mão detectada
+
+        Returns:
+            list: HandTrack de cada mão detectada no frame, na mesma ordem
+        """
+        gestures = self.gesture_recognizer.recognize_batch(landmarks) if len(handedness) else ()
+        tracks = self.__match(camera_id, timestamp, handedness, landmarks)
+
+        for track, hand_landmarks, gesture in zip(tracks, landmarks, gestures):
+            track.gesture = int(gesture)
+            track.coordinates = track.recognizer.get_pointer_coordinates_array(hand_landmarks, timestamp)
+
+        self.__expire(timestamp)
+        if self.active_key is None and self.tracks:
+            self.active_key = min(self.tracks.values(), key=lambda track: track.first_seen).key
+
+        for track in tracks:
+            if track.key == self.active_key:
+                self.gesture_actions.run(track.gesture, track.coordinates, timestamp)
+                track.recognizer.observe_latency(time.perf_counter() - timestamp)
+        return tracks
+
+    def __match(self, camera_id, timestamp, handedness, landmarks):
+        """
+        Associa cada mão detectada a uma mão rastreada da mesma câmera e lateralidade, ou cria um novo rastreamento.
+        As associações são feitas de forma gulosa, da menor para a maior distância entre os pulsos.
+
+        Returns:
+            list: HandTrack de cada mão detectada, na mesma ordem
+        """
+        wrists = [(float(hand[0, 0]), float(hand[0, 1])) for hand in landmarks]
+        candidates = [track for track in self.tracks.values() if track.key[0] == camera_id]
+
+        pairs = []
+        for hand_index, (label, wrist) in enumerate(zip(handedness, wrists)):
+            for track in candidates:
+                if track.key[1] != label:
+                    continue
+                distance = ((wrist[0] - track.wrist[0]) ** 2 + (wrist[1] - track.wrist[1]) ** 2) ** 0.5
+                if distance < self.max_match_distance:
+                    pairs.append((distance, hand_index, track))
+        pairs.sort(key=lambda pair: pair[0])
+
+        matched = [None] * len(wrists)
+        used_keys = set()
+        for _, hand_index, track in pairs:
+            if matched[hand_index] is None and track.key not in used_keys:
+                matched[hand_index] = track
+                used_keys.add(track.key)
+
+        for hand_index, track in enumerate(matched):
+            if track is None:
+                key = (camera_id, handedness[hand_index], self.next_track_id)
+                self.next_track_id += 1
+                track = HandTrack(key, self.gesture_recognizer.clone(), wrists[hand_index], timestamp)
+                self.tracks[key] = track
+                matched[hand_index] = track
+            track.wrist = wrists[hand_index]
+            track.last_seen = timestamp
+        return matched
+
+    def __expire(self, timestamp):
+        """
+        Remove as mãos que não aparecem há mais de lost_timeout segundos.
+        Se a mão ativa for removida, libera os botões do mouse e descarta as suas posições no CursorOutput.
+        """
+        for key in [key for key, track in self.tracks.items() if timestamp - track.last_seen > self.lost_timeout]:
+            del self.tracks[key]
+            if key == self.active_key:
+                self.active_key = None
+                self.mouse_controller.buttons_up()
+                if self.cursor_output is not None:
+                    self.cursor_output.reset()
@@ -1,6 +1,13 @@
+import queue
+import threading
+import time
 import cv2
-import mediapipe as mp
-from gesture_recognizer import GestureRecognizer
+import numpy as np
+from gesture_actions import GestureActions
+from frame_sources import WebcamSource
+from gesture_recognizer import landmarks_to_array
+from pipeline import LatestFrameSlot
+from roi_cropper import RoiCropper
 
 class HandTracker:
     """
@@ -8,26 +15,127 @@ class HandTracker:
     Utiliza o MediaPipe para detectar os pontos de referência da mão e o GestureRecognizer para interpretar os gestos.
     """
 
-    def __init__(self, gesture_recognizer, mouse_controller):
+    def __init__(self, gesture_recognizer, mouse_controller, output_queue_size=2, recorder=None,
+                 roi_size=None, roi_padding=0.6, camera_width=None, camera_height=None, camera_fps=None, camera_fourcc=None,
+                 inference_scheduler=None, metrics=None, frame_source=None, reuse_buffers=False, landmark_bus=None,
+                 start_time=None, quality_governor=None, cursor_output=None):
         """
         Inicializa o rastreador de mão.
 
         Args:
             gesture_recognizer: Instância de GestureRecognizer para reconhecimento dos gestos
             mouse_controller: Instância de MouseController para controle do mouse
+            output_queue_size (int): Tamanho máximo da fila entre os estágios de inferência e de saída no modo em pipeline
+            recorder: Instância opcional de LandmarkRecorder que grava os landmarks de cada frame processado
+            roi_size (int): Se informado, a inferência roda apenas num recorte ao redor da mão do frame anterior,
+                reduzido para no máximo roi_size pixels de lado. O frame inteiro é usado quando a mão é perdida
+            roi_padding (float): Margem do recorte em cada lado, em proporção ao tamanho da mão
+            camera_width (int): Largura de captura solicitada à webcam padrão
+            camera_height (int): Altura de captura solicitada à webcam padrão
+            camera_fps (int): Taxa de captura solicitada à webcam padrão
+            camera_fourcc (str): Codec de captura solicitado à webcam padrão, por exemplo 'MJPG'
+            inference_scheduler: Instância opcional de InferenceScheduler. Nos frames em que ela dispensa a inferência,
+                o último gesto é repetido com a posição do cursor prevista
+            metrics: Instância opcional de Metrics que mede o tempo de cada estágio do processamento
+            frame_source: Fonte dos frames (ver frame_sources). Se None, usa a webcam 0 com as configurações camera_*
+            reuse_buffers (bool): Se True, reaproveita buffers pré-alocados para os frames, as conversões de cor,
+                a janela de debug e os landmarks, em vez de alocar novos arrays a cada frame
+            landmark_bus: Instância opcional de LandmarkBus onde o resultado de cada frame é publicado para
+                outros processos, como a janela de debug (ver debug_viewer)
+            start_time (float): Instante, em time.perf_counter(), em que o programa foi iniciado. Se informado,
+                o tempo até o rastreamento estar pronto e até o primeiro movimento do cursor são mostrados no terminal
+            quality_governor: Instância opcional de QualityGovernor. Se informada, o modelo, a resolução entregue ao
+                MediaPipe e os limiares de confiança seguem o nível escolhido por ela em vez da configuração fixa
+            cursor_output: Instância opcional de CursorOutput, que move o cursor na sua própria taxa a partir
+                das posições de cada frame
+
+        O MediaPipe é importado e o modelo é construído e aquecido numa thread, enquanto a câmera é aberta na thread atual.
+        run() espera os dois estarem prontos antes de ler o primeiro frame.
         """
-        self.mp_hands = mp.solutions.hands
-        self.mp_drawing = mp.solutions.drawing_utils
-        self.mp_drawing_styles = mp.solutions.drawing_styles
-        self.hands = self.mp_hands.Hands(
-            model_complexity=0,
-            max_num_hands=1,
-            min_detection_confidence=0.8,
-            min_tracking_confidence=0.8
-        )
-        self.cap = cv2.VideoCapture(0)
+        self.start_time = start_time if start_time is not None else time.perf_counter()
+        self.is_reporting_startup = start_time is not None
+        self.ready_time = None       # Segundos desde start_time até o modelo e a câmera estarem prontos
+        self.first_move_time = None  # Segundos desde start_time até o primeiro movimento do cursor
+        self.hands = None
+        self.hands_error = None
+        self.quality_governor = quality_governor
+        if quality_governor is not None:
+            self.hands_settings = quality_governor.level.hands_settings()
+        else:
+            self.hands_settings = {
+                'model_complexity': 0,
+                'max_num_hands': 1,
+                'min_detection_confidence': 0.8,
+                'min_tracking_confidence': 0.8,
+            }
+        self.warmup_shape = (camera_height or 480, camera_width or 640, 3)
+        self.hands_thread = threading.Thread(target=self.__build_hands, daemon=True)
+        self.hands_thread.start()
+
+        if frame_source is None:
+            frame_source = WebcamSource(0, camera_width, camera_height, camera_fps, camera_fourcc)
+        self.frame_source = frame_source
+        self.roi_cropper = RoiCropper(roi_size, roi_padding) if roi_size else None
+        self.last_landmarks = None  # Landmarks do último frame com mão detectada, usados para posicionar o recorte
+        self.inference_scheduler = inference_scheduler
+        self.last_hand_landmarks = None  # Resultado da última inferência, reaproveitado nos frames sem inferência
+        self.metrics = metrics
         self.gesture_recognizer = gesture_recognizer
         self.mouse_controller = mouse_controller
+        self.gesture_actions = GestureActions(mouse_controller, cursor_output)
+        self.output_queue_size = output_queue_size
+        self.recorder = recorder
+        self.reuse_buffers = reuse_buffers
+        self.buffers = {}
+        self.landmark_buffers = (np.empty((21, 3), dtype=np.float32), np.empty((21, 3), dtype=np.float32))
+        self.landmark_buffer_index = 0
+        self.landmark_bus = landmark_bus
+
+    def __build_hands(self):
+        """
+        Importa o MediaPipe e constrói o Hands. Executado numa thread própria.
+        """
+        try:
+            import mediapipe as mp
+
+            self.mp_hands = mp.solutions.hands
+            self.mp_drawing = mp.solutions.drawing_utils
+            self.mp_drawing_styles = mp.solutions.drawing_styles
+            self.landmarks_style = self.mp_drawing_styles.get_default_hand_landmarks_style()
+            self.connections_style = self.mp_drawing_styles.get_default_hand_connections_style()
+            self.hands = self.__create_hands(self.hands_settings)
+            if self.quality_governor is not None:
+                self.quality_governor.start(lambda level: self.__create_hands(level.hands_settings()))
+        except Exception as error:
+            self.hands_error = error
+
+    def __create_hands(self, hands_settings):
+        """
+        Constrói um Hands e roda uma inferência num frame vazio, para que o custo de inicialização
+        do grafo não caia sobre o primeiro frame real.
+
+        Args:
+            hands_settings (dict): Parâmetros do Hands
+
+        Returns:
+            Hands construído e aquecido
+        """
+        hands = self.mp_hands.Hands(**hands_settings)
+        hands.process(np.zeros(self.warmup_shape, dtype=np.uint8))
+        return hands
+
+    def wait_until_ready(self):
+        """
+        Espera a construção do modelo terminar, repassando qualquer erro ocorrido na thread.
+        Chamado por run(); pode ser chamado antes para separar o tempo de inicialização do tempo de rastreamento.
+        """
+        self.hands_thread.join()
+        if self.hands_error is not None:
+            raise self.hands_error
+        if self.ready_time is None:
+            self.ready_time = time.perf_counter() - self.start_time
+            if self.is_reporting_startup:
+                print(f"Ready in {self.ready_time:.2f} s")
 
     def __show_debug_annotations(self, image, hand_landmarks):
         """
@@ -42,73 +150,393 @@ class HandTracker:
             image,
             hand_landmarks,
             self.mp_hands.HAND_CONNECTIONS,
-            self.mp_drawing_styles.get_default_hand_landmarks_style(),
-            self.mp_drawing_styles.get_default_hand_connections_style())
-    
-    def __run_on_gesture(self, gesture, coordinates):
+            self.landmarks_style,
+            self.connections_style)
+
+    def __buffer(self, name, shape):
         """
-        Executa a ação correspondente ao gesto detectado.
-        Inverte a coordenada X para corresponder ao movimento natural da mão (espelhado).
+        Retorna o buffer pré-alocado com o nome informado, criando-o novamente se o formato mudou.
+        Com reuse_buffers desabilitado, retorna None, o que faz o OpenCV alocar um novo array.
 
         Args:
-            gesture: Constante que identifica o gesto reconhecido
-            coordinates: Dicionário com as coordenadas x,y normalizadas do cursor
+            name (str): Nome do buffer
+            shape (tuple): Formato necessário
+
+        Returns:
+            np.ndarray: Buffer uint8 com o formato pedido, ou None
         """
-        inverse_coordinate_x = abs(1 - coordinates['x'])
-        
-        if gesture == GestureRecognizer.MOUSE_BUTTONS_UP:
-            self.mouse_controller.move_cursor(inverse_coordinate_x, coordinates['y'])
-            self.mouse_controller.buttons_up()
-            print("mouse up")
-        elif gesture == GestureRecognizer.MOUSE_LEFT_DOWN:
-            self.mouse_controller.move_cursor(inverse_coordinate_x, coordinates['y'])
-            self.mouse_controller.left_button_down()
-            print("left down")
-        elif gesture == GestureRecognizer.MOUSE_RIGHT_DOWN:
-            self.mouse_controller.move_cursor(inverse_coordinate_x, coordinates['y'])
-            self.mouse_controller.right_button_down()
-            print("right down")
-        elif gesture == GestureRecognizer.SCROLL_UP:
-            self.mouse_controller.scroll_up(1)
-            print("scroll up")
-        elif gesture == GestureRecognizer.SCROLL_DOWN:
-            self.mouse_controller.scroll_down(1)
-            print("scroll down")
-
-    def run(self, is_debug=False):
+        if not self.reuse_buffers:
+            return None
+        buffer = self.buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+            self.buffers[name] = buffer
+        return buffer
+
+    def __next_landmark_buffer(self):
+        """
+        Alterna entre dois buffers de landmarks, já que os landmarks do frame anterior continuam
+        sendo usados (recorte e escalonador) enquanto os do frame atual são preenchidos.
+
+        Returns:
+            np.ndarray: Buffer (21, 3) a ser preenchido, ou None com reuse_buffers desabilitado
+        """
+        if not self.reuse_buffers:
+            return None
+        self.landmark_buffer_index = 1 - self.landmark_buffer_index
+        return self.landmark_buffers[self.landmark_buffer_index]
+
+    def run(self, is_debug=False, is_pipelined=False):
         """
         Inicia o loop principal de rastreamento da mão.
         Captura frames da webcam, processa-os para detectar a mão e executa as ações correspondentes.
         
         Args:
             is_debug (bool): Se True, mostra uma janela com visualização da detecção da mão
+            is_pipelined (bool): Se True, executa captura, inferência e saída em estágios paralelos
         """
-        while self.cap.isOpened():
+        self.wait_until_ready()
+
+        if is_pipelined:
+            self.__run_pipelined(is_debug)
+            return
+
+        frame_buffer = None
+        while self.frame_source.is_opened():
           
-            success, image = self.cap.read()
+            image, capture_time = self.__read_frame(frame_buffer)
 
-            if not success:
-                print("No camera frame")
+            if image is None:
                 continue
+
+            if self.reuse_buffers:
+                frame_buffer = image
           
-            image.flags.writeable = False
-            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(image)
-
-            if results.multi_hand_landmarks:
-                hand_landmarks = results.multi_hand_landmarks
-                gesture = self.gesture_recognizer.recognize(hand_landmarks)
-                coordinates = self.gesture_recognizer.get_pointer_coordinates(hand_landmarks)
-                self.__run_on_gesture(gesture, coordinates)
-
-                if is_debug:
-                    image.flags.writeable = True
-                    self.__show_debug_annotations(image, hand_landmarks)
-
-            if is_debug:
-               image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-               cv2.imshow("Handy Input Debugger", cv2.flip(image, 1))
-               if cv2.waitKey(1) & 0xFF == 27:
-                    break
+            image, hand_landmarks, gesture, coordinates = self.__process_frame(image, capture_time)
+
+            if hand_landmarks:
+                self.__dispatch(gesture, coordinates, capture_time)
+
+            if self.metrics is not None:
+                self.metrics.mark('latency', capture_time)
+
+            if self.landmark_bus is not None and not self.__publish(image, capture_time, hand_landmarks, gesture):
+                break
+
+            if is_debug and not self.__show_debug_window(image, hand_landmarks):
+                break
             
-        self.cap.release()
+        self.frame_source.release()
+
+    def __read_frame(self, frame_buffer=None):
+        """
+        Lê um frame da fonte de frames.
+
+        Args:
+            frame_buffer: Array onde o frame deve ser lido, se a fonte suportar. Se None, a fonte aloca um novo frame
+
+        Returns:
+            tuple: O frame BGR lido (None se a leitura falhou) e o instante em que a leitura terminou
+        """
+        start_time = time.perf_counter()
+        if frame_buffer is None:
+            success, image = self.frame_source.read()
+        else:
+            success, image = self.frame_source.read(frame_buffer)
+
+        if not success:
+            print("No camera frame")
+            if self.metrics is not None:
+                self.metrics.drop()
+            return None, None
+
+        if self.metrics is not None:
+            return image, self.metrics.mark('capture', start_time)
+        return image, time.perf_counter()
+
+    def __publish(self, image, capture_time, hand_landmarks, gesture):
+        """
+        Publica o resultado do frame no barramento de landmarks.
+
+        Args:
+            image: Frame BGR processado
+            capture_time (float): Instante em que o frame foi lido
+            hand_landmarks: Lista de pontos de referência da mão detectados, ou None
+            gesture: Constante que identifica o gesto reconhecido, ou None
+
+        Returns:
+            bool: False se algum leitor do barramento pediu o encerramento do rastreamento, True caso contrário
+        """
+        landmarks = self.last_landmarks if hand_landmarks else None
+        self.landmark_bus.publish(capture_time, gesture if hand_landmarks else None, landmarks, image)
+        return not self.landmark_bus.is_stop_requested()
+
+    def __dispatch(self, gesture, coordinates, capture_time):
+        """
+        Executa no mouse a ação correspondente ao gesto.
+
+        Args:
+            gesture: Constante que identifica o gesto reconhecido
+            coordinates: PointerCoordinates com as coordenadas x,y normalizadas do cursor
+            capture_time (float): Instante em que o frame foi lido
+        """
+        start_time = time.perf_counter()
+        self.gesture_actions.run(gesture, coordinates, capture_time)
+        # Latência até o mouse, usada pelo filtro do cursor para prever a posição à frente
+        self.gesture_recognizer.observe_latency(time.perf_counter() - capture_time)
+        if self.metrics is not None:
+            self.metrics.mark('dispatch', start_time)
+
+        if self.first_move_time is None and self.mouse_controller.last_position is not None:
+            self.first_move_time = time.perf_counter() - self.start_time
+            if self.is_reporting_startup:
+                print(f"Time to first cursor move: {self.first_move_time:.2f} s")
+
+    def __process_frame(self, image, capture_time):
+        """
+        Converte o frame para RGB, detecta a mão e reconhece o gesto.
+        Com o recorte habilitado, apenas a região ao redor da mão do frame anterior é convertida e processada.
+
+        Args:
+            image: Frame BGR capturado da webcam
+            capture_time (float): Instante em que o frame foi lido, usado pelo filtro do cursor
+
+        Returns:
+            tuple: Frame BGR, landmarks detectados (ou None), gesto reconhecido e coordenadas do cursor
+        """
+        metrics = self.metrics
+        now = time.perf_counter()
+        if metrics is not None:
+            metrics.frame(now)
+
+        if self.inference_scheduler is not None and not self.inference_scheduler.should_infer(now):
+            return image, self.last_hand_landmarks, self.inference_scheduler.last_gesture, self.inference_scheduler.predict_coordinates(now)
+
+        max_side = None
+        if self.quality_governor is not None:
+            self.__swap_quality_hands()
+            max_side = self.quality_governor.level.max_side
+
+        box = None
+        source = image
+        if self.roi_cropper is not None:
+            source, box = self.roi_cropper.crop(image, self.last_landmarks)
+        if max_side is not None and max(source.shape[:2]) > max_side:
+            # Os landmarks são normalizados, então reduzir a imagem não muda as coordenadas
+            scale = max_side / max(source.shape[:2])
+            size = (max(1, round(source.shape[1] * scale)), max(1, round(source.shape[0] * scale)))
+            source = cv2.resize(source, size, dst=self.__buffer('quality', (size[1], size[0], 3)), interpolation=cv2.INTER_AREA)
+        rgb_image = cv2.cvtColor(source, cv2.COLOR_BGR2RGB, dst=self.__buffer('rgb', source.shape))
+        stage_time = metrics.mark('color', now) if metrics is not None else None
+
+        results = self.hands.process(rgb_image)
+        if metrics is not None:
+            stage_time = metrics.mark('process', stage_time)
+        if self.quality_governor is not None:
+            self.quality_governor.update(now, time.perf_counter() - now)
+
+        if not results.multi_hand_landmarks:
+            self.last_landmarks = None
+            self.last_hand_landmarks = None
+            if self.inference_scheduler is not None:
+                self.inference_scheduler.update(now, None, None, None)
+            if self.recorder is not None:
+                self.recorder.record(None, None, None, timestamp=capture_time)
+            return image, None, None, None
+
+        hand_landmarks = results.multi_hand_landmarks
+        if box is not None:
+            self.roi_cropper.to_frame_coordinates(hand_landmarks, box, image.shape)
+        landmarks = landmarks_to_array(hand_landmarks[0], self.__next_landmark_buffer())
+        self.last_landmarks = landmarks
+        self.last_hand_landmarks = hand_landmarks
+        gesture = self.gesture_recognizer.recognize_array(landmarks)
+        coordinates = self.gesture_recognizer.get_pointer_coordinates_array(landmarks, capture_time)
+
+        if metrics is not None:
+            metrics.mark('recognize', stage_time)
+
+        if self.inference_scheduler is not None:
+            self.inference_scheduler.update(now, landmarks, gesture, coordinates)
+
+        if self.recorder is not None:
+            handedness = results.multi_handedness[0].classification[0].label
+            self.recorder.record(landmarks, handedness, gesture, timestamp=capture_time)
+
+        return image, hand_landmarks, gesture, coordinates
+
+    def __swap_quality_hands(self):
+        """
+        Passa a usar o Hands do novo nível de qualidade, se o QualityGovernor já terminou de construí-lo.
+        Chamado entre frames, na mesma thread que roda a inferência.
+        """
+        hands = self.quality_governor.take_ready_hands()
+        if hands is not None:
+            previous_hands = self.hands
+            self.hands = hands
+            self.last_landmarks = None
+            previous_hands.close()
+
+    def __show_debug_window(self, image, hand_landmarks):
+        """
+        Mostra o frame na janela de debug, com as anotações da mão quando houver.
+
+        Args:
+            image: Frame BGR processado
+            hand_landmarks: Lista de pontos de referência da mão detectados, ou None
+
+        Returns:
+            bool: False se o usuário pediu para encerrar (tecla ESC), True caso contrário
+        """
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=self.__buffer('debug_rgb', image.shape))
+        if hand_landmarks:
+            self.__show_debug_annotations(image, hand_landmarks)
+
+        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR, dst=self.__buffer('debug_bgr', image.shape))
+        cv2.imshow("Handy Input Debugger", cv2.flip(image, 1, dst=self.__buffer('debug_flip', image.shape)))
+        return cv2.waitKey(1) & 0xFF != 27
+
+    def __run_pipelined(self, is_debug):
+        """
+        Executa o rastreamento em três estágios: uma thread de captura, uma thread de inferência
+        e o estágio de saída (ações do mouse e janela de debug) na thread principal.
+        A captura escreve num LatestFrameSlot, então frames que a inferência não conseguiu
+        consumir a tempo são descartados em vez de enfileirados. Entre inferência e saída há uma
+        fila limitada, para que chamadas lentas ao mouse não atrasem a leitura da câmera.
+        Um erro na captura ou na inferência encerra o pipeline e é relançado aqui, como no modo sequencial.
+
+        Args:
+            is_debug (bool): Se True, mostra uma janela com visualização da detecção da mão
+        """
+        frame_slot = LatestFrameSlot()
+        output_queue = queue.Queue(maxsize=self.output_queue_size)
+        stop_event = threading.Event()
+        stage_errors = []
+
+        capture_thread = threading.Thread(target=self.__capture_stage, args=(frame_slot, stop_event, stage_errors), daemon=True)
+        inference_thread = threading.Thread(
+            target=self.__inference_stage, args=(frame_slot, output_queue, stop_event, is_debug, stage_errors), daemon=True
+        )
+        capture_thread.start()
+        inference_thread.start()
+
+        try:
+            self.__output_stage(output_queue, inference_thread, is_debug)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop_event.set()
+            frame_slot.close()
+            capture_thread.join()
+            inference_thread.join()
+            self.frame_source.release()
+
+        if stage_errors:
+            raise stage_errors[0]
+
+    def __capture_stage(self, frame_slot, stop_event, stage_errors):
+        """
+        Estágio de captura: lê frames da webcam continuamente e os publica no slot.
+        Ao terminar, inclusive por um erro, fecha o slot para que a inferência também termine.
+
+        Args:
+            frame_slot: LatestFrameSlot compartilhado com o estágio de inferência
+            stop_event: Evento que sinaliza o encerramento do pipeline
+            stage_errors (list): Lista onde o erro que encerrou o estágio é guardado, para ser relançado por __run_pipelined
+        """
+        try:
+            while not stop_event.is_set() and self.frame_source.is_opened():
+                image, capture_time = self.__read_frame()
+
+                if image is None:
+                    continue
+
+                if frame_slot.put((image, capture_time)) and self.metrics is not None:
+                    self.metrics.drop()
+        except Exception as error:
+            stage_errors.append(error)
+        finally:
+            frame_slot.close()
+
+    def __inference_stage(self, frame_slot, output_queue, stop_event, is_debug, stage_errors):
+        """
+        Estágio de inferência: processa sempre o frame mais recente e envia o resultado ao estágio de saída.
+        Ao terminar, inclusive por um erro, envia None para a fila para sinalizar o fim do pipeline.
+
+        Args:
+            frame_slot: LatestFrameSlot alimentado pelo estágio de captura
+            output_queue: Fila limitada consumida pelo estágio de saída
+            stop_event: Evento que sinaliza o encerramento do pipeline
+            is_debug (bool): Se True, envia também os frames sem mão detectada, para a janela de debug
+            stage_errors (list): Lista onde o erro que encerrou o estágio é guardado, para ser relançado por __run_pipelined
+        """
+        try:
+            while not stop_event.is_set():
+                item = frame_slot.get(timeout=0.1)
+                if item is None:
+                    if frame_slot.is_closed:
+                        break
+                    continue
+
+                image, capture_time = item
+                image, hand_landmarks, gesture, coordinates = self.__process_frame(image, capture_time)
+
+                if self.landmark_bus is not None and not self.__publish(image, capture_time, hand_landmarks, gesture):
+                    break
+
+                if hand_landmarks or is_debug:
+                    self.__put_until_stopped(output_queue, (image, capture_time, hand_landmarks, gesture, coordinates), stop_event)
+                elif self.metrics is not None:
+                    self.metrics.mark('latency', capture_time)
+        except Exception as error:
+            stage_errors.append(error)
+        finally:
+            # Sinaliza o fim mesmo se a inferência falhar, para que o estágio de saída não fique esperando
+            self.__put_until_stopped(output_queue, None, stop_event)
+
+    def __put_until_stopped(self, output_queue, item, stop_event):
+        """
+        Coloca um item na fila de saída, desistindo caso o pipeline seja encerrado enquanto a fila está cheia.
+
+        Args:
+            output_queue: Fila limitada consumida pelo estágio de saída
+            item: Item a ser enfileirado
+            stop_event: Evento que sinaliza o encerramento do pipeline
+        """
+        while not stop_event.is_set():
+            try:
+                output_queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def __output_stage(self, output_queue, inference_thread, is_debug):
+        """
+        Estágio de saída: executa as ações do mouse na mesma ordem em que os frames foram processados.
+        Termina ao receber None ou se a thread de inferência morrer sem enviá-lo.
+
+        Args:
+            output_queue: Fila alimentada pelo estágio de inferência
+            inference_thread: Thread do estágio de inferência
+            is_debug (bool): Se True, mostra uma janela com visualização da detecção da mão
+        """
+        while True:
+            try:
+                item = output_queue.get(timeout=0.1)
+            except queue.Empty:
+                if inference_thread.is_alive():
+                    continue
+                break
+            if item is None:
+                break
+
+            image, capture_time, hand_landmarks, gesture, coordinates = item
+
+            if hand_landmarks:
+                self.__dispatch(gesture, coordinates, capture_time)
+
+            if self.metrics is not None:
+                self.metrics.mark('latency', capture_time)
+
+            if is_debug and not self.__show_debug_window(image, hand_landmarks):
+                break
@@ -0,0 +1,112 @@
+import numpy as np
+from gesture_recognizer import PointerCoordinates
+
+class InferenceScheduler:
+    """
+    Classe responsável por decidir em quais frames a inferência do MediaPipe deve rodar.
+
+    Enquanto os landmarks estão parados e o gesto não muda, o intervalo entre inferências cresce
+    gradualmente até o limite dado pela taxa mínima. Qualquer movimento acima do limiar, troca de
+    gesto ou frame sem mão volta imediatamente para a taxa máxima. Nos frames sem inferência, a posição
+    do cursor é prevista extrapolando a velocidade observada entre as duas últimas inferências.
+    """
+
+    def __init__(self, min_rate=5, max_rate=30, motion_threshold=0.05, backoff=1.5):
+        """
+        Inicializa o escalonador.
+
+        Args:
+            min_rate (float): Menor taxa de inferência, em inferências por segundo, usada com a mão parada
+            max_rate (float): Maior taxa de inferência, usada enquanto há movimento ou troca de gesto
+            motion_threshold (float): Velocidade média dos landmarks, em unidades normalizadas por segundo,
+                acima da qual a mão é considerada em movimento
+            backoff (float): Fator de crescimento do intervalo a cada inferência estável
+        """
+        self.fast_interval = 1 / max_rate
+        self.slow_interval = 1 / min_rate
+        self.motion_threshold = motion_threshold
+        self.backoff = backoff
+
+        self.interval = self.fast_interval
+        self.next_inference_time = 0
+        self.last_inference_time = None
+        self.last_landmarks = None
+        self.last_gesture = None
+        self.last_coordinates = None
+        self.velocity = (0.0, 0.0)
+
+        self.inferred_frames = 0  # Frames em que a inferência rodou
+        self.skipped_frames = 0   # Frames em que a inferência foi pulada
+
+    def should_infer(self, now):
+        """
+        Indica se a inferência deve rodar no frame atual.
+
+        Args:
+            now (float): Instante do frame, em segundos
+
+        Returns:
+            bool: True se a inferência deve rodar, False se o frame deve usar a previsão
+        """
+        # Tolerância de meio intervalo rápido: o instante de cada frame oscila em torno do período da câmera,
+        # e sem ela um frame que chega um pouco antes do previsto seria pulado mesmo na taxa máxima
+        if now >= self.next_inference_time - self.fast_interval / 2:
+            return True
+        self.skipped_frames += 1
+        return False
+
+    def update(self, now, landmarks, gesture, coordinates):
+        """
+        Registra o resultado de uma inferência e agenda a próxima.
+
+        Args:
+            now (float): Instante do frame, em segundos
+            landmarks (np.ndarray): Array (21, 3) com os landmarks detectados, ou None se nenhuma mão foi detectada
+            gesture (int): Gesto reconhecido, ou None
+            coordinates (PointerCoordinates): Coordenadas do cursor calculadas no frame, ou None
+        """
+        self.inferred_frames += 1
+        elapsed = now - self.last_inference_time if self.last_inference_time is not None else None
+
+        # Sem mão, a inferência continua na taxa máxima, para que uma mão entrando em cena seja detectada logo
+        is_stable = landmarks is not None and self.last_landmarks is not None and gesture == self.last_gesture and elapsed
+        if is_stable:
+            speed = np.abs(landmarks[:, :2] - self.last_landmarks[:, :2]).mean() / elapsed
+            is_stable = speed < self.motion_threshold
+
+        if is_stable:
+            self.interval = min(self.interval * self.backoff, self.slow_interval)
+        else:
+            self.interval = self.fast_interval
+
+        if coordinates is not None and self.last_coordinates is not None and elapsed:
+            self.velocity = (
+                (coordinates.x - self.last_coordinates.x) / elapsed,
+                (coordinates.y - self.last_coordinates.y) / elapsed,
+            )
+        else:
+            self.velocity = (0.0, 0.0)
+
+        self.next_inference_time = now + self.interval
+        self.last_inference_time = now
+        self.last_landmarks = landmarks
+        self.last_gesture = gesture
+        self.last_coordinates = coordinates
+
+    def predict_coordinates(self, now):
+        """
+        Prevê a posição do cursor num frame sem inferência, a partir da última posição e velocidade conhecidas.
+
+        Args:
+            now (float): Instante do frame, em segundos
+
+        Returns:
+            PointerCoordinates: Coordenadas x e y previstas, ou None se a última inferência não detectou a mão
+        """
+        if self.last_coordinates is None:
+            return None
+        horizon = min(now - self.last_inference_time, self.interval)
+        return PointerCoordinates(
+            self.last_coordinates.x + self.velocity[0] * horizon,
+            self.last_coordinates.y + self.velocity[1] * horizon,
+        )
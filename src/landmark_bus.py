@@ -0,0 +1,265 @@
+import time
+from multiprocessing import resource_tracker, shared_memory
+import cv2
+import numpy as np
+
+HEADER_SIZE = 8
+SLOT_COUNT_INDEX = 0
+FRAME_HEIGHT_INDEX = 1
+FRAME_WIDTH_INDEX = 2
+WRITE_COUNT_INDEX = 3
+STOP_REQUESTED_INDEX = 4
+CLOSED_INDEX = 5
+
+NO_HAND = -1  # Código de gesto publicado nos frames sem mão detectada
+
+def _align(offset, alignment=64):
+    return (offset + alignment - 1) // alignment * alignment
+
+def _create_views(buffer, slot_count, frame_height, frame_width):
+    """
+    Cria os arrays do barramento sobre o buffer da memória compartilhada.
+
+    Layout: cabeçalho (int64), números de sequência (uint64), instantes de captura e publicação (float64),
+    gestos (int32), landmarks (float32, 21 x 3) e, se houver, frames BGR reduzidos (uint8), um de cada por slot.
+
+    Args:
+        buffer: Buffer da memória compartilhada, ou None para calcular apenas o tamanho necessário
+        slot_count (int): Número de slots do anel
+        frame_height (int): Altura dos frames publicados, 0 se o barramento não publica frames
+        frame_width (int): Largura dos frames publicados, 0 se o barramento não publica frames
+
+    Returns:
+        tuple: Dicionário com os arrays (vazio se buffer for None) e o tamanho total em bytes
+    """
+    fields = (
+        ('header', np.int64, (HEADER_SIZE,)),
+        ('sequences', np.uint64, (slot_count,)),
+        ('times', np.float64, (slot_count, 2)),
+        ('gestures', np.int32, (slot_count,)),
+        ('landmarks', np.float32, (slot_count, 21, 3)),
+        ('frames', np.uint8, (slot_count, frame_height, frame_width, 3)),
+    )
+    views = {}
+    offset = 0
+    for name, dtype, shape in fields:
+        offset = _align(offset)
+        if buffer is not None:
+            views[name] = np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+        offset += int(np.prod(shape)) * np.dtype(dtype).itemsize
+    return views, offset
+
+class LandmarkMessage:
+    """
+    Resultado de um frame lido do barramento.
+    """
+
+    __slots__ = ('sequence', 'capture_time', 'publish_time', 'gesture', 'landmarks', 'frame')
+
+    def __init__(self, sequence, capture_time, publish_time, gesture, landmarks, frame):
+        self.sequence = sequence
+        self.capture_time = capture_time    # Instante em que o frame foi lido, em time.perf_counter()
+        self.publish_time = publish_time    # Instante em que o resultado foi publicado
+        self.gesture = gesture              # Gesto reconhecido, ou NO_HAND
+        self.landmarks = landmarks          # Array (21, 3), ou None se nenhuma mão foi detectada
+        self.frame = frame                  # Frame BGR reduzido, ou None se o barramento não publica frames
+
+class LandmarkBus:
+    """
+    Barramento em memória compartilhada onde o HandTracker publica, a cada frame, os landmarks, o gesto e os instantes
+    de captura e publicação, e opcionalmente uma cópia reduzida do frame.
+
+    É um anel de slots protegido por números de sequência (seqlock): o publicador nunca espera por
+    leitores nem usa locks. Cada slot recebe um número ímpar enquanto está sendo escrito e par quando
+    a escrita termina; um leitor que encontra um número ímpar, ou um número diferente antes e depois
+    da cópia, descarta a leitura e tenta novamente. Leitores lentos apenas perdem mensagens antigas.
+
+    Qualquer processo local pode ler o barramento com LandmarkBusReader, a partir do nome da memória compartilhada.
+    """
+
+    def __init__(self, name=None, slot_count=16, frame_size=None):
+        """
+        Cria a memória compartilhada do barramento.
+
+        Args:
+            name (str): Nome da memória compartilhada. Se None, um nome único é gerado
+            slot_count (int): Número de slots do anel
+            frame_size (tuple): (largura, altura) dos frames publicados. Se None, apenas os landmarks são publicados
+        """
+        frame_width, frame_height = frame_size if frame_size else (0, 0)
+        _, size = _create_views(None, slot_count, frame_height, frame_width)
+        self.shared_memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self.name = self.shared_memory.name
+        self.views = _create_views(self.shared_memory.buf, slot_count, frame_height, frame_width)[0]
+
+        header = self.views['header']
+        header[:] = 0
+        header[SLOT_COUNT_INDEX] = slot_count
+        header[FRAME_HEIGHT_INDEX] = frame_height
+        header[FRAME_WIDTH_INDEX] = frame_width
+        self.views['sequences'][:] = 0
+
+        self.slot_count = slot_count
+        self.frame_size = (frame_width, frame_height) if frame_size else None
+        self.write_count = 0
+
+    def publish(self, capture_time, gesture, landmarks, image=None):
+        """
+        Publica o resultado de um frame no próximo slot do anel.
+
+        Args:
+            capture_time (float): Instante em que o frame foi lido, em time.perf_counter()
+            gesture (int): Gesto reconhecido, ou None se nenhuma mão foi detectada
+            landmarks (np.ndarray): Array (21, 3) com os landmarks, ou None se nenhuma mão foi detectada
+            image (np.ndarray): Frame BGR. É reduzido diretamente para dentro do slot se o barramento publica frames
+        """
+        views = self.views
+        slot = self.write_count % self.slot_count
+        sequence = int(views['sequences'][slot])
+
+        views['sequences'][slot] = sequence + 1
+        views['times'][slot, 0] = capture_time
+        views['gestures'][slot] = NO_HAND if gesture is None else gesture
+        if landmarks is None:
+            views['landmarks'][slot] = np.nan
+        else:
+            views['landmarks'][slot] = landmarks
+        if self.frame_size is not None and image is not None:
+            cv2.resize(image, self.frame_size, dst=views['frames'][slot], interpolation=cv2.INTER_AREA)
+        views['times'][slot, 1] = time.perf_counter()
+        views['sequences'][slot] = sequence + 2
+
+        self.write_count += 1
+        views['header'][WRITE_COUNT_INDEX] = self.write_count
+
+    def is_stop_requested(self):
+        """
+        Returns:
+            bool: True se algum leitor pediu o encerramento do rastreamento (por exemplo, ESC na janela de debug)
+        """
+        return bool(self.views['header'][STOP_REQUESTED_INDEX])
+
+    def close(self):
+        """
+        Marca o barramento como encerrado para os leitores e remove a memória compartilhada.
+        """
+        self.views['header'][CLOSED_INDEX] = 1
+        self.views = None
+        self.shared_memory.close()
+        self.shared_memory.unlink()
+
+class LandmarkBusReader:
+    """
+    Leitor de um LandmarkBus, usado por processos consumidores como a janela de debug.
+    O leitor deve rodar num processo iniciado de forma independente (por exemplo, com subprocess), que tenha
+    o seu próprio resource_tracker, e não no mesmo processo do LandmarkBus.
+    """
+
+    def __init__(self, name, max_retries=8):
+        """
+        Abre a memória compartilhada de um barramento já criado.
+
+        Args:
+            name (str): Nome da memória compartilhada do barramento
+            max_retries (int): Tentativas de leitura de um slot antes de desistir dele, caso o publicador esteja escrevendo
+        """
+        self.shared_memory = shared_memory.SharedMemory(name=name)
+        # O leitor não é dono da memória compartilhada: sem isso, o resource_tracker a removeria quando o leitor encerrasse
+        resource_tracker.unregister(self.shared_memory._name, 'shared_memory')
+
+        header = np.ndarray((HEADER_SIZE,), dtype=np.int64, buffer=self.shared_memory.buf)
+        self.slot_count = int(header[SLOT_COUNT_INDEX])
+        frame_height, frame_width = int(header[FRAME_HEIGHT_INDEX]), int(header[FRAME_WIDTH_INDEX])
+        self.views = _create_views(self.shared_memory.buf, self.slot_count, frame_height, frame_width)[0]
+        self.has_frames = frame_height > 0 and frame_width > 0
+        self.max_retries = max_retries
+        self.read_count = 0
+        self.missed_messages = 0  # Mensagens sobrescritas antes de serem lidas por read_new()
+
+    def is_closed(self):
+        """
+        Returns:
+            bool: True se o publicador encerrou o barramento
+        """
+        return bool(self.views['header'][CLOSED_INDEX])
+
+    def request_stop(self):
+        """
+        Pede ao publicador que encerre o rastreamento.
+        """
+        self.views['header'][STOP_REQUESTED_INDEX] = 1
+
+    def read_latest(self):
+        """
+        Lê a mensagem mais recente, se ela ainda não foi lida.
+
+        Returns:
+            LandmarkMessage: Mensagem mais recente, ou None se não há mensagem nova
+        """
+        write_count = int(self.views['header'][WRITE_COUNT_INDEX])
+        if write_count <= self.read_count:
+            return None
+        self.read_count = write_count
+        return self.__read_slot(write_count - 1)
+
+    def read_new(self):
+        """
+        Lê, em ordem, todas as mensagens publicadas desde a última leitura que ainda estão no anel.
+        Mensagens já sobrescritas são contadas em missed_messages.
+
+        Returns:
+            list: Lista de LandmarkMessage
+        """
+        write_count = int(self.views['header'][WRITE_COUNT_INDEX])
+        first = max(self.read_count, write_count - self.slot_count)
+        self.missed_messages += first - self.read_count
+        self.read_count = write_count
+
+        messages = []
+        for index in range(first, write_count):
+            message = self.__read_slot(index)
+            if message is None:
+                self.missed_messages += 1
+            else:
+                messages.append(message)
+        return messages
+
+    def __read_slot(self, index):
+        """
+        Copia o slot da mensagem de índice informado, validando o número de sequência antes e depois da cópia.
+
+        Args:
+            index (int): Índice da mensagem, contando desde a criação do barramento
+
+        Returns:
+            LandmarkMessage: Cópia da mensagem, ou None se o slot foi sobrescrito ou estava sendo escrito em todas as tentativas
+        """
+        views = self.views
+        slot = index % self.slot_count
+        expected_sequence = (index // self.slot_count + 1) * 2
+
+        for _ in range(self.max_retries):
+            sequence = int(views['sequences'][slot])
+            if sequence > expected_sequence:
+                return None
+            if sequence != expected_sequence:
+                continue
+
+            capture_time, publish_time = views['times'][slot]
+            gesture = int(views['gestures'][slot])
+            landmarks = views['landmarks'][slot].copy()
+            frame = views['frames'][slot].copy() if self.has_frames else None
+
+            if int(views['sequences'][slot]) == sequence:
+                return LandmarkMessage(
+                    index, float(capture_time), float(publish_time), gesture,
+                    None if np.isnan(landmarks[0, 0]) else landmarks, frame
+                )
+        return None
+
+    def close(self):
+        """
+        Fecha o acesso à memória compartilhada, sem removê-la.
+        """
+        self.views = None
+        self.shared_memory.close()
@@ -0,0 +1,220 @@
+import os
+import time
+import numpy as np
+from gesture_recognizer import landmarks_to_array
+
+# Códigos usados na coluna de lateralidade da mão
+NO_HAND = -1
+LEFT_HAND = 0
+RIGHT_HAND = 1
+
+HANDEDNESS_CODES = {'Left': LEFT_HAND, 'Right': RIGHT_HAND}
+
+class LandmarkRecorder:
+    """
+    Classe responsável por gravar, frame a frame, os landmarks detectados em formato colunar.
+
+    A gravação é um diretório com um arquivo .npy por coluna, que pode ser aberto com memory map:
+    - landmarks.npy: float32 (N, 21, 3), preenchido com NaN nos frames sem mão detectada
+    - handedness.npy: int8 (N,), -1 sem mão, 0 mão esquerda, 1 mão direita
+    - timestamps.npy: float64 (N,), instante do frame em segundos
+    - gestures.npy: int8 (N,), gesto reconhecido no frame (-1 sem mão detectada)
+    - labels.npy: int8 (N,), rótulo real do frame quando conhecido (-1 caso contrário)
+
+    As colunas são escritas direto nos arquivos, abertos com memory map, e não ficam em memória: a
+    capacidade dobra quando enche e os arquivos são descarregados no disco a cada flush_interval
+    frames. Se o processo termina sem close(), a gravação continua legível até o último frame
+    descarregado; as posições reservadas e ainda não usadas têm timestamp NaN e são ignoradas pelo
+    LandmarkReplay. close() corta os arquivos no número de frames gravados.
+    """
+
+    # Nome, formato de cada frame, tipo e valor das posições ainda não gravadas de cada coluna
+    COLUMNS = (
+        ('landmarks', (21, 3), np.float32, np.nan),
+        ('handedness', (), np.int8, NO_HAND),
+        ('timestamps', (), np.float64, np.nan),
+        ('gestures', (), np.int8, -1),
+        ('labels', (), np.int8, -1),
+    )
+
+    def __init__(self, path, initial_capacity=1024, flush_interval=256):
+        """
+        Inicializa o gravador e cria os arquivos da gravação.
+
+        Args:
+            path (str): Diretório onde a gravação será salva
+            initial_capacity (int): Número de frames reservados inicialmente nos arquivos
+            flush_interval (int): Número de frames entre as descargas dos arquivos no disco
+        """
+        self.path = path
+        self.frame_count = 0
+        self.flush_interval = flush_interval
+        os.makedirs(path, exist_ok=True)
+        for name, shape, dtype, fill_value in self.COLUMNS:
+            setattr(self, name, self.__create_column(name, initial_capacity, shape, dtype, fill_value))
+
+    def record(self, hand_landmarks, handedness, gesture, timestamp=None, label=-1):
+        """
+        Grava um frame.
+
+        Args:
+            hand_landmarks: Landmarks de uma mão, como array (21, 3) ou NormalizedLandmarkList do MediaPipe.
+                None quando nenhuma mão foi detectada
+            handedness (str): 'Left' ou 'Right', conforme classificado pelo MediaPipe, ou None
+            gesture (int): Gesto reconhecido no frame, ou -1 quando nenhuma mão foi detectada
+            timestamp (float): Instante do frame em segundos. Se None, usa time.perf_counter()
+            label (int): Rótulo real do frame, quando conhecido
+        """
+        if self.frame_count == len(self.timestamps):
+            self.__grow()
+
+        index = self.frame_count
+        if hand_landmarks is not None:
+            if not isinstance(hand_landmarks, np.ndarray):
+                hand_landmarks = landmarks_to_array(hand_landmarks)
+            self.landmarks[index] = hand_landmarks
+        self.handedness[index] = HANDEDNESS_CODES.get(handedness, NO_HAND)
+        self.timestamps[index] = time.perf_counter() if timestamp is None else timestamp
+        self.gestures[index] = -1 if gesture is None else gesture
+        self.labels[index] = label
+        self.frame_count += 1
+
+        if self.frame_count % self.flush_interval == 0:
+            self.flush()
+
+    def flush(self):
+        """
+        Descarrega no disco os frames gravados até agora.
+        """
+        for name, *_ in self.COLUMNS:
+            getattr(self, name).flush()
+
+    def __column_path(self, name):
+        return os.path.join(self.path, f'{name}.npy')
+
+    def __create_column(self, name, capacity, shape, dtype, fill_value, source=None):
+        """
+        Cria o arquivo de uma coluna com a capacidade pedida, copiando os frames já gravados de source.
+        O arquivo é escrito ao lado e só substitui o anterior depois de completo.
+
+        Returns:
+            np.memmap: Coluna aberta com memory map
+        """
+        temporary_path = self.__column_path(name) + '.tmp'
+        column = np.lib.format.open_memmap(temporary_path, mode='w+', dtype=dtype, shape=(capacity,) + shape)
+        count = 0 if source is None else min(self.frame_count, capacity)
+        if count:
+            column[:count] = source[:count]
+        column[count:] = fill_value
+        column.flush()
+        os.replace(temporary_path, self.__column_path(name))
+        return column
+
+    def __resize(self, capacity):
+        """
+        Recria todas as colunas com uma nova capacidade, mantendo os frames gravados.
+        """
+        for name, shape, dtype, fill_value in self.COLUMNS:
+            setattr(self, name, self.__create_column(name, capacity, shape, dtype, fill_value, getattr(self, name)))
+
+    def __grow(self):
+        """
+        Dobra a capacidade dos arquivos.
+        """
+        self.__resize(len(self.timestamps) * 2)
+
+    def close(self):
+        """
+        Corta os arquivos no número de frames gravados e os descarrega no disco.
+        """
+        if len(self.timestamps) != self.frame_count:
+            self.__resize(self.frame_count)
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class LandmarkReplay:
+    """
+    Classe responsável por reproduzir uma gravação feita pelo LandmarkRecorder,
+    alimentando o GestureRecognizer e o MouseController sem câmera e sem inferência do MediaPipe.
+    """
+
+    def __init__(self, path):
+        """
+        Abre a gravação com memory map.
+
+        Args:
+            path (str): Diretório da gravação
+        """
+        self.path = path
+        self.landmarks = np.load(os.path.join(path, 'landmarks.npy'), mmap_mode='r')
+        self.handedness = np.load(os.path.join(path, 'handedness.npy'), mmap_mode='r')
+        self.timestamps = np.load(os.path.join(path, 'timestamps.npy'), mmap_mode='r')
+        self.gestures = np.load(os.path.join(path, 'gestures.npy'), mmap_mode='r')
+        self.labels = np.load(os.path.join(path, 'labels.npy'), mmap_mode='r')
+
+        # Gravações não fechadas terminam em posições reservadas, com timestamp NaN
+        unfinished = np.isnan(self.timestamps)
+        if len(unfinished) and unfinished[-1]:
+            count = int(np.argmax(unfinished))
+            self.landmarks = self.landmarks[:count]
+            self.handedness = self.handedness[:count]
+            self.timestamps = self.timestamps[:count]
+            self.gestures = self.gestures[:count]
+            self.labels = self.labels[:count]
+        self.detected = self.handedness != NO_HAND
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def recognize_all(self, gesture_recognizer):
+        """
+        Reclassifica todos os frames da gravação de uma vez, com o reconhecimento em lote.
+
+        Args:
+            gesture_recognizer: Instância de GestureRecognizer
+
+        Returns:
+            np.ndarray: Gesto de cada frame (-1 nos frames sem mão detectada)
+        """
+        gestures = np.full(len(self), -1, dtype=np.int8)
+        gestures[self.detected] = gesture_recognizer.recognize_batch(self.landmarks[self.detected])
+        return gestures
+
+    def run(self, gesture_recognizer, gesture_actions=None, is_realtime=False):
+        """
+        Reproduz a gravação frame a frame, na ordem em que foi gravada.
+
+        Args:
+            gesture_recognizer: Instância de GestureRecognizer usada para reconhecer os gestos
+            gesture_actions: Instância de GestureActions que executa as ações no mouse. Se None, apenas reconhece
+            is_realtime (bool): Se True, respeita o intervalo original entre os frames
+
+        Returns:
+            np.ndarray: Gesto de cada frame (-1 nos frames sem mão detectada)
+        """
+        gestures = np.full(len(self), -1, dtype=np.int8)
+        start_time = time.perf_counter()
+
+        for index in range(len(self)):
+            if is_realtime:
+                delay = (self.timestamps[index] - self.timestamps[0]) - (time.perf_counter() - start_time)
+                if delay > 0:
+                    time.sleep(delay)
+
+            if not self.detected[index]:
+                continue
+
+            landmarks = self.landmarks[index]
+            gesture = gesture_recognizer.recognize_array(landmarks)
+            coordinates = gesture_recognizer.get_pointer_coordinates_array(landmarks, float(self.timestamps[index]))
+            gestures[index] = gesture
+
+            if gesture_actions is not None:
+                gesture_actions.run(gesture, coordinates)
+
+        return gestures
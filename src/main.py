@@ -1,9 +1,188 @@
-from hand_tracker import HandTracker
+import time
+
+# Marcado antes de qualquer outro import, para medir o tempo de inicialização completo
+START_TIME = time.perf_counter()
+
+import argparse
+import os
+import subprocess
+import sys
 from gesture_recognizer import GestureRecognizer
+from mouse_backends import MOUSE_BACKENDS, create_mouse_backend
 from mouse_controller import MouseController
+from pointer_filters import POINTER_FILTERS, create_pointer_filter
+
+def parse_arguments():
+    """
+    Lê as opções da linha de comando.
+
+    Returns:
+        argparse.Namespace: Opções informadas
+    """
+    parser = argparse.ArgumentParser(description="Handy Input: controle do mouse por gestos da mão")
+    parser.add_argument("--debug", action="store_true", help="Mostra a janela de debug com a detecção da mão, num processo separado")
+    parser.add_argument("--debug-in-process", action="store_true", help="Mostra a janela de debug dentro do loop de rastreamento, como nas versões anteriores")
+    parser.add_argument("--landmark-bus", metavar="NAME", help="Publica os landmarks e gestos de cada frame na memória compartilhada NAME, para outros processos")
+    parser.add_argument("--pipelined", action="store_true", help="Executa captura, inferência e ações do mouse em estágios paralelos")
+    parser.add_argument("--record", metavar="DIR", help="Grava os landmarks de cada frame no diretório informado")
+    parser.add_argument("--roi-size", type=int, metavar="PX", help="Processa apenas um recorte ao redor da mão, reduzido para no máximo PX pixels de lado")
+    parser.add_argument("--camera-width", type=int, help="Largura de captura da câmera")
+    parser.add_argument("--camera-height", type=int, help="Altura de captura da câmera")
+    parser.add_argument("--camera-fps", type=int, help="Taxa de captura da câmera")
+    parser.add_argument("--camera-fourcc", help="Codec de captura da câmera, por exemplo MJPG")
+    parser.add_argument("--adaptive-inference", action="store_true", help="Reduz a taxa de inferência enquanto a mão está parada")
+    parser.add_argument("--min-inference-rate", type=float, default=5, help="Menor taxa de inferência por segundo com --adaptive-inference")
+    parser.add_argument("--max-inference-rate", type=float, default=30, help="Maior taxa de inferência por segundo com --adaptive-inference")
+    parser.add_argument("--target-fps", type=float, help="Ajusta o modelo, a resolução e os limiares da detecção para manter essa taxa de frames")
+    parser.add_argument("--cursor-rate", type=float, metavar="HZ", help="Move o cursor nessa taxa, independente da câmera, interpolando e extrapolando as posições de cada frame")
+    parser.add_argument("--cursor-delay", type=float, default=0.0, metavar="S", help="Atraso da posição mostrada com --cursor-rate. 0 extrapola; cerca de um frame apenas interpola")
+    parser.add_argument("--mouse-output-rate", type=float, metavar="HZ", help="Envia os eventos do mouse por uma thread própria nessa taxa, agrupando movimentos e scrolls")
+    parser.add_argument("--mouse-backend", choices=list(MOUSE_BACKENDS), default='pyautogui', help="Como os eventos do mouse são enviados: pyautogui, XTEST direto no servidor X ou um dispositivo uinput")
+    parser.add_argument("--reuse-buffers", action="store_true", help="Reaproveita buffers pré-alocados para os frames em vez de alocar novos arrays a cada frame")
+    parser.add_argument("--cameras", nargs="+", metavar="SOURCE", help="Rastreia várias câmeras (índices de webcam ou arquivos de vídeo), cada uma no seu próprio processo")
+    parser.add_argument("--max-hands", type=int, default=1, help="Número máximo de mãos rastreadas por câmera")
+    parser.add_argument("--pinch-threshold", type=float, default=GestureRecognizer.PINCH_THRESHOLD, help="Distância máxima entre as pontas dos dedos nos gestos de clique")
+    parser.add_argument("--right-pinch-threshold", type=float, help="Distância máxima no clique direito. Se omitido, usa --pinch-threshold")
+    parser.add_argument("--cursor-smoothing", type=float, default=0.8, help="Peso da posição anterior na suavização do cursor (0 desliga)")
+    parser.add_argument("--pointer-filter", metavar="SPEC", help=f"Filtro do cursor ({', '.join(POINTER_FILTERS)}), com parâmetros opcionais, por exemplo one_euro:min_cutoff=0.5,beta=0.1. Se omitido, usa a suavização exponencial de --cursor-smoothing")
+    parser.add_argument("--pointer-prediction", type=float, default=0.0, metavar="S", help="Prevê a posição do cursor S segundos à frente com a velocidade estimada pelo filtro")
+    parser.add_argument("--compensate-latency", action="store_true", help="Soma à previsão do cursor a latência medida entre a captura do frame e o mouse")
+    parser.add_argument("--templates", metavar="PATH", help="Reconhece os gestos com o índice de templates gravado por tests/compare_classifiers.py --save, em vez das regras")
+    parser.add_argument("--active-region", type=float, nargs=2, default=(0.2, 0.8), metavar=("START", "END"), help="Região do frame mapeada para a tela inteira")
+    parser.add_argument("--metrics", action="store_true", help="Imprime periodicamente o FPS e o tempo de cada estágio do processamento")
+    parser.add_argument("--metrics-interval", type=float, default=5.0, help="Intervalo, em segundos, entre os relatórios de métricas")
+    parser.add_argument("--metrics-file", metavar="PATH", help="Reescreve periodicamente as métricas em JSON nesse arquivo")
+    parser.add_argument("--metrics-port", type=int, help="Serve as métricas em JSON por HTTP em 127.0.0.1 nessa porta")
+    args = parser.parse_args()
+
+    if args.cameras or args.max_hands > 1:
+        # O MultiCameraTracker não usa essas opções, então elas são recusadas em vez de ignoradas
+        single_camera_options = (
+            'debug', 'debug_in_process', 'landmark_bus', 'pipelined', 'record', 'roi_size', 'camera_width', 'camera_height',
+            'camera_fps', 'camera_fourcc', 'adaptive_inference', 'target_fps', 'reuse_buffers', 'metrics', 'metrics_file',
+            'metrics_port',
+        )
+        used = [f"--{option.replace('_', '-')}" for option in single_camera_options if getattr(args, option)]
+        if used:
+            parser.error(f"{', '.join(used)} cannot be used with --cameras or --max-hands greater than 1")
+    return args
+
+def main():
+    """
+    Monta os componentes conforme as opções da linha de comando e inicia o rastreamento.
+    Os módulos que dependem do MediaPipe ou do OpenCV, que são lentos de carregar, só são importados quando usados.
+    """
+    args = parse_arguments()
+
+    pointer_filter = create_pointer_filter(
+        args.pointer_filter or f'ema:smoothing_factor={args.cursor_smoothing}',
+        prediction=args.pointer_prediction, compensate_latency=args.compensate_latency,
+    )
+    classifier = None
+    if args.templates:
+        from template_classifier import TemplateClassifier
+        classifier = TemplateClassifier.load(args.templates)
+    gesture_recognizer = GestureRecognizer(
+        args.pinch_threshold, args.right_pinch_threshold, pointer_filter=pointer_filter, classifier=classifier
+    )
+    # Com --cursor-rate, o cursor é movido por outra thread, então todos os eventos passam pela thread de saída do MouseController
+    output_rate = args.mouse_output_rate or args.cursor_rate
+    try:
+        backend = create_mouse_backend(args.mouse_backend)
+    except RuntimeError as error:
+        sys.exit(str(error))
+    mouse_controller = MouseController(output_rate=output_rate, backend=backend, active_region=tuple(args.active_region))
+    cursor_output = None
+    if args.cursor_rate:
+        from cursor_output import CursorOutput
+        cursor_output = CursorOutput(mouse_controller, rate=args.cursor_rate, delay=args.cursor_delay)
+
+    if args.cameras or args.max_hands > 1:
+        from multi_tracker import MultiCameraTracker
+
+        multi_tracker = MultiCameraTracker(
+            args.cameras or [0], gesture_recognizer, mouse_controller, max_num_hands=args.max_hands, cursor_output=cursor_output
+        )
+        try:
+            multi_tracker.run()
+        finally:
+            if cursor_output is not None:
+                cursor_output.close()
+            mouse_controller.close()
+            print(f"Processed frames: {multi_tracker.processed_frames}, dropped frames: {multi_tracker.dropped_frames}")
+        return
+
+    from hand_tracker import HandTracker
+
+    recorder = None
+    if args.record:
+        from landmark_recorder import LandmarkRecorder
+        recorder = LandmarkRecorder(args.record)
+    metrics = None
+    if args.metrics or args.metrics_file or args.metrics_port:
+        from metrics import Metrics
+        metrics = Metrics(
+            report_interval=args.metrics_interval,
+            is_logging=args.metrics,
+            snapshot_path=args.metrics_file,
+            http_port=args.metrics_port
+        )
+    inference_scheduler = None
+    if args.adaptive_inference:
+        from inference_scheduler import InferenceScheduler
+        inference_scheduler = InferenceScheduler(args.min_inference_rate, args.max_inference_rate)
+
+    quality_governor = None
+    if args.target_fps:
+        from quality_governor import QualityGovernor
+        quality_governor = QualityGovernor(args.target_fps)
+
+    landmark_bus = None
+    debug_viewer = None
+    if args.debug or args.landmark_bus:
+        from landmark_bus import LandmarkBus
+        landmark_bus = LandmarkBus(args.landmark_bus, frame_size=(320, 240) if args.debug else None)
+    if args.debug:
+        viewer_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'debug_viewer.py')
+        debug_viewer = subprocess.Popen([sys.executable, viewer_path, landmark_bus.name])
 
-gesture_recognizer = GestureRecognizer()
-mouse_controller = MouseController()
+    hand_tracker = HandTracker(
+        gesture_recognizer,
+        mouse_controller,
+        recorder=recorder,
+        roi_size=args.roi_size,
+        camera_width=args.camera_width,
+        camera_height=args.camera_height,
+        camera_fps=args.camera_fps,
+        camera_fourcc=args.camera_fourcc,
+        inference_scheduler=inference_scheduler,
+        metrics=metrics,
+        reuse_buffers=args.reuse_buffers,
+        landmark_bus=landmark_bus,
+        start_time=START_TIME,
+        quality_governor=quality_governor,
+        cursor_output=cursor_output
+    )
+    try:
+        hand_tracker.run(is_debug=args.debug_in_process, is_pipelined=args.pipelined)
+    finally:
+        if cursor_output is not None:
+            cursor_output.close()
+        mouse_controller.close()
+        if landmark_bus is not None:
+            landmark_bus.close()
+        if debug_viewer is not None:
+            debug_viewer.wait()
+        print(f"Mouse events sent: {mouse_controller.sent_events}, suppressed: {mouse_controller.suppressed_events}")
+        if recorder is not None:
+            recorder.close()
+        if metrics is not None:
+            metrics.close()
+        if inference_scheduler is not None:
+            print(f"Inferred frames: {inference_scheduler.inferred_frames}, skipped frames: {inference_scheduler.skipped_frames}")
+        if quality_governor is not None:
+            print(f"Quality level: {quality_governor.level.name}, switches: {quality_governor.switch_count}")
 
-hand_tracker = HandTracker(gesture_recognizer, mouse_controller)
-hand_tracker.run(is_debug=False)
\ No newline at end of file
+# O rastreamento com várias câmeras inicia processos com o método spawn, que importam este módulo novamente
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+
+class RollingWindow:
+    """
+    Janela circular de tamanho fixo com as últimas amostras de uma medida.
+    Gravar uma amostra é apenas uma atribuição num array pré-alocado; os percentis só são calculados quando pedidos.
+    """
+
+    def __init__(self, size):
+        """
+        Args:
+            size (int): Número de amostras mantidas
+        """
+        self.samples = np.zeros(size, dtype=np.float64)
+        self.index = 0
+        self.count = 0
+
+    def add(self, value):
+        """
+        Grava uma amostra, sobrescrevendo a mais antiga se a janela estiver cheia.
+        """
+        self.samples[self.index] = value
+        self.index = (self.index + 1) % len(self.samples)
+        self.count += 1
+
+    def values(self):
+        """
+        Returns:
+            np.ndarray: Cópia das amostras presentes na janela
+        """
+        return self.samples[:min(self.count, len(self.samples))].copy()
+
+class Metrics:
+    """
+    Classe responsável por medir o tempo de cada estágio do processamento de um frame.
+
+    Os estágios medidos são a captura, a conversão de cor, a inferência do MediaPipe, o reconhecimento
+    do gesto (incluindo as coordenadas do cursor) e o envio das ações ao mouse. A latência total mede o
+    tempo entre o fim da leitura de um frame e o fim do seu processamento. Para cada um, mantém uma
+    janela com as últimas amostras, de onde saem média e percentis p50/p95/p99. Também calcula o FPS e
+    conta os frames descartados.
+
+    Os valores podem ser expostos numa linha de log periódica, num arquivo JSON reescrito periodicamente
+    e num endpoint HTTP local que devolve o mesmo JSON.
+    """
+
+    STAGES = ('capture', 'color', 'process', 'recognize', 'dispatch', 'latency')
+
+    def __init__(self, window_size=1000, report_interval=5.0, is_logging=True, snapshot_path=None, http_port=None):
+        """
+        Inicializa as métricas.
+
+        Args:
+            window_size (int): Número de amostras mantidas por estágio
+            report_interval (float): Intervalo, em segundos, entre linhas de log e escritas do arquivo JSON
+            is_logging (bool): Se True, imprime uma linha de resumo a cada report_interval
+            snapshot_path (str): Arquivo onde o JSON das métricas é reescrito a cada report_interval
+            http_port (int): Porta local (127.0.0.1) de um servidor HTTP que responde com o JSON das métricas
+        """
+        self.stages = {stage: RollingWindow(window_size) for stage in self.STAGES}
+        self.frame_times = RollingWindow(window_size)
+        self.dropped_frames = 0
+        self.report_interval = report_interval
+        self.is_logging = is_logging
+        self.snapshot_path = snapshot_path
+        self.next_report_time = time.perf_counter() + report_interval
+
+        self.http_server = None
+        if http_port is not None:
+            self.__start_http_server(http_port)
+
+    def mark(self, stage, start_time):
+        """
+        Grava a duração de um estágio que começou em start_time e terminou agora.
+
+        Args:
+            stage (str): Nome do estágio
+            start_time (float): Instante de início do estágio, obtido com time.perf_counter()
+
+        Returns:
+            float: Instante atual, que pode ser usado como início do próximo estágio
+        """
+        now = time.perf_counter()
+        self.stages[stage].add(now - start_time)
+        return now
+
+    def drop(self, count=1):
+        """
+        Conta frames descartados (falhas de leitura da câmera ou frames substituídos no pipeline).
+        """
+        self.dropped_frames += count
+
+    def frame(self, now):
+        """
+        Registra o processamento de um frame e, se chegou a hora, emite o relatório periódico.
+
+        Args:
+            now (float): Instante do frame, obtido com time.perf_counter()
+        """
+        self.frame_times.add(now)
+        if now >= self.next_report_time:
+            self.next_report_time = now + self.report_interval
+            self.report()
+
+    def snapshot(self):
+        """
+        Calcula o resumo atual das métricas.
+
+        Returns:
+            dict: FPS, total de frames, frames descartados e, por estágio, contagem, média e percentis em milissegundos
+        """
+        frame_times = np.sort(self.frame_times.values())
+        fps = 0.0
+        if len(frame_times) > 1 and frame_times[-1] > frame_times[0]:
+            fps = (len(frame_times) - 1) / (frame_times[-1] - frame_times[0])
+
+        stages = {}
+        for stage, window in self.stages.items():
+            values = window.values() * 1000
+            if len(values) == 0:
+                continue
+            p50, p95, p99 = np.percentile(values, (50, 95, 99))
+            stages[stage] = {
+                'count': window.count,
+                'mean_ms': float(values.mean()),
+                'p50_ms': float(p50),
+                'p95_ms': float(p95),
+                'p99_ms': float(p99),
+            }
+
+        return {
+            'fps': fps,
+            'frames': self.frame_times.count,
+            'dropped_frames': self.dropped_frames,
+            'stages': stages,
+        }
+
+    def report(self):
+        """
+        Imprime a linha de resumo e reescreve o arquivo JSON, conforme configurado.
+        """
+        snapshot = self.snapshot()
+        if self.is_logging:
+            stages = ' '.join(
+                f"{stage}={values['p50_ms']:.1f}/{values['p95_ms']:.1f}/{values['p99_ms']:.1f}ms"
+                for stage, values in snapshot['stages'].items()
+            )
+            print(f"fps={snapshot['fps']:.1f} dropped={snapshot['dropped_frames']} {stages}")
+
+        if self.snapshot_path:
+            temporary_path = self.snapshot_path + '.tmp'
+            with open(temporary_path, 'w') as file:
+                json.dump(snapshot, file, indent=2)
+            os.replace(temporary_path, self.snapshot_path)
+
+    def __start_http_server(self, port):
+        """
+        Inicia, numa thread daemon, o servidor HTTP local que responde qualquer GET com o JSON das métricas.
+
+        Args:
+            port (int): Porta em 127.0.0.1
+        """
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps(metrics.snapshot()).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.http_server = ThreadingHTTPServer(('127.0.0.1', port), MetricsHandler)
+        threading.Thread(target=self.http_server.serve_forever, daemon=True).start()
+
+    def close(self):
+        """
+        Emite um último relatório e encerra o servidor HTTP, se houver.
+        """
+        self.report()
+        if self.http_server is not None:
+            self.http_server.shutdown()
+            self.http_server.server_close()
+            self.http_server = None
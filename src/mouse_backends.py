@@ -0,0 +1,296 @@
+import time
+
+class PyAutoGuiBackend:
+    """
+    Backend do MouseController que envia os eventos ao sistema operacional através do pyautogui.
+    """
+
+    def __init__(self):
+        """
+        Importa o pyautogui e remove o delay padrão entre seus comandos.
+        """
+        import pyautogui
+        self.pyautogui = pyautogui
+        pyautogui.PAUSE = 0  # Remove delay padrão entre comandos do pyautogui
+
+    def size(self):
+        """
+        Returns:
+            tuple: Largura e altura da tela em pixels
+        """
+        return self.pyautogui.size()
+
+    def move(self, x, y):
+        self.pyautogui.moveTo(x, y)
+
+    def click(self):
+        self.pyautogui.click()
+
+    def right_click(self):
+        self.pyautogui.rightClick()
+
+    def left_down(self):
+        self.pyautogui.mouseDown(button='left')
+
+    def left_up(self):
+        self.pyautogui.mouseUp(button='left')
+
+    def scroll(self, amount):
+        self.pyautogui.scroll(amount)
+
+    def close(self):
+        pass
+
+class XTestBackend:
+    """
+    Backend do MouseController que envia os eventos diretamente ao servidor X pela extensão XTEST.
+
+    Ao contrário do pyautogui, que a cada chamada verifica o canto de fail-safe, consulta o tamanho
+    da tela e passa pela lógica de animação do movimento, aqui cada evento é uma única requisição
+    numa conexão mantida aberta. As requisições são apenas enviadas (flush), sem esperar a resposta
+    do servidor.
+    """
+
+    # Botões do X: 1 é o esquerdo, 3 o direito, 4 e 5 são o scroll para cima e para baixo
+    LEFT_BUTTON = 1
+    RIGHT_BUTTON = 3
+    SCROLL_UP_BUTTON = 4
+    SCROLL_DOWN_BUTTON = 5
+
+    def __init__(self, display=None):
+        """
+        Abre a conexão com o servidor X.
+
+        Args:
+            display (str): Nome do display, como ':0'. Se None, usa a variável de ambiente DISPLAY
+        """
+        from Xlib import X
+        from Xlib.display import Display
+        from Xlib.ext import xtest
+
+        self.display = Display(display)
+        if not self.display.has_extension('XTEST'):
+            self.display.close()
+            raise RuntimeError("X server does not support the XTEST extension")
+        screen = self.display.screen()
+        self.width = screen.width_in_pixels
+        self.height = screen.height_in_pixels
+        self.fake_input = xtest.fake_input
+        self.motion_event = X.MotionNotify
+        self.press_event = X.ButtonPress
+        self.release_event = X.ButtonRelease
+
+    def size(self):
+        return self.width, self.height
+
+    def move(self, x, y):
+        self.fake_input(self.display, self.motion_event, x=x, y=y)
+        self.display.flush()
+
+    def click(self):
+        self.__click(self.LEFT_BUTTON)
+
+    def right_click(self):
+        self.__click(self.RIGHT_BUTTON)
+
+    def left_down(self):
+        self.fake_input(self.display, self.press_event, self.LEFT_BUTTON)
+        self.display.flush()
+
+    def left_up(self):
+        self.fake_input(self.display, self.release_event, self.LEFT_BUTTON)
+        self.display.flush()
+
+    def scroll(self, amount):
+        # Como no pyautogui, cada unidade de scroll é um clique do botão 4 (para cima) ou 5 (para baixo)
+        button = self.SCROLL_UP_BUTTON if amount > 0 else self.SCROLL_DOWN_BUTTON
+        for _ in range(abs(amount)):
+            self.fake_input(self.display, self.press_event, button)
+            self.fake_input(self.display, self.release_event, button)
+        self.display.flush()
+
+    def sync(self):
+        """
+        Espera o servidor X processar todas as requisições enviadas. Usado para medir a latência de ponta a ponta.
+        """
+        self.display.sync()
+
+    def close(self):
+        self.display.close()
+
+    def __click(self, button):
+        self.fake_input(self.display, self.press_event, button)
+        self.fake_input(self.display, self.release_event, button)
+        self.display.flush()
+
+class UInputBackend:
+    """
+    Backend do MouseController que cria um dispositivo apontador virtual no kernel (uinput), através do python-evdev.
+    Funciona em X11 e em Wayland, mas exige permissão de escrita em /dev/uinput.
+
+    O dispositivo usa eixos absolutos, que o sistema mapeia para a tela inteira, então o tamanho
+    informado em size() define apenas a resolução das coordenadas enviadas e não precisa ser igual ao
+    da tela real.
+    """
+
+    def __init__(self, width=1920, height=1080, name='handy-input'):
+        """
+        Cria o dispositivo virtual.
+
+        Args:
+            width (int): Resolução horizontal das coordenadas do dispositivo
+            height (int): Resolução vertical das coordenadas do dispositivo
+            name (str): Nome do dispositivo, como aparece para o sistema
+        """
+        from evdev import AbsInfo, UInput, ecodes
+
+        self.width = width
+        self.height = height
+        self.ecodes = ecodes
+        capabilities = {
+            ecodes.EV_KEY: [ecodes.BTN_LEFT, ecodes.BTN_RIGHT],
+            ecodes.EV_ABS: [
+                (ecodes.ABS_X, AbsInfo(value=0, min=0, max=width - 1, fuzz=0, flat=0, resolution=0)),
+                (ecodes.ABS_Y, AbsInfo(value=0, min=0, max=height - 1, fuzz=0, flat=0, resolution=0)),
+            ],
+            ecodes.EV_REL: [ecodes.REL_WHEEL],
+        }
+        self.device = UInput(capabilities, name=name)
+
+    def size(self):
+        return self.width, self.height
+
+    def move(self, x, y):
+        self.device.write(self.ecodes.EV_ABS, self.ecodes.ABS_X, x)
+        self.device.write(self.ecodes.EV_ABS, self.ecodes.ABS_Y, y)
+        self.device.syn()
+
+    def click(self):
+        self.__click(self.ecodes.BTN_LEFT)
+
+    def right_click(self):
+        self.__click(self.ecodes.BTN_RIGHT)
+
+    def left_down(self):
+        self.device.write(self.ecodes.EV_KEY, self.ecodes.BTN_LEFT, 1)
+        self.device.syn()
+
+    def left_up(self):
+        self.device.write(self.ecodes.EV_KEY, self.ecodes.BTN_LEFT, 0)
+        self.device.syn()
+
+    def scroll(self, amount):
+        self.device.write(self.ecodes.EV_REL, self.ecodes.REL_WHEEL, amount)
+        self.device.syn()
+
+    def close(self):
+        self.device.close()
+
+    def __click(self, button):
+        # Cada mudança de estado precisa do seu próprio SYN, senão o pressionamento e a liberação se anulam
+        self.device.write(self.ecodes.EV_KEY, button, 1)
+        self.device.syn()
+        self.device.write(self.ecodes.EV_KEY, button, 0)
+        self.device.syn()
+
+class NullBackend:
+    """
+    Backend do MouseController que descarta todos os eventos. Usado em benchmarks e testes sem tela.
+    """
+
+    def __init__(self, width=1920, height=1080):
+        """
+        Args:
+            width (int): Largura da tela simulada
+            height (int): Altura da tela simulada
+        """
+        self.width = width
+        self.height = height
+
+    def size(self):
+        return self.width, self.height
+
+    def move(self, x, y):
+        pass
+
+    def click(self):
+        pass
+
+    def right_click(self):
+        pass
+
+    def left_down(self):
+        pass
+
+    def left_up(self):
+        pass
+
+    def scroll(self, amount):
+        pass
+
+    def close(self):
+        pass
+
+class RecordingBackend(NullBackend):
+    """
+    Backend do MouseController que, em vez de enviar os eventos, os grava em memória com o instante de cada um.
+    """
+
+    def __init__(self, width=1920, height=1080):
+        super().__init__(width, height)
+        self.events = []  # Lista de (instante, tipo do evento, argumentos)
+
+    def move(self, x, y):
+        self.events.append((time.perf_counter(), 'move', (x, y)))
+
+    def click(self):
+        self.events.append((time.perf_counter(), 'click', ()))
+
+    def right_click(self):
+        self.events.append((time.perf_counter(), 'right_click', ()))
+
+    def left_down(self):
+        self.events.append((time.perf_counter(), 'left_down', ()))
+
+    def left_up(self):
+        self.events.append((time.perf_counter(), 'left_up', ()))
+
+    def scroll(self, amount):
+        self.events.append((time.perf_counter(), 'scroll', (amount,)))
+
+MOUSE_BACKENDS = {
+    'pyautogui': PyAutoGuiBackend,
+    'xtest': XTestBackend,
+    'uinput': UInputBackend,
+    'null': NullBackend,
+}
+
+# Pacote do pip que cada backend importa ao ser criado. evdev é opcional e não está em requirements.txt
+MOUSE_BACKEND_PACKAGES = {
+    'pyautogui': 'PyAutoGUI',
+    'xtest': 'python3-xlib',
+    'uinput': 'evdev',
+}
+
+def create_mouse_backend(name):
+    """
+    Cria um backend do MouseController pelo nome, como usado na linha de comando.
+
+    Args:
+        name (str): Um dos nomes de MOUSE_BACKENDS
+
+    Returns:
+        Backend criado
+
+    Raises:
+        RuntimeError: Se o pacote usado pelo backend não estiver instalado
+    """
+    if name not in MOUSE_BACKENDS:
+        raise ValueError(f"Unknown mouse backend: {name}")
+    try:
+        return MOUSE_BACKENDS[name]()
+    except ImportError as error:
+        package = MOUSE_BACKEND_PACKAGES.get(name, error.name)
+        raise RuntimeError(
+            f"Mouse backend '{name}' requires the '{package}' package, install it with: pip install {package}"
+        ) from error
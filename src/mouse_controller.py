@@ -1,31 +1,68 @@
-import pyautogui
+import threading
+from mouse_backends import PyAutoGuiBackend
 
 class MouseController:
     """
     Classe responsável por controlar o mouse do computador através de comandos programáticos.
-    Utiliza a biblioteca pyautogui para simular ações do mouse como movimento, cliques e scroll.
+    Utiliza um backend (por padrão, a biblioteca pyautogui) para simular ações do mouse como movimento, cliques e scroll.
+
+    Apenas mudanças de estado geram eventos: movimentos para a mesma posição e pressionamentos ou
+    liberações de botões que já estão no estado pedido são descartados. Com output_rate definido,
+    os eventos são enviados por uma thread própria nessa taxa: movimentos pendentes consecutivos são
+    substituídos pelo mais recente e scrolls consecutivos são somados, de modo que quem chama nunca
+    bloqueia esperando o sistema operacional.
     """
 
-    def __init__(self):
+    def __init__(self, output_rate=None, backend=None, active_region=(0.2, 0.8)):
         """
         Inicializa o controlador do mouse.
         Define as dimensões da tela e variáveis de controle para os cliques.
+
+        Args:
+            output_rate (float): Taxa, em envios por segundo, da thread de saída. Se None, os eventos são enviados imediatamente
+            backend: Backend que envia os eventos (ver mouse_backends). Se None, usa PyAutoGuiBackend
+            active_region (tuple): Intervalo (início, fim) das coordenadas normalizadas do frame, em x e em y,
+                que é mapeado para a tela inteira (ver move_cursor)
         """
-        self.screen_width, self.screen_height = pyautogui.size()
-        self.has_clicked_left = False 
+        self.backend = backend if backend is not None else PyAutoGuiBackend()
+        self.screen_width, self.screen_height = self.backend.size()
+        self.active_region = active_region
+        self.region_start = active_region[0]
+        self.region_size = active_region[1] - active_region[0]
+        # Constantes do mapeamento de move_cursor, calculadas uma única vez: pixel = coordenada * escala - deslocamento,
+        # limitado ao intervalo [1, tamanho - 2]
+        self.scale_x = self.screen_width / self.region_size
+        self.scale_y = self.screen_height / self.region_size
+        self.offset_x = self.region_start * self.scale_x
+        self.offset_y = self.region_start * self.scale_y
+        self.max_x = self.screen_width - 2
+        self.max_y = self.screen_height - 2
+        self.has_clicked_left = False
         self.has_clicked_right = False
-        self.frames_clicked_left = 0 
-        pyautogui.PAUSE = 0  # Remove delay padrão entre comandos do pyautogui
+        self.frames_clicked_left = 0
+        self.is_left_pressed = False   # Se o botão esquerdo foi mantido pressionado (arrastar)
+        self.last_position = None      # Última posição, em pixels, pedida para o cursor
+        self.sent_events = 0           # Eventos efetivamente enviados ao sistema operacional
+        self.suppressed_events = 0     # Eventos descartados por serem redundantes ou agrupados
+
+        self.output_rate = output_rate
+        self.pending_events = []
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.output_thread = None
+        if output_rate:
+            self.output_thread = threading.Thread(target=self.__output_loop, daemon=True)
+            self.output_thread.start()
 
     def move_cursor(self, x, y):
         """
         Move o cursor do mouse para uma posição específica na tela.
-        
+
         Args:
             x (float): Coordenada X normalizada (entre 0 e 1)
             y (float): Coordenada Y normalizada (entre 0 e 1)
 
-            A detecção da mão funciona usando uma parte menor da área da tela(nesse caso, está sendo usado 60% da área central da tela, sendo considerados apenas os valores entre 0.2 e 0.8). 
+            A detecção da mão funciona usando uma parte menor da área da tela(por padrão, está sendo usado 60% da área central da tela, sendo considerados apenas os valores entre 0.2 e 0.8, definidos por active_region).
             Então esse método faz uma trativa que normaliza as coordenadas entre 0.2 e 0.8 para valores entre 0 e 1.
             Assim, o usuário move a mão apenas nos 60% de área central do frame, mas o cursor do mouse consegue se mover corretamente até as bordas.
             Isso é importante pois a detecção de mão não funciona tão bem quando a mão está na borda do frame, pois ela fica parcialmente escondida.
@@ -33,12 +70,18 @@ class MouseController:
             TODO: Considerar mover essa tratativa para fora dessa classe, já que isso sai da função de "controlar o mouse" pela qual a classe é responsável.
 
         """
-        x = (x - 0.2) / 0.6 
-        y = (y - 0.2) / 0.6 
-        x = max(1, min(x * self.screen_width, self.screen_width - 2)) 
-        y = max(1, min(y * self.screen_height, self.screen_height - 2)) 
+        x = x * self.scale_x - self.offset_x
+        y = y * self.scale_y - self.offset_y
+        x = int(1 if x < 1 else self.max_x if x > self.max_x else x)
+        y = int(1 if y < 1 else self.max_y if y > self.max_y else y)
 
-        pyautogui.moveTo(x, y)
+        # O cursor pode ser movido pela thread do CursorOutput enquanto os botões são acionados pela thread principal
+        with self.lock:
+            if (x, y) == self.last_position:
+                self.suppressed_events += 1
+                return
+            self.last_position = (x, y)
+        self.__submit(('move', x, y))
 
     def left_button_down(self):
         """
@@ -48,10 +91,15 @@ class MouseController:
         """
         self.frames_clicked_left += 1
         if not self.has_clicked_left:
-            pyautogui.click()
+            self.__submit(('click',))
             self.has_clicked_left = True
         if self.frames_clicked_left >= 10:
-            pyautogui.mouseDown(button='left')
+            if self.is_left_pressed:
+                with self.lock:
+                    self.suppressed_events += 1
+            else:
+                self.__submit(('left_down',))
+                self.is_left_pressed = True
 
     def right_button_down(self):
         """
@@ -59,33 +107,119 @@ class MouseController:
         Realiza um clique direito simples se ainda não houve clique(para prevenir cliques duplos acidentais).
         """
         if not self.has_clicked_right:
-            pyautogui.rightClick()
+            self.__submit(('right_click',))
             self.has_clicked_right = True
 
     def buttons_up(self):
         """
         Reseta o estado dos botões do mouse.
-        Libera todos os botões pressionados e zera os contadores.
+        Libera o botão esquerdo se ele estiver pressionado e zera os contadores.
         """
         self.has_clicked_right = False
         self.has_clicked_left = False
         self.frames_clicked_left = 0
-        pyautogui.mouseUp(button='left')
+        if self.is_left_pressed:
+            self.__submit(('left_up',))
+            self.is_left_pressed = False
+        else:
+            with self.lock:
+                self.suppressed_events += 1
 
     def scroll_down(self, scroll_value):
         """
         Realiza scroll para baixo na tela.
-        
+
         Args:
             scroll_value (int): Quantidade de unidades para rolar para baixo
         """
-        pyautogui.scroll(-scroll_value)
+        self.__submit(('scroll', -scroll_value))
 
     def scroll_up(self, scroll_value):
         """
         Realiza scroll para cima na tela.
-        
+
         Args:
             scroll_value (int): Quantidade de unidades para rolar para cima
         """
-        pyautogui.scroll(scroll_value)
+        self.__submit(('scroll', scroll_value))
+
+    def close(self):
+        """
+        Encerra a thread de saída, enviando os eventos pendentes, libera o botão esquerdo se ele estiver pressionado
+        e fecha o backend.
+        """
+        if self.is_left_pressed:
+            self.__submit(('left_up',))
+            self.is_left_pressed = False
+
+        if self.output_thread is not None:
+            self.stop_event.set()
+            self.output_thread.join()
+            self.output_thread = None
+            self.__flush()
+        self.backend.close()
+
+    def __submit(self, event):
+        """
+        Envia um evento imediatamente ou, com a thread de saída ativa, coloca-o na fila de eventos pendentes.
+        Um movimento logo após outro movimento pendente o substitui, e um scroll logo após outro scroll pendente é somado a ele.
+
+        Args:
+            event (tuple): Evento, com o tipo na primeira posição e os argumentos em seguida
+        """
+        if self.output_thread is None:
+            self.__send(event)
+            return
+
+        with self.lock:
+            last_event = self.pending_events[-1] if self.pending_events else None
+            if last_event is not None and last_event[0] == event[0] == 'move':
+                self.pending_events[-1] = event
+                self.suppressed_events += 1
+            elif last_event is not None and last_event[0] == event[0] == 'scroll':
+                self.pending_events[-1] = ('scroll', last_event[1] + event[1])
+                self.suppressed_events += 1
+            else:
+                self.pending_events.append(event)
+
+    def __output_loop(self):
+        """
+        Loop da thread de saída: envia os eventos pendentes na taxa definida por output_rate.
+        """
+        interval = 1 / self.output_rate
+        while not self.stop_event.wait(interval):
+            self.__flush()
+
+    def __flush(self):
+        """
+        Envia, em ordem, todos os eventos pendentes.
+        """
+        with self.lock:
+            events = self.pending_events
+            self.pending_events = []
+        for event in events:
+            self.__send(event)
+
+    def __send(self, event):
+        """
+        Executa um evento através do backend.
+
+        Args:
+            event (tuple): Evento, com o tipo na primeira posição e os argumentos em seguida
+        """
+        event_type = event[0]
+        if event_type == 'move':
+            self.backend.move(event[1], event[2])
+        elif event_type == 'click':
+            self.backend.click()
+        elif event_type == 'right_click':
+            self.backend.right_click()
+        elif event_type == 'left_down':
+            self.backend.left_down()
+        elif event_type == 'left_up':
+            self.backend.left_up()
+        elif event_type == 'scroll':
+            if event[1] == 0:
+                return
+            self.backend.scroll(event[1])
+        self.sent_events += 1
@@ -0,0 +1,135 @@
+import multiprocessing
+import queue
+import time
+import cv2
+import mediapipe as mp
+import numpy as np
+from frame_sources import open_frame_source
+from gesture_recognizer import landmarks_to_array
+from hand_arbiter import HandArbiter
+
+def _camera_worker(camera_id, source_spec, hands_settings, result_queue, stop_event):
+    """
+    Processo de inferência de uma câmera: lê os frames, detecta as mãos e envia os landmarks ao processo principal.
+    Quando a fila de resultados está cheia, o resultado do frame é descartado em vez de atrasar a câmera.
+    Ao terminar, envia (camera_id, None, None, None, descartes) para sinalizar o fim da câmera.
+
+    Args:
+        camera_id (int): Identificador da câmera
+        source_spec: Descrição da fonte de frames (ver open_frame_source)
+        hands_settings (dict): Parâmetros usados para construir o MediaPipe Hands
+        result_queue: Fila compartilhada com o estágio de arbitragem
+        stop_event: Evento que sinaliza o encerramento
+    """
+    hands = mp.solutions.hands.Hands(**hands_settings)
+    frame_source = open_frame_source(source_spec)
+    dropped_results = 0
+
+    try:
+        while not stop_event.is_set() and frame_source.is_opened():
+            success, image = frame_source.read()
+            if not success:
+                continue
+            capture_time = time.perf_counter()
+
+            results = hands.process(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+            if results.multi_hand_landmarks:
+                handedness = [hand.classification[0].label for hand in results.multi_handedness]
+                landmarks = np.stack([landmarks_to_array(hand) for hand in results.multi_hand_landmarks])
+            else:
+                handedness = []
+                landmarks = np.empty((0, 21, 3), dtype=np.float32)
+
+            try:
+                result_queue.put_nowait((camera_id, capture_time, handedness, landmarks, dropped_results))
+            except queue.Full:
+                dropped_results += 1
+    finally:
+        frame_source.release()
+        hands.close()
+        result_queue.put((camera_id, None, None, None, dropped_results))
+
+class MultiCameraTracker:
+    """
+    Classe responsável por rastrear várias mãos em uma ou mais câmeras.
+
+    Cada câmera tem o seu próprio processo de inferência, então a detecção escala com o número de
+    núcleos em vez de ficar limitada a uma única thread do Python. Os landmarks de todas as câmeras
+    chegam por uma fila a um único estágio de arbitragem, no processo principal, onde o HandArbiter
+    reconhece o gesto de cada mão e decide qual delas controla o mouse.
+    """
+
+    def __init__(self, camera_sources, gesture_recognizer, mouse_controller, max_num_hands=2, queue_size=None, cursor_output=None):
+        """
+        Inicializa o rastreador.
+
+        Args:
+            camera_sources (list): Descrições das fontes de frames, uma por câmera (ver open_frame_source)
+            gesture_recognizer: Instância de GestureRecognizer usada como modelo para os reconhecedores de cada mão
+            mouse_controller: Instância de MouseController
+            max_num_hands (int): Número máximo de mãos detectadas por câmera
+            queue_size (int): Tamanho máximo da fila de resultados. Se None, usa duas posições por câmera
+            cursor_output: Instância opcional de CursorOutput, que move o cursor na sua própria taxa
+        """
+        self.camera_sources = list(camera_sources)
+        self.hands_settings = {
+            'model_complexity': 0,
+            'max_num_hands': max_num_hands,
+            'min_detection_confidence': 0.8,
+            'min_tracking_confidence': 0.8,
+        }
+        self.arbiter = HandArbiter(gesture_recognizer, mouse_controller, cursor_output=cursor_output)
+        self.queue_size = queue_size or 2 * len(self.camera_sources)
+        self.processed_frames = 0
+        self.dropped_frames = 0
+
+    def run(self):
+        """
+        Inicia um processo de inferência por câmera e executa o estágio de arbitragem até que todas as câmeras
+        terminem ou o usuário interrompa com Ctrl+C.
+        """
+        context = multiprocessing.get_context('spawn')
+        result_queue = context.Queue(maxsize=self.queue_size)
+        stop_event = context.Event()
+        workers = [
+            context.Process(
+                target=_camera_worker,
+                args=(camera_id, source, self.hands_settings, result_queue, stop_event),
+                daemon=True
+            )
+            for camera_id, source in enumerate(self.camera_sources)
+        ]
+        for worker in workers:
+            worker.start()
+
+        running_cameras = len(workers)
+        try:
+            while running_cameras:
+                try:
+                    camera_id, capture_time, handedness, landmarks, dropped_results = result_queue.get(timeout=1)
+                except queue.Empty:
+                    # Um processo que terminou com erro nunca envia o sinal de fim
+                    if not any(worker.is_alive() for worker in workers):
+                        break
+                    continue
+                if capture_time is None:
+                    running_cameras -= 1
+                    self.dropped_frames += dropped_results
+                    continue
+                self.arbiter.process(camera_id, capture_time, handedness, landmarks)
+                self.processed_frames += 1
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop_event.set()
+            # Esvazia a fila para que os processos não fiquem bloqueados ao enviar o sinal de fim
+            while running_cameras:
+                try:
+                    item = result_queue.get(timeout=5)
+                except queue.Empty:
+                    break
+                if item[1] is None:
+                    running_cameras -= 1
+                    self.dropped_frames += item[4]
+            for worker in workers:
+                worker.join(timeout=5)
@@ -0,0 +1,62 @@
+import threading
+
+class LatestFrameSlot:
+    """
+    Slot de capacidade única usado entre o estágio de captura e o de inferência.
+    Cada novo frame substitui o anterior caso ele ainda não tenha sido consumido, de modo que
+    a inferência sempre trabalhe sobre o frame mais recente em vez de acumular atraso numa fila.
+    """
+
+    def __init__(self):
+        """
+        Inicializa o slot vazio e os contadores de frames.
+        """
+        self.condition = threading.Condition()
+        self.item = None
+        self.is_closed = False
+        self.put_frames = 0      # Total de frames colocados no slot
+        self.dropped_frames = 0  # Frames descartados por terem sido substituídos antes do consumo
+
+    def put(self, item):
+        """
+        Coloca um item no slot, descartando o item anterior se ele ainda não foi consumido.
+
+        Args:
+            item: Item a ser disponibilizado para o consumidor
+
+        Returns:
+            bool: True se um item anterior, ainda não consumido, foi descartado
+        """
+        with self.condition:
+            is_dropped = self.item is not None
+            if is_dropped:
+                self.dropped_frames += 1
+            self.item = item
+            self.put_frames += 1
+            self.condition.notify()
+            return is_dropped
+
+    def get(self, timeout=None):
+        """
+        Retira o item mais recente do slot, aguardando até que um esteja disponível.
+
+        Args:
+            timeout (float): Tempo máximo de espera em segundos. None aguarda indefinidamente
+
+        Returns:
+            O item mais recente, ou None se o slot foi fechado ou o tempo de espera acabou
+        """
+        with self.condition:
+            if self.item is None and not self.is_closed:
+                self.condition.wait(timeout)
+            item = self.item
+            self.item = None
+            return item
+
+    def close(self):
+        """
+        Fecha o slot e acorda qualquer consumidor que esteja aguardando.
+        """
+        with self.condition:
+            self.is_closed = True
+            self.condition.notify_all()
@@ -0,0 +1,234 @@
+import copy
+import math
+import time
+
+class PointerFilter:
+    """
+    Base dos filtros da posição do cursor.
+
+    Os filtros usam o instante real de cada amostra, então o resultado não depende da taxa da câmera,
+    e são inicializados com a primeira amostra, sem partir de (0, 0). Além de filtrar, cada filtro
+    estima a velocidade do cursor, usada para prever a posição prediction segundos à frente. Com
+    compensate_latency, a previsão inclui também a latência medida entre a captura do frame e o
+    envio ao mouse (ver observe_latency).
+    """
+
+    def __init__(self, prediction=0.0, compensate_latency=False, latency_smoothing=0.9):
+        """
+        Args:
+            prediction (float): Tempo, em segundos, que a posição é prevista à frente
+            compensate_latency (bool): Se True, soma à previsão a latência medida do pipeline
+            latency_smoothing (float): Peso da estimativa anterior na média móvel da latência
+        """
+        self.prediction = prediction
+        self.compensate_latency = compensate_latency
+        self.latency_smoothing = latency_smoothing
+        self.latency = 0.0
+        self.reset()
+
+    def reset(self):
+        """
+        Descarta o estado do filtro. A próxima amostra é usada como está.
+        """
+        self.last_timestamp = None
+        self.x = None
+        self.y = None
+        self.velocity_x = 0.0
+        self.velocity_y = 0.0
+
+    def clone(self):
+        """
+        Returns:
+            PointerFilter: Filtro do mesmo tipo e com os mesmos parâmetros, sem estado
+        """
+        pointer_filter = copy.copy(self)
+        pointer_filter.latency = 0.0
+        pointer_filter.reset()
+        return pointer_filter
+
+    def observe_latency(self, latency):
+        """
+        Registra a latência de um frame, entre a captura e o envio ao mouse.
+
+        Args:
+            latency (float): Latência em segundos
+        """
+        self.latency = self.latency * self.latency_smoothing + latency * (1 - self.latency_smoothing)
+
+    def update(self, x, y, timestamp=None):
+        """
+        Filtra uma amostra da posição.
+
+        Args:
+            x (float): Coordenada X medida
+            y (float): Coordenada Y medida
+            timestamp (float): Instante da amostra, em segundos. Se None, usa time.perf_counter()
+
+        Returns:
+            tuple: Posição (x, y) filtrada e prevista
+        """
+        timestamp = time.perf_counter() if timestamp is None else timestamp
+        if self.last_timestamp is None:
+            self.x, self.y = x, y
+            self.velocity_x = self.velocity_y = 0.0
+            self.start(x, y)
+        else:
+            dt = timestamp - self.last_timestamp
+            if dt > 0:
+                self.step(x, y, dt)
+        self.last_timestamp = timestamp
+
+        lead = self.prediction + (self.latency if self.compensate_latency else 0.0)
+        return self.x + self.velocity_x * lead, self.y + self.velocity_y * lead
+
+    def start(self, x, y):
+        """
+        Inicializa o estado específico do filtro com a primeira amostra.
+        """
+
+    def step(self, x, y, dt):
+        """
+        Atualiza self.x, self.y, self.velocity_x e self.velocity_y com uma nova amostra.
+
+        Args:
+            x (float): Coordenada X medida
+            y (float): Coordenada Y medida
+            dt (float): Tempo, em segundos, desde a amostra anterior
+        """
+        raise NotImplementedError
+
+class EmaFilter(PointerFilter):
+    """
+    Média móvel exponencial. O peso da posição anterior é ajustado pelo intervalo entre as amostras,
+    então smoothing_factor tem o mesmo efeito da suavização original a 30 FPS em qualquer taxa.
+    """
+
+    def __init__(self, smoothing_factor=0.8, reference_interval=1 / 30, **kwargs):
+        """
+        Args:
+            smoothing_factor (float): Peso da posição anterior num intervalo de reference_interval segundos
+            reference_interval (float): Intervalo em que smoothing_factor é aplicado exatamente
+        """
+        self.smoothing_factor = smoothing_factor
+        self.reference_interval = reference_interval
+        super().__init__(**kwargs)
+
+    def step(self, x, y, dt):
+        smoothing = self.smoothing_factor ** (dt / self.reference_interval)
+        new_x = self.x * smoothing + x * (1 - smoothing)
+        new_y = self.y * smoothing + y * (1 - smoothing)
+        # A velocidade é suavizada com o mesmo peso, para que a previsão não amplifique o tremor
+        self.velocity_x = self.velocity_x * smoothing + (new_x - self.x) / dt * (1 - smoothing)
+        self.velocity_y = self.velocity_y * smoothing + (new_y - self.y) / dt * (1 - smoothing)
+        self.x, self.y = new_x, new_y
+
+class OneEuroFilter(PointerFilter):
+    """
+    Filtro One-Euro (Casiez et al., 2012): uma média exponencial cuja frequência de corte cresce com a
+    velocidade. Com a mão parada, a suavização é forte e elimina o tremor; em movimentos rápidos, a
+    suavização diminui e o atraso cai.
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=1.0, derivative_cutoff=1.0, **kwargs):
+        """
+        Args:
+            min_cutoff (float): Frequência de corte, em Hz, com a mão parada. Valores menores reduzem o tremor
+            beta (float): Quanto a frequência de corte cresce com a velocidade. Valores maiores reduzem o atraso
+            derivative_cutoff (float): Frequência de corte, em Hz, da estimativa da velocidade
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.derivative_cutoff = derivative_cutoff
+        super().__init__(**kwargs)
+
+    def __alpha(self, cutoff, dt):
+        tau = 1 / (2 * math.pi * cutoff)
+        return 1 / (1 + tau / dt)
+
+    def step(self, x, y, dt):
+        derivative_alpha = self.__alpha(self.derivative_cutoff, dt)
+        self.velocity_x += derivative_alpha * ((x - self.x) / dt - self.velocity_x)
+        self.velocity_y += derivative_alpha * ((y - self.y) / dt - self.velocity_y)
+
+        speed = math.hypot(self.velocity_x, self.velocity_y)
+        alpha = self.__alpha(self.min_cutoff + self.beta * speed, dt)
+        self.x += alpha * (x - self.x)
+        self.y += alpha * (y - self.y)
+
+class KalmanFilter(PointerFilter):
+    """
+    Filtro de Kalman com modelo de velocidade constante, aplicado a cada eixo com a mesma covariância.
+    A aceleração da mão é tratada como ruído branco de intensidade process_noise.
+    """
+
+    def __init__(self, process_noise=0.02, measurement_noise=1e-5, **kwargs):
+        """
+        Args:
+            process_noise (float): Intensidade da aceleração aleatória, em (unidades normalizadas/s²)² por Hz.
+                Valores maiores seguem mudanças de direção mais rápido
+            measurement_noise (float): Variância do ruído de medição, em unidades normalizadas ao quadrado.
+                Valores maiores suavizam mais
+        """
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        super().__init__(**kwargs)
+
+    def start(self, x, y):
+        # Covariância [[posição, cruzada], [cruzada, velocidade]], igual nos dois eixos
+        self.covariance = [self.measurement_noise, 0.0, 0.0, 1.0]
+
+    def step(self, x, y, dt):
+        p00, p01, p10, p11 = self.covariance
+        q = self.process_noise
+
+        # Predição: posição += velocidade * dt
+        p00, p01, p10, p11 = (
+            p00 + dt * (p10 + p01) + dt * dt * p11 + q * dt ** 3 / 3,
+            p01 + dt * p11 + q * dt ** 2 / 2,
+            p10 + dt * p11 + q * dt ** 2 / 2,
+            p11 + q * dt,
+        )
+        predicted_x = self.x + self.velocity_x * dt
+        predicted_y = self.y + self.velocity_y * dt
+
+        # Correção com a posição medida
+        innovation_variance = p00 + self.measurement_noise
+        gain_position = p00 / innovation_variance
+        gain_velocity = p10 / innovation_variance
+        residual_x = x - predicted_x
+        residual_y = y - predicted_y
+        self.x = predicted_x + gain_position * residual_x
+        self.y = predicted_y + gain_position * residual_y
+        self.velocity_x += gain_velocity * residual_x
+        self.velocity_y += gain_velocity * residual_y
+        self.covariance = [
+            (1 - gain_position) * p00,
+            (1 - gain_position) * p01,
+            p10 - gain_velocity * p00,
+            p11 - gain_velocity * p01,
+        ]
+
+POINTER_FILTERS = {
+    'ema': EmaFilter,
+    'one_euro': OneEuroFilter,
+    'kalman': KalmanFilter,
+}
+
+def create_pointer_filter(spec, **kwargs):
+    """
+    Cria um filtro a partir de uma descrição textual, como as usadas na linha de comando.
+
+    Args:
+        spec (str): Nome do filtro, opcionalmente seguido de parâmetros: 'one_euro' ou 'one_euro:min_cutoff=0.5,beta=0.1'
+        **kwargs: Parâmetros adicionais, como prediction e compensate_latency
+
+    Returns:
+        PointerFilter: Filtro criado
+    """
+    name, _, params = spec.partition(':')
+    if name not in POINTER_FILTERS:
+        raise ValueError(f"Unknown pointer filter: {name}")
+    for param in filter(None, params.split(',')):
+        key, value = param.split('=')
+        kwargs[key] = float(value)
+    return POINTER_FILTERS[name](**kwargs)
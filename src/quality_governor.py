@@ -0,0 +1,186 @@
+import threading
+import numpy as np
+from metrics import RollingWindow
+
+class QualityLevel:
+    """
+    Configuração de qualidade da detecção: modelo do MediaPipe, resolução de entrada e limiares de confiança.
+    """
+
+    __slots__ = ('name', 'model_complexity', 'max_side', 'min_detection_confidence', 'min_tracking_confidence')
+
+    def __init__(self, name, model_complexity=0, max_side=None, min_detection_confidence=0.8, min_tracking_confidence=0.8):
+        """
+        Args:
+            name (str): Nome mostrado no terminal
+            model_complexity (int): Complexidade do modelo do MediaPipe Hands (0 ou 1)
+            max_side (int): Maior lado, em pixels, da imagem entregue ao MediaPipe. None para usar o tamanho original
+            min_detection_confidence (float): Confiança mínima da detecção da palma
+            min_tracking_confidence (float): Confiança mínima para continuar rastreando a mão sem uma nova detecção
+        """
+        self.name = name
+        self.model_complexity = model_complexity
+        self.max_side = max_side
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+
+    def hands_settings(self):
+        """
+        Returns:
+            dict: Parâmetros usados para construir o MediaPipe Hands
+        """
+        return {
+            'model_complexity': self.model_complexity,
+            'max_num_hands': 1,
+            'min_detection_confidence': self.min_detection_confidence,
+            'min_tracking_confidence': self.min_tracking_confidence,
+        }
+
+# Níveis padrão, do mais barato para o mais caro. 'medium' corresponde à configuração fixa usada antes do governador
+DEFAULT_QUALITY_LEVELS = (
+    QualityLevel('lowest', model_complexity=0, max_side=256, min_detection_confidence=0.7, min_tracking_confidence=0.7),
+    QualityLevel('low', model_complexity=0, max_side=384, min_detection_confidence=0.75, min_tracking_confidence=0.75),
+    QualityLevel('medium', model_complexity=0, max_side=None, min_detection_confidence=0.8, min_tracking_confidence=0.8),
+    QualityLevel('high', model_complexity=1, max_side=None, min_detection_confidence=0.8, min_tracking_confidence=0.8),
+)
+
+class QualityGovernor:
+    """
+    Classe responsável por escolher o nível de qualidade da detecção que mantém o tempo de processamento
+    de cada frame dentro do orçamento dado pelo FPS desejado.
+
+    O tempo de processamento dos frames é medido numa janela móvel. Se a média passar do orçamento, o
+    nível desce; se ficar abaixo de upgrade_ratio do orçamento, o nível sobe. A diferença entre os dois
+    limiares, o tempo mínimo entre trocas e a espera maior antes de voltar a um nível que acabou de ser
+    abandonado evitam que o nível fique oscilando.
+
+    O novo Hands é construído e aquecido numa thread, com a função fornecida pelo HandTracker, enquanto
+    o rastreamento continua com o Hands atual. O HandTracker troca os dois entre frames com take_ready_hands(),
+    então a reconstrução do grafo não trava o cursor. Até a troca, level continua sendo o nível do Hands em
+    uso; se a construção falhar, o nível pendente é descartado.
+    """
+
+    def __init__(self, target_fps, levels=DEFAULT_QUALITY_LEVELS, initial_level='medium', window_size=30,
+                 upgrade_ratio=0.6, hold_time=2.0, upgrade_backoff=30.0, is_logging=True):
+        """
+        Inicializa o governador.
+
+        Args:
+            target_fps (float): Taxa de frames desejada, que define o orçamento de tempo de cada frame
+            levels (tuple): Níveis de qualidade, do mais barato para o mais caro
+            initial_level (str): Nome do nível inicial
+            window_size (int): Número de frames da janela móvel. Nenhuma troca acontece antes da janela estar cheia
+            upgrade_ratio (float): Fração do orçamento abaixo da qual o nível sobe
+            hold_time (float): Tempo mínimo, em segundos, entre duas trocas
+            upgrade_backoff (float): Tempo, em segundos, antes de voltar a subir para um nível que acabou de ser abandonado
+            is_logging (bool): Se True, mostra cada troca de nível no terminal
+        """
+        self.levels = tuple(levels)
+        self.frame_budget = 1 / target_fps
+        self.upgrade_ratio = upgrade_ratio
+        self.hold_time = hold_time
+        self.upgrade_backoff = upgrade_backoff
+        self.is_logging = is_logging
+        self.window_size = window_size
+        self.frame_times = RollingWindow(window_size)
+
+        self.level_index = [level.name for level in self.levels].index(initial_level)
+        self.pending_level_index = None  # Nível cujo Hands está sendo construído
+        self.last_switch_time = None
+        self.blocked_until = [0.0] * len(self.levels)  # Instante a partir do qual cada nível pode voltar a ser escolhido ao subir
+        self.hands_factory = None
+        self.build_thread = None
+        self.ready_hands = None
+        self.switch_count = 0
+
+    @property
+    def level(self):
+        return self.levels[self.level_index]
+
+    def start(self, hands_factory):
+        """
+        Define a função que constrói o Hands de um nível.
+
+        Args:
+            hands_factory: Função que recebe um QualityLevel e retorna um Hands construído e aquecido
+        """
+        self.hands_factory = hands_factory
+
+    def update(self, now, frame_time):
+        """
+        Registra o tempo de processamento de um frame e, se necessário, inicia a troca de nível.
+
+        Args:
+            now (float): Instante do frame, em segundos
+            frame_time (float): Tempo de processamento do frame, em segundos
+        """
+        self.frame_times.add(frame_time)
+        if self.build_thread is not None or self.frame_times.count < self.window_size:
+            return
+        if self.last_switch_time is None:
+            self.last_switch_time = now
+        if now - self.last_switch_time < self.hold_time:
+            return
+
+        mean_frame_time = float(np.mean(self.frame_times.values()))
+        if mean_frame_time > self.frame_budget and self.level_index > 0:
+            self.blocked_until[self.level_index] = now + self.upgrade_backoff
+            self.__switch(self.level_index - 1, now, mean_frame_time)
+        elif (mean_frame_time < self.frame_budget * self.upgrade_ratio and self.level_index + 1 < len(self.levels)
+              and now >= self.blocked_until[self.level_index + 1]):
+            self.__switch(self.level_index + 1, now, mean_frame_time)
+
+    def __switch(self, level_index, now, mean_frame_time):
+        """
+        Inicia a troca para outro nível, construindo o seu Hands numa thread. O nível só passa a valer
+        em take_ready_hands(), quando o novo Hands entra em uso.
+        """
+        self.last_switch_time = now
+        if self.is_logging:
+            print(
+                f"Quality {self.level.name} -> {self.levels[level_index].name} "
+                f"(frame time {mean_frame_time * 1000:.1f} ms, budget {self.frame_budget * 1000:.1f} ms)"
+            )
+
+        if self.hands_factory is None:
+            self.__commit(level_index)
+            return
+        self.pending_level_index = level_index
+        self.build_thread = threading.Thread(target=self.__build, args=(self.levels[level_index],), daemon=True)
+        self.build_thread.start()
+
+    def __build(self, level):
+        """
+        Constrói o Hands do nível numa thread. Se a construção falhar, o nível pendente é descartado
+        e o Hands e o nível atuais continuam em uso.
+        """
+        try:
+            self.ready_hands = self.hands_factory(level)
+        except Exception as error:
+            print(f"Could not build quality level {level.name}, keeping {self.level.name}: {error}")
+            self.pending_level_index = None
+            self.build_thread = None
+
+    def __commit(self, level_index):
+        """
+        Passa a usar o nível e descarta os tempos medidos no nível anterior.
+        """
+        self.level_index = level_index
+        self.switch_count += 1
+        self.frame_times = RollingWindow(self.window_size)
+
+    def take_ready_hands(self):
+        """
+        Retorna o Hands do novo nível, se a construção já terminou. Chamado pelo HandTracker entre frames.
+
+        Returns:
+            Hands construído para o novo nível, que passa a ser o atual, ou None se não há troca pronta
+        """
+        hands = self.ready_hands
+        if hands is None:
+            return None
+        self.ready_hands = None
+        self.__commit(self.pending_level_index)
+        self.pending_level_index = None
+        self.build_thread = None
+        return hands
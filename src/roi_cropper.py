@@ -0,0 +1,79 @@
+import cv2
+import numpy as np
+
+class RoiCropper:
+    """
+    Classe responsável por recortar o frame ao redor da última posição conhecida da mão.
+
+    Em vez de enviar o frame inteiro ao MediaPipe, envia apenas uma região quadrada com margem
+    ao redor dos landmarks do frame anterior, reduzida para um tamanho alvo. Os landmarks detectados
+    no recorte são convertidos de volta para coordenadas normalizadas do frame inteiro.
+    """
+
+    def __init__(self, target_size=192, padding=0.6):
+        """
+        Inicializa o recortador.
+
+        Args:
+            target_size (int): Tamanho máximo, em pixels, do maior lado do recorte enviado ao MediaPipe
+            padding (float): Margem adicionada em cada lado da caixa da mão, em proporção ao seu maior lado
+        """
+        self.target_size = target_size
+        self.padding = padding
+
+    def crop(self, image, landmarks):
+        """
+        Recorta o frame ao redor dos landmarks do frame anterior.
+
+        Args:
+            image: Frame completo da webcam
+            landmarks (np.ndarray): Array (21, 3) com os landmarks do frame anterior, em coordenadas
+                normalizadas do frame inteiro. Se None, o frame inteiro é retornado
+
+        Returns:
+            tuple: Imagem recortada e reduzida, e a caixa (x, y, largura, altura) do recorte no frame,
+                ou None quando o frame inteiro foi retornado
+        """
+        if landmarks is None:
+            return image, None
+
+        frame_height, frame_width = image.shape[:2]
+        xs = landmarks[:, 0] * frame_width
+        ys = landmarks[:, 1] * frame_height
+
+        center_x = (xs.min() + xs.max()) / 2
+        center_y = (ys.min() + ys.max()) / 2
+        side = max(xs.max() - xs.min(), ys.max() - ys.min()) * (1 + 2 * self.padding)
+
+        x0 = int(max(0, center_x - side / 2))
+        y0 = int(max(0, center_y - side / 2))
+        x1 = int(min(frame_width, center_x + side / 2))
+        y1 = int(min(frame_height, center_y + side / 2))
+
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            return image, None
+
+        cropped = image[y0:y1, x0:x1]
+        scale = self.target_size / max(x1 - x0, y1 - y0)
+        if scale < 1:
+            size = (max(1, round((x1 - x0) * scale)), max(1, round((y1 - y0) * scale)))
+            cropped = cv2.resize(cropped, size, interpolation=cv2.INTER_AREA)
+        return np.ascontiguousarray(cropped), (x0, y0, x1 - x0, y1 - y0)
+
+    def to_frame_coordinates(self, multi_hand_landmarks, box, frame_shape):
+        """
+        Converte, no próprio objeto, os landmarks detectados no recorte para coordenadas normalizadas do frame inteiro.
+
+        Args:
+            multi_hand_landmarks: Lista de landmarks das mãos detectadas no recorte
+            box (tuple): Caixa (x, y, largura, altura) do recorte no frame
+            frame_shape (tuple): Dimensões do frame inteiro
+        """
+        x0, y0, width, height = box
+        frame_height, frame_width = frame_shape[:2]
+
+        for hand_landmarks in multi_hand_landmarks:
+            for landmark in hand_landmarks.landmark:
+                landmark.x = (landmark.x * width + x0) / frame_width
+                landmark.y = (landmark.y * height + y0) / frame_height
+                landmark.z = landmark.z * width / frame_width
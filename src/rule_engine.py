@@ -0,0 +1,131 @@
+import numpy as np
+
+class RuleEngine:
+    """
+    Avalia regras de gestos declaradas como dados sobre arrays de landmarks.
+
+    Cada regra é um par (gesto, condições), onde cada condição é uma tupla:
+    - ('y_gt', a, b): a coordenada y do landmark a é maior que a do landmark b
+    - ('y_lt', a, b): a coordenada y do landmark a é menor que a do landmark b
+    - ('distance_lt', a, b, limiar): a distância (x, y) entre os landmarks a e b é menor que o limiar
+    - ('distance_lt', a, b, limiar, parâmetro): o mesmo, registrando o nome do parâmetro que define o limiar,
+      para que os limiares possam ser variados depois (ver parameter_indices e evaluate_grid)
+
+    As regras são compiladas uma única vez em arrays de índices, e todas as condições de todas as
+    regras são avaliadas de uma vez, de forma vetorizada, para um lote inteiro de frames.
+    As regras são testadas na ordem em que foram declaradas e a primeira satisfeita define o gesto.
+    """
+
+    def __init__(self, rules, default_gesture):
+        """
+        Compila as regras.
+
+        Args:
+            rules (list): Lista ordenada de pares (gesto, lista de condições)
+            default_gesture (int): Gesto retornado quando nenhuma regra é satisfeita
+        """
+        self.default_gesture = default_gesture
+        self.gestures = np.array([gesture for gesture, _ in rules], dtype=np.int32)
+
+        comparisons = []
+        distances = []
+        for _, conditions in rules:
+            for condition in conditions:
+                if condition[0] in ('y_gt', 'y_lt'):
+                    if condition not in comparisons:
+                        comparisons.append(condition)
+                elif condition[0] == 'distance_lt':
+                    if condition not in distances:
+                        distances.append(condition)
+                else:
+                    raise ValueError(f"Unknown condition type: {condition[0]}")
+
+        # Comparações em y: sign * (y[a] - y[b]) > 0
+        self.comparison_a = np.array([c[1] for c in comparisons], dtype=np.intp)
+        self.comparison_b = np.array([c[2] for c in comparisons], dtype=np.intp)
+        self.comparison_sign = np.array([1.0 if c[0] == 'y_gt' else -1.0 for c in comparisons], dtype=np.float32)
+
+        # Distâncias no plano (x, y): |p[a] - p[b]| < limiar
+        self.distance_a = np.array([c[1] for c in distances], dtype=np.intp)
+        self.distance_b = np.array([c[2] for c in distances], dtype=np.intp)
+        self.distance_thresholds = np.array([c[3] for c in distances], dtype=np.float32)
+        self.distance_parameters = [c[4] if len(c) > 4 else None for c in distances]
+
+        # Matriz (regras x condições) indicando quais condições cada regra exige
+        conditions = comparisons + distances
+        self.rule_mask = np.zeros((len(rules), len(conditions)), dtype=np.float32)
+        for rule_index, (_, rule_conditions) in enumerate(rules):
+            for condition in rule_conditions:
+                self.rule_mask[rule_index, conditions.index(condition)] = 1.0
+        self.rule_sizes = self.rule_mask.sum(axis=1)
+
+    def parameter_indices(self, name):
+        """
+        Localiza as condições de distância cujo limiar é definido por um parâmetro.
+
+        Args:
+            name (str): Nome do parâmetro, como declarado nas condições
+
+        Returns:
+            np.ndarray: Índices, na ordem de distance_thresholds, das condições que usam o parâmetro
+        """
+        return np.array([index for index, parameter in enumerate(self.distance_parameters) if parameter == name], dtype=np.intp)
+
+    def evaluate_conditions(self, landmarks):
+        """
+        Avalia todas as condições compiladas para um lote de frames.
+
+        Args:
+            landmarks (np.ndarray): Array (N, 21, 3) com os landmarks de cada frame
+
+        Returns:
+            np.ndarray: Array booleano (N, número de condições)
+        """
+        y = landmarks[:, :, 1]
+        comparisons = self.comparison_sign * (y[:, self.comparison_a] - y[:, self.comparison_b]) > 0
+
+        deltas = landmarks[:, self.distance_a, :2] - landmarks[:, self.distance_b, :2]
+        distances = np.sqrt(np.einsum('ndk,ndk->nd', deltas, deltas)) < self.distance_thresholds
+
+        return np.concatenate((comparisons, distances), axis=1)
+
+    def evaluate(self, landmarks):
+        """
+        Classifica um lote de frames.
+
+        Args:
+            landmarks (np.ndarray): Array (N, 21, 3) com os landmarks de cada frame
+
+        Returns:
+            np.ndarray: Array (N,) com o código do gesto de cada frame
+        """
+        conditions = self.evaluate_conditions(landmarks).astype(np.float32)
+        satisfied = (conditions @ self.rule_mask.T) == self.rule_sizes
+        return np.where(satisfied.any(axis=1), self.gestures[satisfied.argmax(axis=1)], self.default_gesture)
+
+    def evaluate_grid(self, landmarks, distance_thresholds):
+        """
+        Classifica um lote de frames com várias combinações de limiares de distância de uma só vez.
+        As comparações e as distâncias são calculadas uma única vez e comparadas com todos os limiares por broadcast.
+
+        Args:
+            landmarks (np.ndarray): Array (N, 21, 3) com os landmarks de cada frame
+            distance_thresholds (np.ndarray): Array (G, número de condições de distância) com os limiares de cada
+                combinação, na ordem de distance_a e distance_b
+
+        Returns:
+            np.ndarray: Array (G, N) com o código do gesto de cada frame em cada combinação
+        """
+        distance_thresholds = np.asarray(distance_thresholds, dtype=np.float32)
+        y = landmarks[:, :, 1]
+        comparisons = self.comparison_sign * (y[:, self.comparison_a] - y[:, self.comparison_b]) > 0
+
+        deltas = landmarks[:, self.distance_a, :2] - landmarks[:, self.distance_b, :2]
+        distances = np.sqrt(np.einsum('ndk,ndk->nd', deltas, deltas))
+
+        # A parte das comparações é igual em todas as combinações; só a das distâncias depende dos limiares
+        comparison_counts = comparisons.astype(np.float32) @ self.rule_mask[:, :len(self.comparison_a)].T
+        distance_conditions = (distances[np.newaxis] < distance_thresholds[:, np.newaxis, :]).astype(np.float32)
+        distance_counts = distance_conditions @ self.rule_mask[:, len(self.comparison_a):].T
+        satisfied = (comparison_counts[np.newaxis] + distance_counts) == self.rule_sizes
+        return np.where(satisfied.any(axis=2), self.gestures[satisfied.argmax(axis=2)], self.default_gesture)
@@ -0,0 +1,175 @@
+import numpy as np
+from gesture_recognizer import HandLandmark
+from landmark_recorder import LandmarkReplay
+
+# Número máximo de elementos (frames x templates) da matriz de distâncias calculada de uma vez, para limitar a memória usada
+DISTANCE_CHUNK_ELEMENTS = 4_000_000
+
+def normalize_landmarks(landmarks):
+    """
+    Normaliza os landmarks para que a posição e o tamanho da mão no frame não influenciem a classificação.
+    As coordenadas (x, y) passam a ser relativas ao pulso e são divididas pela distância entre o pulso e a base
+    do dedo médio. A orientação é mantida, já que gestos como os de scroll só diferem pela direção dos dedos.
+
+    Args:
+        landmarks (np.ndarray): Array (N, 21, 3) ou (21, 3) com os landmarks de cada frame
+
+    Returns:
+        np.ndarray: Array float32 (N, 42) ou (42,) com as coordenadas normalizadas
+    """
+    points = np.asarray(landmarks, dtype=np.float32)[..., :2]
+    centered = points - points[..., HandLandmark.WRIST:HandLandmark.WRIST + 1, :]
+    scale = np.sqrt((centered[..., HandLandmark.MIDDLE_FINGER_MCP, :] ** 2).sum(axis=-1))
+    normalized = centered / np.maximum(scale, 1e-6)[..., np.newaxis, np.newaxis]
+    return normalized.reshape(points.shape[:-2] + (-1,))
+
+class TemplateClassifier:
+    """
+    Classifica gestos pela distância entre os landmarks normalizados do frame e gestos de referência
+    (templates) extraídos de exemplos rotulados, em vez de regras escritas à mão.
+
+    Os templates ficam num único array contíguo, junto com as suas normas já calculadas, então as
+    distâncias de um lote de frames a todos os templates saem de uma única multiplicação de matrizes:
+    |f - t|² = |f|² - 2 f·t + |t|². O índice pode ter um centróide por gesto (o mais rápido, com custo
+    que não cresce com o número de exemplos) ou todos os exemplos (vizinho mais próximo).
+
+    Tem o mesmo método evaluate do RuleEngine, então pode ser usado no GestureRecognizer no lugar das regras.
+    """
+
+    METHODS = ('centroids', 'nearest')
+
+    def __init__(self, templates, template_gestures, default_gesture=0, max_distance=None):
+        """
+        Args:
+            templates (np.ndarray): Array (M, 42) com os landmarks normalizados de cada template
+            template_gestures (np.ndarray): Array (M,) com o gesto de cada template
+            default_gesture (int): Gesto retornado quando o template mais próximo está a mais de max_distance
+            max_distance (float): Distância máxima, nas coordenadas normalizadas, até o template mais próximo.
+                Se None, o gesto do template mais próximo é sempre aceito
+        """
+        self.templates = np.ascontiguousarray(templates, dtype=np.float32)
+        self.template_gestures = np.asarray(template_gestures, dtype=np.int32)
+        self.template_norms = (self.templates ** 2).sum(axis=1)
+        self.default_gesture = default_gesture
+        self.max_distance = max_distance
+
+    @classmethod
+    def fit(cls, landmarks, labels, method='centroids', max_templates_per_gesture=None, **kwargs):
+        """
+        Monta o índice a partir de exemplos rotulados.
+
+        Args:
+            landmarks (np.ndarray): Array (N, 21, 3) com os landmarks de cada exemplo
+            labels (np.ndarray): Array (N,) com o gesto de cada exemplo
+            method (str): 'centroids' para um template por gesto, com a média dos exemplos, ou 'nearest' para usar todos os exemplos
+            max_templates_per_gesture (int): Com 'nearest', limita o número de templates de cada gesto, escolhendo exemplos
+                espaçados uniformemente. O custo de cada frame cresce com o número de templates
+            **kwargs: Parâmetros do construtor, como max_distance
+
+        Returns:
+            TemplateClassifier: Classificador montado
+        """
+        if method not in cls.METHODS:
+            raise ValueError(f"Unknown template method: {method}")
+        features = normalize_landmarks(landmarks)
+        labels = np.asarray(labels)
+        gestures = np.unique(labels)
+        if method == 'nearest':
+            if max_templates_per_gesture is not None:
+                selected = []
+                for gesture in gestures:
+                    indices = np.flatnonzero(labels == gesture)
+                    if len(indices) > max_templates_per_gesture:
+                        indices = indices[np.linspace(0, len(indices) - 1, max_templates_per_gesture).astype(np.intp)]
+                    selected.append(indices)
+                features = features[np.concatenate(selected)]
+                labels = labels[np.concatenate(selected)]
+            return cls(features, labels, **kwargs)
+        centroids = np.stack([features[labels == gesture].mean(axis=0) for gesture in gestures]) if len(gestures) else features[:0]
+        return cls(centroids, gestures, **kwargs)
+
+    @classmethod
+    def from_recordings(cls, recordings, method='centroids', **kwargs):
+        """
+        Monta o índice a partir de gravações do LandmarkRecorder com rótulos, como as geradas por tester.py --record
+        a partir dos diretórios de imagens rotuladas. Frames sem mão detectada ou sem rótulo são ignorados.
+
+        Args:
+            recordings (list): Pares (diretório, rótulo), com rótulo None para usar os rótulos gravados
+
+        Returns:
+            TemplateClassifier: Classificador montado
+        """
+        landmarks = []
+        labels = []
+        for path, label in recordings:
+            replay = LandmarkReplay(path)
+            recording_labels = np.asarray(replay.labels) if label is None else np.full(len(replay), label)
+            valid = replay.detected & (recording_labels >= 0)
+            landmarks.append(np.asarray(replay.landmarks[valid], dtype=np.float32))
+            labels.append(recording_labels[valid])
+        return cls.fit(np.concatenate(landmarks), np.concatenate(labels), method, **kwargs)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Carrega um índice gravado por save.
+
+        Args:
+            path (str): Arquivo .npz
+
+        Returns:
+            TemplateClassifier: Classificador carregado
+        """
+        with np.load(path) as data:
+            max_distance = float(data['max_distance'])
+            return cls(
+                data['templates'], data['template_gestures'], int(data['default_gesture']),
+                None if np.isnan(max_distance) else max_distance
+            )
+
+    def save(self, path):
+        """
+        Grava o índice num arquivo .npz.
+
+        Args:
+            path (str): Caminho do arquivo
+        """
+        np.savez(
+            path, templates=self.templates, template_gestures=self.template_gestures, default_gesture=self.default_gesture,
+            max_distance=np.nan if self.max_distance is None else self.max_distance
+        )
+
+    def evaluate(self, landmarks):
+        """
+        Classifica um lote de frames. Lotes grandes são divididos para que a matriz de distâncias caiba em DISTANCE_CHUNK_ELEMENTS.
+
+        Args:
+            landmarks (np.ndarray): Array (N, 21, 3) com os landmarks de cada frame
+
+        Returns:
+            np.ndarray: Array (N,) com o código do gesto de cada frame
+        """
+        features = normalize_landmarks(landmarks)
+        chunk = max(1, DISTANCE_CHUNK_ELEMENTS // max(1, len(self.templates)))
+        if len(features) <= chunk:
+            return self.__classify(features)
+        return np.concatenate([self.__classify(features[start:start + chunk]) for start in range(0, len(features), chunk)])
+
+    def __classify(self, features):
+        """
+        Classifica frames já normalizados.
+
+        Args:
+            features (np.ndarray): Array (N, 42) com os landmarks normalizados
+
+        Returns:
+            np.ndarray: Array (N,) com o código do gesto de cada frame
+        """
+        distances = self.template_norms - 2 * (features @ self.templates.T)  # Falta |f|², que não muda o mais próximo
+        nearest = distances.argmin(axis=1)
+        gestures = self.template_gestures[nearest]
+        if self.max_distance is not None:
+            squared_distances = distances[np.arange(len(features)), nearest] + (features ** 2).sum(axis=1)
+            gestures = np.where(squared_distances > self.max_distance ** 2, self.default_gesture, gestures)
+        return gestures
@@ -0,0 +1,120 @@
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from frame_sources import open_frame_source
+from gesture_recognizer import GestureRecognizer
+from hand_tracker import HandTracker
+from mouse_backends import NullBackend
+from mouse_controller import MouseController
+
+class TracedFrameSource:
+    """
+    Envolve uma fonte de frames e mede, com o tracemalloc, a memória alocada pelo HandTracker entre duas leituras.
+
+    Para cada frame após o aquecimento, grava o pico de memória transitória (o quanto a memória subiu
+    durante o processamento do frame) e, ao final, o crescimento líquido desde o fim do aquecimento.
+    """
+
+    def __init__(self, frame_source, warmup_frames):
+        """
+        Args:
+            frame_source (FrameSource): Fonte de frames envolvida
+            warmup_frames (int): Frames ignorados no início, enquanto buffers e caches são criados
+        """
+        self.frame_source = frame_source
+        self.warmup_frames = warmup_frames
+        self.frames_read = 0
+        self.peaks = []
+        self.baseline = None
+        self.last_current = None
+
+    def is_opened(self):
+        return self.frame_source.is_opened()
+
+    def read(self, image=None):
+        current, peak = tracemalloc.get_traced_memory()
+        if self.frames_read == self.warmup_frames:
+            self.baseline = current
+        elif self.frames_read > self.warmup_frames:
+            self.peaks.append(peak - self.last_current)
+
+        result = self.frame_source.read(image)
+        self.frames_read += 1
+
+        tracemalloc.reset_peak()
+        self.last_current = tracemalloc.get_traced_memory()[0]
+        return result
+
+    def release(self):
+        self.frame_source.release()
+
+    def growth(self):
+        """
+        Returns:
+            int: Crescimento líquido, em bytes, da memória rastreada desde o fim do aquecimento
+        """
+        if self.baseline is None:
+            return 0
+        return tracemalloc.get_traced_memory()[0] - self.baseline
+
+def check_allocations(clip, frame_count=300, warmup_frames=30, roi_size=None, reuse_buffers=True):
+    """
+    Roda o HandTracker sobre um clip com o tracemalloc ativo e mede as alocações por frame em regime estável.
+
+    Args:
+        clip (str): Arquivo de vídeo, diretório de imagens ou 'synthetic'
+        frame_count (int): Número de frames da fonte sintética
+        warmup_frames (int): Frames ignorados no início da medição
+        roi_size (int): Tamanho do recorte ao redor da mão, ou None para usar o frame inteiro
+        reuse_buffers (bool): Se True, usa o modo de reaproveitamento de buffers do HandTracker
+
+    Returns:
+        dict: Número de frames medidos, pico transitório máximo e mediano por frame e crescimento líquido, em bytes
+    """
+    frame_source = TracedFrameSource(open_frame_source(clip, frame_count=frame_count), warmup_frames)
+    hand_tracker = HandTracker(
+        GestureRecognizer(),
+        MouseController(backend=NullBackend()),
+        roi_size=roi_size,
+        frame_source=frame_source,
+        reuse_buffers=reuse_buffers
+    )
+
+    tracemalloc.start()
+    try:
+        hand_tracker.run()
+        growth = frame_source.growth()
+    finally:
+        tracemalloc.stop()
+
+    peaks = sorted(frame_source.peaks)
+    return {
+        'frames': len(peaks),
+        'max_peak_bytes': peaks[-1] if peaks else 0,
+        'median_peak_bytes': peaks[len(peaks) // 2] if peaks else 0,
+        'growth_bytes': growth,
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Verifica se as alocações por frame do HandTracker ficam dentro de um orçamento")
+    parser.add_argument("clip", nargs="?", default="synthetic", help="Arquivo de vídeo, diretório de imagens ou 'synthetic'")
+    parser.add_argument("--frames", type=int, default=300, help="Número de frames da fonte sintética")
+    parser.add_argument("--warmup", type=int, default=30, help="Frames ignorados no início da medição")
+    parser.add_argument("--roi-size", type=int, help="Processa apenas um recorte ao redor da mão")
+    parser.add_argument("--no-reuse", action="store_true", help="Desabilita o reaproveitamento de buffers, para comparação")
+    parser.add_argument("--peak-budget", type=int, default=64 * 1024, help="Pico transitório máximo por frame, em bytes")
+    parser.add_argument("--growth-budget", type=int, default=256 * 1024, help="Crescimento líquido máximo após o aquecimento, em bytes")
+    args = parser.parse_args()
+
+    result = check_allocations(args.clip, args.frames, args.warmup, args.roi_size, not args.no_reuse)
+    print(f"Frames measured: {result['frames']}")
+    print(f"Per-frame peak: median {result['median_peak_bytes']} B, max {result['max_peak_bytes']} B (budget {args.peak_budget} B)")
+    print(f"Net growth: {result['growth_bytes']} B (budget {args.growth_budget} B)")
+
+    if result['max_peak_bytes'] > args.peak_budget or result['growth_bytes'] > args.growth_budget:
+        print("FAIL")
+        sys.exit(1)
+    print("OK")
@@ -0,0 +1,127 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from mouse_backends import MOUSE_BACKENDS, create_mouse_backend
+from mouse_controller import MouseController
+
+def start_xvfb(display, size=(1920, 1080), timeout=5.0):
+    """
+    Inicia um servidor Xvfb local e espera até que ele aceite conexões.
+
+    Args:
+        display (str): Nome do display, como ':99'
+        size (tuple): Largura e altura da tela virtual
+        timeout (float): Tempo máximo de espera, em segundos
+
+    Returns:
+        subprocess.Popen: Processo do servidor
+    """
+    server = subprocess.Popen(
+        ['Xvfb', display, '-screen', '0', f'{size[0]}x{size[1]}x24', '-nolisten', 'tcp'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    socket_path = f'/tmp/.X11-unix/X{display.lstrip(":").split(".")[0]}'
+    deadline = time.perf_counter() + timeout
+    while not os.path.exists(socket_path):
+        if server.poll() is not None or time.perf_counter() > deadline:
+            server.kill()
+            raise RuntimeError(f"Xvfb did not start on {display}")
+        time.sleep(0.05)
+    os.environ['DISPLAY'] = display
+    return server
+
+def benchmark_backend(name, event_count=5000, is_syncing=False, frame_budget=1 / 30):
+    """
+    Mede o custo de mover o cursor com um backend, pelo caminho do MouseController.move_cursor.
+
+    Args:
+        name (str): Nome do backend, como em MOUSE_BACKENDS
+        event_count (int): Número de movimentos medidos, depois de um aquecimento
+        is_syncing (bool): Se True e o backend suportar, espera o servidor processar cada evento antes de
+            medir o próximo, de modo que a latência inclui o processamento no servidor X
+        frame_budget (float): Tempo, em segundos, de um frame, usado para calcular a fração dele gasta com um movimento
+
+    Returns:
+        dict: Eventos por segundo, latência por evento em microssegundos (média e percentis), fração do
+            tempo de um frame e se a posição final do cursor confere com a pedida
+    """
+    backend = create_mouse_backend(name)
+    mouse_controller = MouseController(backend=backend)
+    sync = getattr(backend, 'sync', None) if is_syncing else None
+
+    # Posições alternadas, para que nenhum movimento seja descartado como repetido
+    positions = np.stack([np.linspace(0.25, 0.75, event_count), np.linspace(0.75, 0.25, event_count)], axis=1).tolist()
+    for x, y in positions[:100]:
+        mouse_controller.move_cursor(x, y)
+
+    latencies = np.empty(event_count)
+    start_time = time.perf_counter()
+    for index, (x, y) in enumerate(positions):
+        event_start = time.perf_counter()
+        mouse_controller.move_cursor(x, y)
+        if sync is not None:
+            sync()
+        latencies[index] = time.perf_counter() - event_start
+    total_time = time.perf_counter() - start_time
+
+    position_matches = None
+    if name == 'xtest':
+        backend.sync()
+        pointer = backend.display.screen().root.query_pointer()
+        position_matches = (pointer.root_x, pointer.root_y) == mouse_controller.last_position
+
+    mouse_controller.close()
+    latencies *= 1e6
+    p50, p99 = np.percentile(latencies, [50, 99])
+    return {
+        'backend': name,
+        'events': event_count,
+        'synced': sync is not None,
+        'events_per_s': event_count / total_time,
+        'latency_us': {'mean': float(latencies.mean()), 'p50': float(p50), 'p99': float(p99), 'max': float(latencies.max())},
+        'frame_budget_fraction': float(latencies.mean() / 1e6 / frame_budget),
+        'position_matches': position_matches,
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Mede eventos por segundo e latência por evento dos backends do mouse")
+    parser.add_argument("--backends", nargs="+", choices=list(MOUSE_BACKENDS), default=['null', 'pyautogui', 'xtest'], help="Backends medidos")
+    parser.add_argument("--events", type=int, default=5000, help="Número de movimentos medidos por backend")
+    parser.add_argument("--xvfb", metavar="DISPLAY", help="Inicia um Xvfb nesse display (por exemplo :99) e mede nele, sem mover o cursor da tela real")
+    parser.add_argument("--sync", action="store_true", help="Espera o servidor X processar cada evento (apenas xtest), medindo a latência de ponta a ponta")
+    parser.add_argument("--fps", type=float, default=30, help="Taxa de frames usada para calcular a fração do tempo de um frame gasta por movimento")
+    parser.add_argument("--output", help="Arquivo JSON onde os resultados serão salvos")
+    args = parser.parse_args()
+
+    server = start_xvfb(args.xvfb) if args.xvfb else None
+    try:
+        results = []
+        for name in args.backends:
+            try:
+                results.append(benchmark_backend(name, args.events, args.sync, 1 / args.fps))
+            except Exception as error:  # Backend indisponível: sem servidor X, sem o módulo ou sem permissão
+                print(f"Skipping {name}: {error}")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(f"{'backend':<10} {'events/s':>10} {'mean us':>9} {'p50 us':>9} {'p99 us':>9} {'% frame':>8}")
+    for result in results:
+        latency = result['latency_us']
+        print(
+            f"{result['backend']:<10} {result['events_per_s']:>10.0f} {latency['mean']:>9.1f} {latency['p50']:>9.1f} "
+            f"{latency['p99']:>9.1f} {result['frame_budget_fraction'] * 100:>7.2f}%"
+        )
+        if result['position_matches'] is False:
+            print(f"  {result['backend']}: final cursor position does not match the requested one")
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
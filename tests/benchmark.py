@@ -0,0 +1,131 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from frame_sources import open_frame_source
+from gesture_recognizer import GestureRecognizer
+from hand_tracker import HandTracker
+from metrics import Metrics
+from mouse_backends import RecordingBackend
+from mouse_controller import MouseController
+
+def get_git_commit():
+    """
+    Returns:
+        str: Hash do commit atual do repositório, ou None se não for possível obtê-lo
+    """
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_benchmark(clip, frame_count=300, fps=None, is_pipelined=False, roi_size=None):
+    """
+    Reproduz um clip pelo caminho completo HandTracker -> GestureRecognizer -> MouseController,
+    com um backend de mouse que apenas grava os eventos.
+
+    Args:
+        clip (str): Arquivo de vídeo, diretório de imagens ou 'synthetic'
+        frame_count (int): Número de frames da fonte sintética
+        fps (float): Taxa de entrega dos frames. No modo em pipeline, frames que chegam enquanto a
+            inferência está ocupada são descartados, então uma fonte sem taxa definida mede apenas o pior caso
+        is_pipelined (bool): Se True, usa o modo em pipeline do HandTracker
+        roi_size (int): Tamanho do recorte ao redor da mão, ou None para usar o frame inteiro
+
+    Returns:
+        dict: Resultado do benchmark, pronto para ser gravado em JSON
+    """
+    metrics = Metrics(window_size=100000, report_interval=float('inf'), is_logging=False)
+    backend = RecordingBackend()
+    mouse_controller = MouseController(backend=backend)
+    hand_tracker = HandTracker(
+        GestureRecognizer(),
+        mouse_controller,
+        roi_size=roi_size,
+        metrics=metrics,
+        frame_source=open_frame_source(clip, fps=fps, frame_count=frame_count)
+    )
+
+    hand_tracker.wait_until_ready()
+
+    start_wall_time = time.perf_counter()
+    start_cpu_time = time.process_time()
+    hand_tracker.run(is_pipelined=is_pipelined)
+    wall_time = time.perf_counter() - start_wall_time
+    cpu_time = time.process_time() - start_cpu_time
+    mouse_controller.close()
+
+    snapshot = metrics.snapshot()
+    frames = snapshot['frames']
+    return {
+        'commit': get_git_commit(),
+        'clip': clip,
+        'fps': fps,
+        'is_pipelined': is_pipelined,
+        'roi_size': roi_size,
+        'frames': frames,
+        'dropped_frames': snapshot['dropped_frames'],
+        'wall_time_s': wall_time,
+        'throughput_fps': frames / wall_time if wall_time > 0 else 0.0,
+        'cpu_time_s': cpu_time,
+        'cpu_time_per_frame_ms': cpu_time / frames * 1000 if frames else 0.0,
+        'startup_s': hand_tracker.ready_time,
+        'first_cursor_move_s': hand_tracker.first_move_time,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'mouse_events': len(backend.events),
+        'stages': snapshot['stages'],
+    }
+
+def print_comparison(result, baseline):
+    """
+    Imprime a variação das principais medidas em relação a um resultado anterior.
+
+    Args:
+        result (dict): Resultado atual
+        baseline (dict): Resultado de referência, por exemplo de outro commit
+    """
+    rows = [
+        ('throughput_fps', result['throughput_fps'], baseline['throughput_fps']),
+        ('cpu_time_per_frame_ms', result['cpu_time_per_frame_ms'], baseline['cpu_time_per_frame_ms']),
+        ('peak_rss_mb', result['peak_rss_mb'], baseline['peak_rss_mb']),
+    ]
+    for stage in ('latency', 'process'):
+        if stage in result['stages'] and stage in baseline['stages']:
+            for percentile in ('p50_ms', 'p95_ms', 'p99_ms'):
+                rows.append((f'{stage}.{percentile}', result['stages'][stage][percentile], baseline['stages'][stage][percentile]))
+
+    for name, current, previous in rows:
+        change = (current - previous) / previous * 100 if previous else 0.0
+        print(f'{name:>24}: {previous:10.2f} -> {current:10.2f} ({change:+.1f}%)')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark de ponta a ponta do Handy Input")
+    parser.add_argument("clip", help="Arquivo de vídeo, diretório de imagens ou 'synthetic'")
+    parser.add_argument("--frames", type=int, default=300, help="Número de frames da fonte sintética")
+    parser.add_argument("--fps", type=float, help="Entrega os frames nessa taxa, imitando uma câmera")
+    parser.add_argument("--pipelined", action="store_true", help="Usa o modo em pipeline do HandTracker")
+    parser.add_argument("--roi-size", type=int, help="Processa apenas um recorte ao redor da mão")
+    parser.add_argument("--output", help="Arquivo JSON onde o resultado será gravado")
+    parser.add_argument("--compare", help="Arquivo JSON de um resultado anterior para comparação")
+    args = parser.parse_args()
+
+    result = run_benchmark(args.clip, args.frames, args.fps, args.pipelined, args.roi_size)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(result, file, indent=2)
+    else:
+        print(json.dumps(result, indent=2))
+
+    if args.compare:
+        with open(args.compare) as file:
+            print_comparison(result, json.load(file))
@@ -0,0 +1,99 @@
+import argparse
+import json
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from gesture_recognizer import GestureRecognizer
+from landmark_recorder import LandmarkReplay
+from template_classifier import TemplateClassifier
+from tester import Tester
+
+def parse_recordings(values):
+    """
+    Returns:
+        list: Pares (diretório, rótulo) a partir de valores DIR[:LABEL], com rótulo None para usar os rótulos gravados
+    """
+    recordings = []
+    for value in values:
+        path, label = value.rsplit(':', 1) if ':' in value else (value, None)
+        recordings.append((path, None if label is None else int(label)))
+    return recordings
+
+def time_single_frames(gesture_recognizer, recordings, max_frames=2000):
+    """
+    Mede o tempo de reconhecer um frame de cada vez, como no HandTracker, em vez de em lote.
+
+    Returns:
+        float: Tempo médio por frame em microssegundos
+    """
+    replays = [LandmarkReplay(path) for path, _ in recordings]
+    frames = np.concatenate([np.asarray(replay.landmarks[replay.detected], dtype=np.float32) for replay in replays])[:max_frames]
+    if not len(frames):
+        return 0.0
+    gesture_recognizer.recognize_array(frames[0])
+    start_time = time.perf_counter()
+    for landmarks in frames:
+        gesture_recognizer.recognize_array(landmarks)
+    return 1e6 * (time.perf_counter() - start_time) / len(frames)
+
+def evaluate(name, gesture_recognizer, recordings):
+    """
+    Avalia um reconhecedor com o Tester nas gravações de teste.
+
+    Returns:
+        dict: Nome, relatório do Tester e tempo por frame no reconhecimento um frame de cada vez
+    """
+    tester = Tester(gesture_recognizer)
+    for path, label in recordings:
+        tester.load_landmarks(path, label)
+    tester.classify_images()
+    return {
+        'classifier': name,
+        'report': tester.get_report(),
+        'single_frame_us': time_single_frames(gesture_recognizer, recordings),
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compara o reconhecimento por regras com o classificador por templates")
+    parser.add_argument("--train", nargs="+", required=True, metavar="DIR[:LABEL]", help="Gravações rotuladas usadas para montar os templates (por exemplo, de tester.py --record)")
+    parser.add_argument("--test", nargs="+", metavar="DIR[:LABEL]", help="Gravações rotuladas usadas na avaliação. Se omitido, avalia nas gravações de treino, o que superestima a acurácia dos templates")
+    parser.add_argument("--methods", nargs="+", choices=TemplateClassifier.METHODS, default=list(TemplateClassifier.METHODS), help="Índices de templates avaliados")
+    parser.add_argument("--max-templates", type=int, default=200, help="Número máximo de templates por gesto no método nearest")
+    parser.add_argument("--max-distance", type=float, help="Distância máxima até o template mais próximo; acima dela, o frame fica sem gesto")
+    parser.add_argument("--save", metavar="PATH", help="Grava em .npz o índice do primeiro método, para tester.py --templates e main.py --templates")
+    parser.add_argument("--output", help="Arquivo JSON onde os resultados serão salvos")
+    args = parser.parse_args()
+
+    train = parse_recordings(args.train)
+    test = parse_recordings(args.test) if args.test else train
+    if not args.test:
+        print("No test recordings given, evaluating on the training recordings")
+
+    results = [evaluate('rules', GestureRecognizer(), test)]
+    for method in args.methods:
+        start_time = time.perf_counter()
+        classifier = TemplateClassifier.from_recordings(
+            train, method, max_templates_per_gesture=args.max_templates, max_distance=args.max_distance
+        )
+        build_time = time.perf_counter() - start_time
+        if args.save and method == args.methods[0]:
+            classifier.save(args.save)
+        result = evaluate(f'templates:{method}', GestureRecognizer(classifier=classifier), test)
+        result['templates'] = len(classifier.templates)
+        result['build_s'] = build_time
+        results.append(result)
+
+    print(f"{'classifier':<22} {'accuracy':>8} {'macro F1':>8} {'batch us':>9} {'frame us':>9}")
+    for result in results:
+        report = result['report']
+        print(
+            f"{result['classifier']:<22} {report['macro']['accuracy']:>8.3f} {report['macro']['f1_score']:>8.3f} "
+            f"{report['recognition_us']:>9.2f} {result['single_frame_us']:>9.2f}"
+        )
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
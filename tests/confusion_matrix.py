@@ -0,0 +1,196 @@
+import json
+import numpy as np
+
+class ConfusionMatrix:
+    """
+    Matriz de confusão atualizada à medida que os resultados chegam, de onde saem todas as métricas do Tester.
+
+    As linhas são os rótulos reais e as colunas os rótulos detectados, com uma coluna extra para as
+    imagens em que nenhuma mão foi detectada. A memória usada depende apenas do número de classes,
+    não do número de imagens. Todas as métricas retornam 0.0 quando o denominador é zero (por exemplo,
+    uma classe sem nenhuma imagem).
+    """
+
+    NOT_DETECTED = -1
+
+    def __init__(self, labels=()):
+        """
+        Args:
+            labels (iterable): Rótulos conhecidos de antemão. Rótulos novos são adicionados quando aparecem
+        """
+        self.labels = []
+        self.label_indexes = {}
+        self.counts = np.zeros((0, 1), dtype=np.int64)
+        for label in labels:
+            self.__index(label)
+
+    def __index(self, label):
+        """
+        Retorna a linha/coluna de um rótulo, aumentando a matriz se ele ainda não é conhecido.
+        A última coluna é sempre a das imagens sem mão detectada.
+        """
+        index = self.label_indexes.get(label)
+        if index is None:
+            index = len(self.labels)
+            self.labels.append(label)
+            self.label_indexes[label] = index
+            counts = np.zeros((index + 1, index + 2), dtype=np.int64)
+            counts[:index, :index] = self.counts[:, :index]
+            counts[:index, -1] = self.counts[:, -1]
+            self.counts = counts
+        return index
+
+    def add(self, real_label, detected_label):
+        """
+        Registra o resultado de uma imagem.
+
+        Args:
+            real_label (int): Rótulo real da imagem
+            detected_label (int): Gesto reconhecido, ou NOT_DETECTED se nenhuma mão foi detectada
+        """
+        row = self.__index(real_label)
+        column = -1 if detected_label == self.NOT_DETECTED else self.__index(detected_label)
+        self.counts[row, column] += 1
+
+    def add_batch(self, real_labels, detected_labels):
+        """
+        Registra os resultados de vários frames de uma vez, somando cada par (real, detectado) distinto.
+
+        Args:
+            real_labels (np.ndarray): Rótulo real de cada frame
+            detected_labels (np.ndarray): Gesto reconhecido em cada frame, ou NOT_DETECTED
+        """
+        pairs = np.stack([np.asarray(real_labels, dtype=np.int64), np.asarray(detected_labels, dtype=np.int64)], axis=1)
+        if not len(pairs):
+            return
+        unique_pairs, counts = np.unique(pairs, axis=0, return_counts=True)
+        for (real_label, detected_label), count in zip(unique_pairs.tolist(), counts.tolist()):
+            row = self.__index(real_label)
+            column = -1 if detected_label == self.NOT_DETECTED else self.__index(detected_label)
+            self.counts[row, column] += count
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+    def __label_counts(self, label):
+        """
+        Returns:
+            tuple: Verdadeiros positivos, falsos positivos e falsos negativos do rótulo entre as imagens com mão
+                detectada, e o total de imagens do rótulo (incluindo as sem mão detectada)
+        """
+        index = self.label_indexes.get(label)
+        if index is None:
+            return 0, 0, 0, 0
+        detected = self.counts[:, :-1]
+        true_positives = int(detected[index, index])
+        false_positives = int(detected[:, index].sum()) - true_positives
+        false_negatives = int(detected[index].sum()) - true_positives
+        return true_positives, false_positives, false_negatives, int(self.counts[index].sum())
+
+    def detection_accuracy(self):
+        """
+        Returns:
+            float: Proporção de imagens em que uma mão foi detectada
+        """
+        total = self.total
+        return float(self.counts[:, :-1].sum()) / total if total else 0.0
+
+    def accuracy_by_gesture(self, label):
+        """
+        Returns:
+            float: Proporção das imagens do rótulo reconhecidas corretamente, contando as sem mão detectada como erro
+        """
+        true_positives, _, _, total = self.__label_counts(label)
+        return true_positives / total if total else 0.0
+
+    def precision(self, label):
+        """
+        Returns:
+            float: Precisão do rótulo, considerando apenas as imagens com mão detectada
+        """
+        true_positives, false_positives, _, _ = self.__label_counts(label)
+        denominator = true_positives + false_positives
+        return true_positives / denominator if denominator else 0.0
+
+    def recall(self, label):
+        """
+        Returns:
+            float: Recall do rótulo, considerando apenas as imagens com mão detectada
+        """
+        true_positives, _, false_negatives, _ = self.__label_counts(label)
+        denominator = true_positives + false_negatives
+        return true_positives / denominator if denominator else 0.0
+
+    def f1_score(self, label):
+        """
+        Returns:
+            float: F1-score do rótulo, considerando apenas as imagens com mão detectada
+        """
+        true_positives, false_positives, false_negatives, _ = self.__label_counts(label)
+        denominator = 2 * true_positives + false_positives + false_negatives
+        return 2 * true_positives / denominator if denominator else 0.0
+
+    def report(self):
+        """
+        Calcula todas as métricas de uma só vez.
+
+        Returns:
+            dict: Total de imagens, acurácia da detecção, métricas de cada rótulo e as médias (macro) entre os rótulos
+        """
+        per_label = {}
+        for label in sorted(self.labels):
+            true_positives, false_positives, false_negatives, total = self.__label_counts(label)
+            predicted = true_positives + false_positives
+            relevant = true_positives + false_negatives
+            f1_denominator = predicted + relevant
+            per_label[label] = {
+                'support': total,
+                'accuracy': true_positives / total if total else 0.0,
+                'precision': true_positives / predicted if predicted else 0.0,
+                'recall': true_positives / relevant if relevant else 0.0,
+                'f1_score': 2 * true_positives / f1_denominator if f1_denominator else 0.0,
+            }
+
+        macro = {}
+        for metric in ('accuracy', 'precision', 'recall', 'f1_score'):
+            values = [metrics[metric] for metrics in per_label.values()]
+            macro[metric] = sum(values) / len(values) if values else 0.0
+
+        return {
+            'total': self.total,
+            'detection_accuracy': self.detection_accuracy(),
+            'labels': per_label,
+            'macro': macro,
+        }
+
+    def export(self, path):
+        """
+        Grava a matriz e o relatório de métricas. Arquivos .csv recebem apenas a matriz; os demais recebem um JSON
+        com a matriz, os rótulos e o relatório.
+
+        Args:
+            path (str): Caminho do arquivo
+        """
+        labels = sorted(self.labels)
+        order = [self.label_indexes[label] for label in labels]
+        matrix = self.counts[order][:, order + [-1]].tolist()
+
+        if path.endswith('.csv'):
+            header = ','.join(['real\\detected'] + [str(label) for label in labels] + ['not_detected'])
+            rows = [[label] + row for label, row in zip(labels, matrix)]
+            with open(path, 'w') as file:
+                file.write(header + '\n')
+                for row in rows:
+                    file.write(','.join(str(value) for value in row) + '\n')
+            return
+
+        report = self.report()
+        report['labels'] = {str(label): metrics for label, metrics in report['labels'].items()}
+        with open(path, 'w') as file:
+            json.dump({
+                'labels': labels,
+                'columns': labels + [self.NOT_DETECTED],
+                'matrix': matrix,
+                'report': report,
+            }, file, indent=2)
@@ -0,0 +1,159 @@
+import argparse
+import json
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from gesture_recognizer import HandLandmark
+from landmark_recorder import LandmarkReplay
+from pointer_filters import create_pointer_filter
+
+DEFAULT_FILTERS = [
+    'ema:smoothing_factor=0.8',
+    'ema:smoothing_factor=0.5',
+    'one_euro',
+    'kalman',
+]
+
+def load_segments(paths, max_gap=0.25):
+    """
+    Carrega os trechos contínuos com mão detectada das gravações do LandmarkRecorder.
+    Um trecho termina num frame sem mão ou num intervalo maior que max_gap, como quando a mão sai de vista.
+
+    Args:
+        paths (list): Diretórios das gravações
+        max_gap (float): Intervalo máximo, em segundos, entre frames de um mesmo trecho
+
+    Returns:
+        list: Pares (instantes (N,), posições (N, 2)) com o landmark usado como cursor em cada frame.
+            Trechos com menos de três frames são descartados
+    """
+    segments = []
+    for path in paths:
+        replay = LandmarkReplay(path)
+        timestamps = np.asarray(replay.timestamps, dtype=np.float64)
+        pointer = np.asarray(replay.landmarks[:, HandLandmark.RING_FINGER_MCP, :2], dtype=np.float64)
+        detected = np.asarray(replay.detected, dtype=bool)
+
+        breaks = ~detected
+        breaks[1:] |= np.diff(timestamps) > max_gap
+        start = None
+        for index in range(len(detected)):
+            if start is not None and breaks[index]:
+                segments.append((timestamps[start:index], pointer[start:index]))
+                start = None
+            if start is None and detected[index]:
+                start = index
+        if start is not None:
+            segments.append((timestamps[start:], pointer[start:]))
+    return [segment for segment in segments if len(segment[1]) >= 3]
+
+def run_filter(pointer_filter, timestamps, positions, latency=None):
+    """
+    Passa um trecho pelo filtro, começando de um estado limpo.
+
+    Args:
+        latency (float): Latência informada ao filtro antes de cada amostra, como faz o HandTracker. Se None, não informa
+
+    Returns:
+        np.ndarray: Posições (N, 2) filtradas
+    """
+    pointer_filter.reset()
+    output = np.empty_like(positions)
+    for index, (timestamp, (x, y)) in enumerate(zip(timestamps, positions)):
+        if latency is not None:
+            pointer_filter.observe_latency(latency)
+        output[index] = pointer_filter.update(x, y, timestamp)
+    return output
+
+def estimate_lag(timestamps, positions, output, shifts):
+    """
+    Estima o atraso da saída do filtro como o deslocamento no tempo que melhor a alinha com a posição medida.
+
+    Args:
+        shifts (np.ndarray): Deslocamentos avaliados, em segundos
+
+    Returns:
+        np.ndarray: Erro quadrático médio da saída em relação à posição medida deslocada de cada valor de shifts
+    """
+    errors = np.empty(len(shifts))
+    for index, shift in enumerate(shifts):
+        shifted = np.stack([np.interp(timestamps - shift, timestamps, positions[:, axis]) for axis in range(2)], axis=1)
+        # Ignora os frames em que o instante deslocado cai fora do trecho
+        valid = (timestamps - shift >= timestamps[0]) & (timestamps - shift <= timestamps[-1])
+        errors[index] = ((output[valid] - shifted[valid]) ** 2).sum(axis=1).mean() if valid.any() else np.inf
+    return errors
+
+def evaluate(spec, segments, prediction=0.0, latency=None, shifts=None):
+    """
+    Avalia um filtro em todos os trechos.
+
+    Args:
+        spec (str): Descrição do filtro, no formato de create_pointer_filter
+        segments (list): Trechos retornados por load_segments
+        prediction (float): Previsão à frente, em segundos
+        latency (float): Latência simulada do pipeline, somada à previsão. Se None, a latência não é compensada
+        shifts (np.ndarray): Deslocamentos, em segundos, avaliados na estimativa do atraso
+
+    Returns:
+        dict: Tremulação (média do módulo da segunda diferença da saída), erro médio em relação à posição medida,
+            atraso em milissegundos (negativo quando o filtro se adianta à mão) e tempo médio de cada atualização
+    """
+    if shifts is None:
+        shifts = np.arange(-0.15, 0.3, 0.002)
+    pointer_filter = create_pointer_filter(spec, prediction=prediction, compensate_latency=latency is not None)
+
+    jitter = []
+    error = []
+    lag_errors = np.zeros(len(shifts))
+    samples = 0
+    elapsed = 0.0
+    for timestamps, positions in segments:
+        start_time = time.perf_counter()
+        output = run_filter(pointer_filter, timestamps, positions, latency)
+        elapsed += time.perf_counter() - start_time
+        samples += len(positions)
+
+        jitter.append(np.linalg.norm(np.diff(output, n=2, axis=0), axis=1))
+        error.append(np.linalg.norm(output - positions, axis=1))
+        lag_errors += estimate_lag(timestamps, positions, output, shifts) * len(positions)
+
+    return {
+        'filter': spec,
+        'prediction_s': prediction,
+        'latency_s': latency,
+        'jitter': float(np.concatenate(jitter).mean()) if samples else 0.0,
+        'mean_error': float(np.concatenate(error).mean()) if samples else 0.0,
+        'lag_ms': float(shifts[lag_errors.argmin()] * 1000) if samples else 0.0,
+        'update_us': elapsed / samples * 1e6 if samples else 0.0,
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compara os filtros do cursor em landmarks já gravados, medindo tremulação e atraso")
+    parser.add_argument("recordings", nargs="+", metavar="DIR", help="Gravações do LandmarkRecorder (por exemplo, de main.py --record)")
+    parser.add_argument("--filters", nargs="+", default=DEFAULT_FILTERS, metavar="SPEC", help="Filtros avaliados, por exemplo one_euro:min_cutoff=0.5,beta=0.1")
+    parser.add_argument("--prediction", nargs="+", type=float, default=[0.0, 0.05], metavar="S", help="Previsões à frente avaliadas para cada filtro")
+    parser.add_argument("--latency", type=float, metavar="S", help="Latência do pipeline compensada pelos filtros, como com main.py --compensate-latency")
+    parser.add_argument("--output", help="Arquivo JSON onde os resultados serão salvos")
+    args = parser.parse_args()
+
+    segments = load_segments(args.recordings)
+    print(f"{len(segments)} segments, {sum(len(positions) for _, positions in segments)} frames")
+
+    results = [
+        evaluate(spec, segments, prediction, args.latency)
+        for spec in args.filters
+        for prediction in args.prediction
+    ]
+    print(f"{'filter':<32} {'pred ms':>7} {'jitter':>8} {'error':>8} {'lag ms':>7} {'us/upd':>7}")
+    for result in results:
+        print(
+            f"{result['filter']:<32} {result['prediction_s'] * 1000:>7.0f} {result['jitter']:>8.5f} "
+            f"{result['mean_error']:>8.5f} {result['lag_ms']:>7.0f} {result['update_us']:>7.1f}"
+        )
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
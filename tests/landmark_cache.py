@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import shutil
+from collections import OrderedDict
+import numpy as np
+
+class LandmarkCache:
+    """
+    Cache em disco dos landmarks extraídos pelo MediaPipe, endereçado pelo conteúdo de cada imagem.
+
+    A chave de cada entrada é o hash do conteúdo do arquivo da imagem, então renomear ou mover imagens
+    não invalida o cache. As configurações do Hands usadas na extração ficam registradas em settings.json:
+    se o cache for aberto com configurações diferentes, todas as entradas são descartadas.
+    O tamanho total é limitado a max_bytes, removendo primeiro as entradas usadas há mais tempo.
+    """
+
+    # Valor gravado na última posição da entrada para indicar que nenhuma mão foi detectada
+    NO_HAND = -1
+    HANDEDNESS_CODES = {'Left': 0, 'Right': 1}
+    HANDEDNESS_NAMES = {0: 'Left', 1: 'Right'}
+
+    def __init__(self, directory, settings, max_bytes=512 * 1024 * 1024):
+        """
+        Abre (ou cria) o cache.
+
+        Args:
+            directory (str): Diretório do cache
+            settings (dict): Configurações que afetam a extração dos landmarks (parâmetros do Hands)
+            max_bytes (int): Tamanho máximo ocupado pelas entradas em disco
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.total_bytes = 0
+        self.entries = OrderedDict()  # chave -> tamanho em bytes, da menos para a mais recentemente usada
+
+        os.makedirs(directory, exist_ok=True)
+        settings_path = os.path.join(directory, 'settings.json')
+        settings_json = json.dumps(settings, sort_keys=True)
+
+        stored_settings = None
+        if os.path.exists(settings_path):
+            with open(settings_path) as file:
+                stored_settings = file.read()
+
+        if stored_settings != settings_json:
+            self.clear()
+            with open(settings_path, 'w') as file:
+                file.write(settings_json)
+        else:
+            self.__load_entries()
+
+    def __load_entries(self):
+        """
+        Indexa as entradas existentes em disco, ordenadas pelo último uso.
+        """
+        found = []
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith('.npy'):
+                    stat = entry.stat()
+                    found.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+
+        for _, key, size in sorted(found):
+            self.entries[key] = size
+            self.total_bytes += size
+        self.__evict()
+
+    def clear(self):
+        """
+        Remove todas as entradas do cache.
+        """
+        for shard in os.scandir(self.directory):
+            if shard.is_dir():
+                shutil.rmtree(shard.path)
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def key_for(self, image):
+        """
+        Calcula a chave de uma imagem a partir do seu conteúdo.
+
+        Args:
+            image: Caminho da imagem, ou o frame já decodificado (np.ndarray)
+
+        Returns:
+            str: Hash hexadecimal do conteúdo do arquivo, ou do formato e dos pixels do frame
+        """
+        if isinstance(image, np.ndarray):
+            digest = hashlib.blake2b(str(image.shape).encode(), digest_size=16)
+            digest.update(np.ascontiguousarray(image).data)
+            return digest.hexdigest()
+        with open(image, 'rb') as file:
+            return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+
+    def __entry_path(self, key):
+        return os.path.join(self.directory, key[:2], key + '.npy')
+
+    def get(self, key):
+        """
+        Busca os landmarks de uma imagem no cache.
+
+        Args:
+            key (str): Chave retornada por key_for
+
+        Returns:
+            tuple: (landmarks, lateralidade), com (None, None) se a imagem não tinha mão detectada,
+                ou None se a imagem não está no cache
+        """
+        if key not in self.entries:
+            self.misses += 1
+            return None
+
+        path = self.__entry_path(key)
+        try:
+            entry = np.load(path)
+        except (OSError, ValueError):
+            self.total_bytes -= self.entries.pop(key)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        os.utime(path)
+
+        handedness_code = int(entry[-1])
+        if handedness_code == self.NO_HAND:
+            return None, None
+        return entry[:-1].reshape(21, 3), self.HANDEDNESS_NAMES[handedness_code]
+
+    def put(self, key, landmarks, handedness):
+        """
+        Grava os landmarks de uma imagem no cache, removendo as entradas mais antigas se o limite de tamanho for excedido.
+
+        Args:
+            key (str): Chave retornada por key_for
+            landmarks (np.ndarray): Array (21, 3) com os landmarks, ou None quando nenhuma mão foi detectada
+            handedness (str): 'Left' ou 'Right', ou None
+        """
+        entry = np.full(21 * 3 + 1, np.nan, dtype=np.float32)
+        if landmarks is not None:
+            entry[:-1] = landmarks.reshape(-1)
+        entry[-1] = self.HANDEDNESS_CODES.get(handedness, self.NO_HAND)
+
+        path = self.__entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.save(path, entry)
+
+        size = os.path.getsize(path)
+        self.total_bytes += size - self.entries.pop(key, 0)
+        self.entries[key] = size
+        self.__evict()
+
+    def __evict(self):
+        """
+        Remove as entradas usadas há mais tempo até que o cache caiba em max_bytes.
+        """
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            key, size = self.entries.popitem(last=False)
+            self.total_bytes -= size
+            try:
+                os.remove(self.__entry_path(key))
+            except FileNotFoundError:
+                pass
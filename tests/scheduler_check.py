@@ -0,0 +1,53 @@
+import argparse
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from gesture_recognizer import PointerCoordinates
+from inference_scheduler import InferenceScheduler
+
+def simulate(frame_count=3000, fps=30, jitter=(0.0005, 0.004), speed=0.5, is_moving=True, seed=0, **kwargs):
+    """
+    Simula uma câmera com atraso variável na entrega dos frames e conta os frames pulados pelo InferenceScheduler.
+
+    Args:
+        frame_count (int): Número de frames simulados
+        fps (float): Taxa da câmera
+        jitter (tuple): Atraso mínimo e máximo, em segundos, entre a captura e o processamento de cada frame
+        speed (float): Velocidade da mão, em unidades normalizadas por segundo, quando is_moving
+        is_moving (bool): Se True, a mão se move continuamente; se False, fica parada
+        seed (int): Semente do gerador do atraso
+        **kwargs: Parâmetros do InferenceScheduler
+
+    Returns:
+        dict: Frames com inferência e frames pulados
+    """
+    rng = np.random.default_rng(seed)
+    scheduler = InferenceScheduler(**kwargs)
+    base = np.random.default_rng(seed + 1).random((21, 3)).astype(np.float32)
+    for index in range(frame_count):
+        now = index / fps + rng.uniform(*jitter)
+        if not scheduler.should_infer(now):
+            continue
+        offset = speed * now if is_moving else 0.0
+        landmarks = base + np.float32(offset)
+        scheduler.update(now, landmarks, 0, PointerCoordinates(float(landmarks[0, 0]), float(landmarks[0, 1])))
+    return {'inferred': scheduler.inferred_frames, 'skipped': scheduler.skipped_frames}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Verifica que o InferenceScheduler não pula frames com a mão em movimento")
+    parser.add_argument("--frames", type=int, default=3000, help="Número de frames simulados")
+    parser.add_argument("--fps", type=float, default=30, help="Taxa da câmera simulada")
+    parser.add_argument("--max-inference-rate", type=float, default=30, help="Maior taxa de inferência do escalonador")
+    args = parser.parse_args()
+
+    moving = simulate(args.frames, args.fps, max_rate=args.max_inference_rate)
+    still = simulate(args.frames, args.fps, is_moving=False, max_rate=args.max_inference_rate)
+    print(f"Moving hand: {moving['inferred']} inferred, {moving['skipped']} skipped")
+    print(f"Still hand: {still['inferred']} inferred, {still['skipped']} skipped")
+
+    if moving['skipped'] or not still['skipped']:
+        print("FAIL")
+        sys.exit(1)
+    print("OK")
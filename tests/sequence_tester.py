@@ -0,0 +1,190 @@
+import argparse
+import json
+import os
+import sys
+import time
+import cv2
+import mediapipe as mp
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from confusion_matrix import ConfusionMatrix
+from frame_sources import VideoFileSource, open_frame_source
+from gesture_recognizer import GestureRecognizer, landmarks_to_array
+
+class SequenceTester:
+    """
+    Classe responsável por testar o reconhecimento de gestos em clips rotulados, frame a frame e em ordem,
+    com o MediaPipe Hands em modo de rastreamento, como no HandTracker.
+
+    Em modo de rastreamento, o detector de palma só roda quando não há mão do frame anterior para
+    rastrear; nos demais frames, os landmarks são estimados a partir da região da mão no frame anterior,
+    o que é bem mais barato. A API do MediaPipe não informa qual caminho foi usado, então ele é inferido
+    pela mesma regra: um frame é atendido pelo rastreamento quando o frame anterior do clip tinha mão
+    detectada, e por uma nova detecção caso contrário. Cada clip usa uma instância nova do Hands, para
+    que o rastreamento não continue de um clip para outro.
+
+    Para cada frame são guardados a latência (inferência e reconhecimento, sem a leitura do frame), se
+    foi rastreado e se o gesto reconhecido estava correto. A memória usada cresce com o número de
+    frames, mas são poucos bytes por frame.
+    """
+
+    def __init__(self, gesture_recognizer, static_image_mode=False, time_bin=0.5):
+        """
+        Inicializa o SequenceTester.
+
+        Args:
+            gesture_recognizer: Instância de GestureRecognizer
+            static_image_mode (bool): Se True, detecta a mão do zero em todos os frames, para comparação
+            time_bin (float): Largura, em segundos desde o início do clip, dos intervalos da acurácia ao longo do tempo
+        """
+        self.gesture_recognizer = gesture_recognizer
+        self.time_bin = time_bin
+        # Mesmas configurações do HandTracker
+        self.hands_settings = {
+            'static_image_mode': static_image_mode,
+            'model_complexity': 0,
+            'max_num_hands': 1,
+            'min_detection_confidence': 0.8,
+            'min_tracking_confidence': 0.8,
+        }
+        self.clips = []
+        self.confusion_matrix = ConfusionMatrix()
+        self.__reset_frames()
+
+    def __reset_frames(self):
+        self.latencies = []
+        self.tracked = []
+        self.correct = []
+        self.clip_times = []
+
+    def load_clip(self, path, label, fps=30):
+        """
+        Adiciona um clip ao dataset.
+
+        Args:
+            path (str): Arquivo de vídeo ou diretório de imagens em ordem alfabética (ver open_frame_source)
+            label (int): Rótulo real de todos os frames do clip
+            fps (float): Taxa dos frames de um diretório de imagens, usada para calcular o instante de cada frame.
+                Para arquivos de vídeo, usa a taxa do próprio vídeo
+        """
+        self.clips.append((path, label, fps))
+
+    def classify_clips(self):
+        """
+        Processa todos os clips em ordem, acumulando o resultado de cada frame.
+        """
+        self.confusion_matrix = ConfusionMatrix()
+        self.__reset_frames()
+        start_time = time.perf_counter()
+        for path, label, fps in self.clips:
+            self.__classify_clip(path, label, fps)
+            sys.stdout.write(f'\rProcessing {len(self.latencies)} frames ({len(self.latencies) / (time.perf_counter() - start_time):.1f} frames/s)')
+            sys.stdout.flush()
+        print()
+
+    def __classify_clip(self, path, label, fps):
+        """
+        Processa um clip com uma instância nova do Hands.
+
+        Args:
+            path (str): Arquivo de vídeo ou diretório de imagens
+            label (int): Rótulo real dos frames
+            fps (float): Taxa dos frames de um diretório de imagens
+        """
+        frame_source = open_frame_source(path)
+        if isinstance(frame_source, VideoFileSource):
+            fps = frame_source.cap.get(cv2.CAP_PROP_FPS) or fps
+        hands = mp.solutions.hands.Hands(**self.hands_settings)
+        is_static = self.hands_settings['static_image_mode']
+
+        has_previous_hand = False
+        frame_index = 0
+        try:
+            while frame_source.is_opened():
+                success, image = frame_source.read()
+                if not success:
+                    break
+
+                start_time = time.perf_counter()
+                results = hands.process(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+                gesture = None
+                if results.multi_hand_landmarks:
+                    gesture = self.gesture_recognizer.recognize_array(landmarks_to_array(results.multi_hand_landmarks[0]))
+                self.latencies.append(time.perf_counter() - start_time)
+
+                self.tracked.append(has_previous_hand and not is_static)
+                self.correct.append(gesture == label)
+                self.clip_times.append(frame_index / fps)
+                self.confusion_matrix.add(label, ConfusionMatrix.NOT_DETECTED if gesture is None else gesture)
+
+                has_previous_hand = gesture is not None
+                frame_index += 1
+        finally:
+            frame_source.release()
+            hands.close()
+
+    def get_report(self):
+        """
+        Calcula as métricas dos frames processados.
+
+        Returns:
+            dict: Número de frames, latência (média e percentis, geral e separada entre frames rastreados e
+                redetectados, em milissegundos), fração de frames atendidos pelo rastreamento, métricas
+                da matriz de confusão e a acurácia ao longo do tempo, em intervalos de time_bin segundos
+                desde o início de cada clip
+        """
+        latencies = np.asarray(self.latencies) * 1000
+        tracked = np.asarray(self.tracked, dtype=bool)
+        correct = np.asarray(self.correct, dtype=bool)
+        bins = (np.asarray(self.clip_times) // self.time_bin).astype(np.int64)
+
+        accuracy_over_time = []
+        for time_bin in np.unique(bins):
+            in_bin = bins == time_bin
+            accuracy_over_time.append({
+                'start_s': float(time_bin * self.time_bin),
+                'frames': int(in_bin.sum()),
+                'accuracy': float(correct[in_bin].mean()),
+            })
+
+        return {
+            'frames': len(latencies),
+            'static_image_mode': self.hands_settings['static_image_mode'],
+            'tracked_fraction': float(tracked.mean()) if len(tracked) else 0.0,
+            'latency_ms': self.__latency_summary(latencies),
+            'tracked_latency_ms': self.__latency_summary(latencies[tracked]),
+            'redetected_latency_ms': self.__latency_summary(latencies[~tracked]),
+            'metrics': self.confusion_matrix.report(),
+            'accuracy_over_time': accuracy_over_time,
+        }
+
+    def __latency_summary(self, latencies):
+        if not len(latencies):
+            return None
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        return {'mean': float(latencies.mean()), 'p50': float(p50), 'p95': float(p95), 'p99': float(p99)}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Avalia o reconhecimento de gestos em clips rotulados com o MediaPipe em modo de rastreamento")
+    parser.add_argument("clips", nargs="+", metavar="CLIP:LABEL", help="Arquivo de vídeo ou diretório de frames em ordem e o rótulo dos seus frames")
+    parser.add_argument("--fps", type=float, default=30, help="Taxa dos frames dos diretórios de imagens")
+    parser.add_argument("--time-bin", type=float, default=0.5, help="Largura, em segundos, dos intervalos da acurácia ao longo do tempo")
+    parser.add_argument("--static", action="store_true", help="Detecta a mão do zero em todos os frames, para comparação")
+    parser.add_argument("--output", help="Arquivo JSON onde o relatório será salvo")
+    args = parser.parse_args()
+
+    tester = SequenceTester(GestureRecognizer(), static_image_mode=args.static, time_bin=args.time_bin)
+    for clip in args.clips:
+        path, label = clip.rsplit(':', 1)
+        tester.load_clip(path, int(label), args.fps)
+
+    start_time = time.perf_counter()
+    tester.classify_clips()
+    report = tester.get_report()
+    report['wall_time_s'] = time.perf_counter() - start_time
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
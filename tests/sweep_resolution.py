@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from gesture_recognizer import GestureRecognizer
+from tester import Tester
+
+def parse_resolution(value):
+    """
+    Converte uma resolução da linha de comando nos parâmetros de decodificação do Tester.
+
+    Args:
+        value (str): 'full', '1/N' (decodificação reduzida, N = 2, 4 ou 8) ou o tamanho máximo do maior lado em pixels
+
+    Returns:
+        dict: decode_scale e max_side
+    """
+    if value == 'full':
+        return {'decode_scale': 1, 'max_side': None}
+    if value.startswith('1/'):
+        scale = int(value[2:])
+        if scale not in (1, 2, 4, 8):
+            raise argparse.ArgumentTypeError(f"Unsupported decode scale: {value}")
+        return {'decode_scale': scale, 'max_side': None}
+    return {'decode_scale': 1, 'max_side': int(value)}
+
+def sweep(sources, resolutions, complexities, workers=1, prefetch=2):
+    """
+    Avalia o dataset com cada combinação de resolução de entrada e complexidade do modelo.
+
+    Args:
+        sources (list): Trios (tipo, caminho, rótulo), como em Tester.sources
+        resolutions (list): Resoluções no formato aceito por parse_resolution
+        complexities (list): Valores de model_complexity
+        workers (int): Número de processos usados pelo Tester
+        prefetch (int): Threads de decodificação antecipada usadas pelo Tester
+
+    Returns:
+        list: Um dicionário por combinação, com a taxa de detecção, o F1 de cada gesto, o F1 médio e o tempo médio de inferência
+    """
+    results = []
+    for complexity in complexities:
+        for resolution in resolutions:
+            tester = Tester(
+                GestureRecognizer(), workers=workers, model_complexity=complexity, prefetch=prefetch,
+                **parse_resolution(resolution)
+            )
+            tester.sources = list(sources)
+            print(f"resolution={resolution} model_complexity={complexity}")
+            tester.classify_images()
+            report = tester.get_report()
+            results.append({
+                'resolution': resolution,
+                'model_complexity': complexity,
+                'detection_rate': report['detection_accuracy'],
+                'f1_by_gesture': {str(label): metrics['f1_score'] for label, metrics in report['labels'].items()},
+                'macro_f1': report['macro']['f1_score'],
+                'inference_ms': report['inference_ms'],
+            })
+    return results
+
+def print_table(results):
+    """
+    Mostra os resultados numa tabela, da configuração mais barata para a mais cara.
+    """
+    print(f"{'resolution':>10} {'complexity':>10} {'detection':>10} {'macro F1':>10} {'ms/image':>10}  F1 by gesture")
+    for result in sorted(results, key=lambda result: result['inference_ms']):
+        f1_by_gesture = ' '.join(f"{label}:{f1:.3f}" for label, f1 in result['f1_by_gesture'].items())
+        print(
+            f"{result['resolution']:>10} {result['model_complexity']:>10} {result['detection_rate']:>10.3f} "
+            f"{result['macro_f1']:>10.3f} {result['inference_ms']:>10.2f}  {f1_by_gesture}"
+        )
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Mede a acurácia e o custo da inferência em várias resoluções de entrada e complexidades do modelo")
+    parser.add_argument("folders", nargs="+", metavar="DIR:LABEL", help="Diretório de imagens e o rótulo das suas imagens")
+    parser.add_argument("--resolutions", nargs="+", default=['full', '1/2', '1/4', '320'],
+                        help="Resoluções avaliadas: 'full', '1/N' (decodificação reduzida) ou o tamanho máximo do maior lado")
+    parser.add_argument("--complexities", nargs="+", type=int, default=[0, 1], help="Valores de model_complexity avaliados")
+    parser.add_argument("--workers", type=int, default=1, help="Número de processos usados na classificação")
+    parser.add_argument("--prefetch", type=int, default=2, help="Threads que decodificam as próximas imagens durante a inferência")
+    parser.add_argument("--min-f1", type=float, help="F1 médio mínimo aceitável. Mostra a configuração mais barata que o atinge")
+    parser.add_argument("--output", help="Arquivo JSON onde os resultados serão salvos")
+    args = parser.parse_args()
+
+    for resolution in args.resolutions:
+        parse_resolution(resolution)
+
+    sources = []
+    for folder in args.folders:
+        folder, label = folder.rsplit(':', 1)
+        sources.append(('images', folder, int(label)))
+
+    results = sweep(sources, args.resolutions, args.complexities, args.workers, args.prefetch)
+    print_table(results)
+
+    if args.min_f1 is not None:
+        accepted = [result for result in results if result['macro_f1'] >= args.min_f1]
+        if accepted:
+            cheapest = min(accepted, key=lambda result: result['inference_ms'])
+            print(f"Cheapest setting with macro F1 >= {args.min_f1}: resolution={cheapest['resolution']} model_complexity={cheapest['model_complexity']}")
+        else:
+            print(f"No setting reached macro F1 >= {args.min_f1}")
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
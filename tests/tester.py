@@ -1,6 +1,108 @@
+import argparse
+import itertools
+import json
+import multiprocessing
 import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import cv2
 import mediapipe as mp
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from confusion_matrix import ConfusionMatrix
+from gesture_recognizer import GestureRecognizer, landmarks_to_array
+from landmark_cache import LandmarkCache
+from landmark_recorder import LandmarkRecorder, LandmarkReplay
+
+# Instância de Hands de cada processo do pool, criada em _init_worker
+_worker_hands = None
+
+def _init_worker(hands_settings):
+    """
+    Inicializa um processo do pool com sua própria instância de MediaPipe Hands.
+
+    Args:
+        hands_settings (dict): Parâmetros usados para construir o Hands
+    """
+    global _worker_hands
+    _worker_hands = mp.solutions.hands.Hands(**hands_settings)
+
+# Fatores aceitos pelas flags de decodificação reduzida do OpenCV
+REDUCED_DECODE_FLAGS = {
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+def _decode_image(image, decode_scale=1, max_side=None):
+    """
+    Decodifica uma imagem, opcionalmente em resolução reduzida.
+
+    O MediaPipe redimensiona a imagem internamente para a entrada do modelo, então decodificar a
+    imagem inteira é desperdício quando ela é muito maior que isso. Com decode_scale, o JPEG já é
+    decodificado em 1/2, 1/4 ou 1/8 da resolução (IMREAD_REDUCED_COLOR_*), o que é bem mais barato
+    que decodificar e depois redimensionar.
+
+    Args:
+        image: Caminho da imagem, ou o frame BGR já decodificado (np.ndarray)
+        decode_scale (int): Fator de redução (1, 2, 4 ou 8)
+        max_side (int): Se informado, reduz a imagem para que o maior lado tenha no máximo esse tamanho
+
+    Returns:
+        np.ndarray: Imagem BGR
+    """
+    if isinstance(image, str):
+        image = cv2.imread(image, REDUCED_DECODE_FLAGS.get(decode_scale, cv2.IMREAD_COLOR))
+    elif decode_scale > 1:
+        image = cv2.resize(image, None, fx=1 / decode_scale, fy=1 / decode_scale, interpolation=cv2.INTER_AREA)
+
+    if max_side and max(image.shape[:2]) > max_side:
+        scale = max_side / max(image.shape[:2])
+        image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    return image
+
+def _detect_batch(images, decode_settings):
+    """
+    Detecta os landmarks de um lote de imagens usando o Hands do processo atual.
+
+    Args:
+        images (list): Caminhos das imagens do lote, ou os próprios frames BGR
+        decode_settings (dict): Parâmetros de _decode_image
+
+    Returns:
+        tuple: Lista com um par (landmarks, lateralidade) por imagem, ou (None, None) quando nenhuma mão foi
+            detectada, e o tempo total de inferência do lote em segundos, sem contar a decodificação
+    """
+    detections = []
+    inference_time = 0
+    for image in images:
+        image = _decode_image(image, **decode_settings)
+        start_time = time.perf_counter()
+        detections.append(_detect_landmarks(_worker_hands, image))
+        inference_time += time.perf_counter() - start_time
+    return detections, inference_time
+
+def _detect_landmarks(hands, image):
+    """
+    Detecta os landmarks da mão numa imagem.
+
+    Args:
+        hands: Instância de MediaPipe Hands
+        image (np.ndarray): Imagem BGR decodificada por _decode_image
+
+    Returns:
+        tuple: Array (21, 3) com os landmarks e lateralidade ('Left' ou 'Right'), ou (None, None) quando nenhuma mão foi detectada
+    """
+    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    results = hands.process(image)
+
+    if not results.multi_hand_landmarks:
+        return None, None
+    handedness = results.multi_handedness[0].classification[0].label
+    return landmarks_to_array(results.multi_hand_landmarks[0]), handedness
 
 class Tester:
     """
@@ -9,62 +111,321 @@ class Tester:
     Esta classe carrega imagens de um ou mais diretórios, processa cada uma delas usando o 
     MediaPipe Hands e o GestureRecognizer, e calcula métricas de performance como
     acurácia, precisão, recall e F1-score.
+
+    Os diretórios são percorridos sob demanda durante a classificação e cada resultado vai direto para
+    uma matriz de confusão, então a memória usada não cresce com o tamanho do dataset.
+
+    Além de diretórios de imagens, o dataset aceita as saídas de utils.extract_frames: frames.npy, lidos
+    com memory map sem decodificar JPGs, e gravações de landmarks, classificadas em lote sem passar pelo MediaPipe.
     """
 
-    def __init__(self, gesture_recognizer):
+    def __init__(self, gesture_recognizer, recorder=None, workers=1, batch_size=16, cache_dir=None, cache_max_bytes=512 * 1024 * 1024,
+                 model_complexity=0, decode_scale=1, max_side=None, prefetch=0):
         """
         Inicializa o Tester com um reconhecedor de gestos.
 
         Args:
             gesture_recognizer: Instância de GestureRecognizer que será usada para classificar os gestos
+            recorder: Instância opcional de LandmarkRecorder que grava os landmarks e o rótulo de cada imagem
+            workers (int): Número de processos usados na classificação. Com 1, tudo roda no processo atual
+            batch_size (int): Número de imagens enviadas de cada vez a um processo do pool
+            cache_dir (str): Diretório de um LandmarkCache. Se informado, a inferência só roda nas imagens que não estão no cache
+            cache_max_bytes (int): Tamanho máximo do cache em disco
+            model_complexity (int): Complexidade do modelo do MediaPipe Hands (0 ou 1)
+            decode_scale (int): Decodifica as imagens em 1/decode_scale da resolução (1, 2, 4 ou 8)
+            max_side (int): Se informado, reduz as imagens para que o maior lado tenha no máximo esse tamanho
+            prefetch (int): Número de threads que decodificam as próximas imagens enquanto a inferência roda.
+                Com 0, cada imagem é decodificada logo antes da inferência. Usado apenas com um worker
         """
         self.gesture_recognizer = gesture_recognizer
-        self.dataset = []
+        self.recorder = recorder
+        self.workers = workers
+        self.batch_size = batch_size
+        self.prefetch = prefetch
+        self.decode_settings = {'decode_scale': decode_scale, 'max_side': max_side}
+        self.inference_time = 0
+        self.inference_count = 0
+        self.recognition_time = 0
+        self.recognition_count = 0
+        self.sources = []
+        self.confusion_matrix = ConfusionMatrix()
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            model_complexity=0,
-            max_num_hands=1,
-            min_detection_confidence=0.6,
-            min_tracking_confidence=0.8
-        )
+        # As imagens do dataset não têm relação entre si, então cada uma passa pela detecção completa,
+        # sem o rastreamento entre frames (ver sequence_tester.py para clips)
+        self.hands_settings = {
+            'static_image_mode': True,
+            'model_complexity': model_complexity,
+            'max_num_hands': 1,
+            'min_detection_confidence': 0.6,
+            'min_tracking_confidence': 0.8,
+        }
+        self.hands = self.mp_hands.Hands(**self.hands_settings)
+        # A resolução de entrada muda os landmarks detectados, então faz parte das configurações do cache
+        cache_settings = dict(self.hands_settings, **self.decode_settings)
+        self.cache = LandmarkCache(cache_dir, cache_settings, cache_max_bytes) if cache_dir else None
         return
     
     def load_images(self, folder, label):
         """
-        Carrega imagens de um diretório e as associa a um rótulo específico.
+        Adiciona um diretório de imagens ao dataset, associando todas as suas imagens a um rótulo específico.
+        O diretório só é percorrido durante a classificação.
 
         Args:
             folder (str): Caminho para o diretório contendo as imagens
             label (int): Rótulo que será associado a todas as imagens do diretório
         """
-        for filename in os.listdir(folder):
-            if filename.endswith(('.png', '.jpg', '.jpeg')):
-                image_path = os.path.join(folder, filename)
-                self.dataset.append({
-                    'image_path': image_path,
-                    'real_label': label,
-                    'detected_label': -1,
-                })
+        self.sources.append(('images', folder, label))
+
+    def load_frames(self, path, label=None):
+        """
+        Adiciona ao dataset os frames gravados por utils.extract_frames com output='frames'.
+
+        Args:
+            path (str): Diretório com frames.npy e labels.npy
+            label (int): Rótulo de todos os frames. Se None, usa os rótulos de labels.npy
+        """
+        self.sources.append(('frames', path, label))
 
-    def classify_images(self):
+    def load_landmarks(self, path, label=None):
+        """
+        Adiciona ao dataset uma gravação do LandmarkRecorder, como a gerada por utils.extract_frames com output='landmarks'.
+        Os landmarks já foram detectados, então esses frames são classificados em lote, sem o MediaPipe.
+
+        Args:
+            path (str): Diretório da gravação
+            label (int): Rótulo de todos os frames. Se None, usa os rótulos gravados
+        """
+        self.sources.append(('landmarks', path, label))
+
+    def iter_dataset(self):
+        """
+        Percorre os diretórios do dataset com os.scandir, sem montar a lista completa de imagens.
+        Os frames de frames.npy são lidos com memory map, um de cada vez. As gravações de landmarks não
+        passam por aqui (ver __classify_recordings).
+
+        Yields:
+            tuple: Caminho da imagem (ou o frame BGR) e rótulo real
+        """
+        for kind, path, label in self.sources:
+            if kind == 'images':
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(('.png', '.jpg', '.jpeg')) and entry.is_file():
+                            yield entry.path, label
+            elif kind == 'frames':
+                labels = np.load(os.path.join(path, 'labels.npy'))
+                frames = np.load(os.path.join(path, 'frames.npy'), mmap_mode='r')
+                for index in range(len(labels)):
+                    yield np.asarray(frames[index]), int(labels[index]) if label is None else label
+
+    def classify_images(self, workers=None):
         """
         Processa todas as imagens do dataset usando MediaPipe Hands e classifica os gestos.
         Para cada imagem, detecta landmarks da mão e usa o gesture_recognizer para determinar o gesto.
+
+        Com mais de um worker, o dataset é dividido em lotes distribuídos entre processos, cada um com
+        sua própria instância de Hands. Os resultados são aplicados na ordem em que as imagens foram
+        encontradas, então o resultado é o mesmo da execução sequencial. Os processos são criados com spawn, então o script
+        que chama este método precisa estar protegido por if __name__ == '__main__'.
+
+        Quando há um cache, as imagens já conhecidas usam os landmarks gravados e só as demais passam pelo MediaPipe.
+        As gravações de landmarks são classificadas em lote no final. O tempo de inferência (sem a decodificação)
+        das imagens que passaram pelo MediaPipe é acumulado em inference_time e inference_count, e o tempo do
+        reconhecimento do gesto, em recognition_time e recognition_count.
+
+        Args:
+            workers (int): Número de processos. Se None, usa o valor definido no construtor
+        """
+        workers = self.workers if workers is None else workers
+        start_time = time.perf_counter()
+        self.last_progress_time = 0
+        self.confusion_matrix = ConfusionMatrix()
+        self.inference_time = 0
+        self.inference_count = 0
+        self.recognition_time = 0
+        self.recognition_count = 0
+
+        if workers <= 1:
+            done = 0
+            for data, key, detection, image in self.__iter_decoded():
+                if detection is None:
+                    inference_start = time.perf_counter()
+                    detection = _detect_landmarks(self.hands, image)
+                    self.inference_time += time.perf_counter() - inference_start
+                    self.inference_count += 1
+                    self.__update_cache(key, detection)
+                self.__store_result(data, *detection)
+                done += 1
+                self.__print_progress(done, start_time)
+        else:
+            self.__classify_parallel(workers, start_time)
+        self.__classify_recordings()
+        self.__print_progress(None, start_time)
+        print()
+
+    def __iter_decoded(self):
         """
-        counter = 1
-        for data in self.dataset:
+        Percorre o dataset decodificando as imagens que não estão no cache. Com prefetch, a decodificação
+        roda num pool de threads (o OpenCV libera o GIL), algumas imagens à frente da inferência.
 
-            print(f'Processing {counter}/{len(self.dataset)}...')
-            counter += 1
+        Yields:
+            tuple: Dados da imagem, chave no cache, detecção encontrada no cache (ou None) e a imagem decodificada
+                (None quando a detecção veio do cache)
+        """
+        dataset = ((data,) + self.__lookup_cache(data) for data in self.iter_dataset())
+        if self.prefetch <= 0:
+            for data, key, detection in dataset:
+                yield data, key, detection, None if detection is not None else _decode_image(data[0], **self.decode_settings)
+            return
 
-            image = cv2.imread(data['image_path'])
-            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(image)
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.prefetch) as executor:
+            for data, key, detection in dataset:
+                future = executor.submit(_decode_image, data[0], **self.decode_settings) if detection is None else None
+                pending.append((data, key, detection, future))
+                if len(pending) >= self.prefetch * 2:
+                    data, key, detection, future = pending.popleft()
+                    yield data, key, detection, future and future.result()
+            while pending:
+                data, key, detection, future = pending.popleft()
+                yield data, key, detection, future and future.result()
 
-            if results.multi_hand_landmarks:
-                hand_landmarks = results.multi_hand_landmarks
-                gesture = self.gesture_recognizer.recognize(hand_landmarks)
-                data['detected_label'] = gesture
+    def __classify_parallel(self, workers, start_time):
+        """
+        Classifica o dataset num pool de processos, mantendo no máximo alguns lotes por worker em andamento.
+        Os lotes são montados sob demanda, então apenas os lotes em andamento ficam em memória.
+
+        Args:
+            workers (int): Número de processos
+            start_time (float): Instante de início, usado no relatório de progresso
+        """
+        dataset = self.iter_dataset()
+        batches = iter(lambda: list(itertools.islice(dataset, self.batch_size)), [])
+        pending = deque()
+        done = 0
+
+        # spawn em vez de fork: o processo atual já tem um grafo do MediaPipe com threads próprias
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker, initargs=(self.hands_settings,)) as executor:
+            for batch in batches:
+                lookups = [self.__lookup_cache(data) for data in batch]
+                missing_images = [data[0] for data, (_, detection) in zip(batch, lookups) if detection is None]
+                future = executor.submit(_detect_batch, missing_images, self.decode_settings) if missing_images else None
+                pending.append((batch, lookups, future))
+                if len(pending) >= workers * 2:
+                    done = self.__store_batch(*pending.popleft(), done, start_time)
+            while pending:
+                done = self.__store_batch(*pending.popleft(), done, start_time)
+
+    def __classify_recordings(self):
+        """
+        Classifica de uma só vez todos os frames das gravações de landmarks do dataset.
+        """
+        for kind, path, label in self.sources:
+            if kind != 'landmarks':
+                continue
+            replay = LandmarkReplay(path)
+            start_time = time.perf_counter()
+            gestures = replay.recognize_all(self.gesture_recognizer)
+            self.recognition_time += time.perf_counter() - start_time
+            self.recognition_count += int(replay.detected.sum())
+            real_labels = np.asarray(replay.labels) if label is None else np.full(len(replay), label)
+            self.confusion_matrix.add_batch(real_labels, gestures)
+
+            if self.recorder is not None:
+                for index in range(len(replay)):
+                    landmarks = replay.landmarks[index] if replay.detected[index] else None
+                    handedness = LandmarkCache.HANDEDNESS_NAMES.get(int(replay.handedness[index]))
+                    self.recorder.record(landmarks, handedness, int(gestures[index]), label=int(real_labels[index]))
+
+    def __store_batch(self, batch, lookups, future, done, start_time):
+        """
+        Aguarda o resultado de um lote e registra os resultados, junto com as entradas encontradas no cache.
+
+        Returns:
+            int: Número de imagens processadas até agora
+        """
+        detections = ()
+        if future is not None:
+            detections, inference_time = future.result()
+            self.inference_time += inference_time
+            self.inference_count += len(detections)
+        detections = iter(detections)
+        for data, (key, detection) in zip(batch, lookups):
+            if detection is None:
+                detection = next(detections)
+                self.__update_cache(key, detection)
+            self.__store_result(data, *detection)
+        done += len(batch)
+        self.__print_progress(done, start_time)
+        return done
+
+    def __lookup_cache(self, data):
+        """
+        Busca no cache os landmarks de uma imagem.
+
+        Args:
+            data (tuple): Caminho da imagem (ou o frame BGR) e rótulo real
+
+        Returns:
+            tuple: Chave da imagem no cache e o par (landmarks, lateralidade) encontrado, ou None quando não há entrada
+        """
+        if self.cache is None:
+            return None, None
+        key = self.cache.key_for(data[0])
+        return key, self.cache.get(key)
+
+    def __update_cache(self, key, detection):
+        """
+        Grava no cache os landmarks extraídos de uma imagem.
+
+        Args:
+            key (str): Chave da imagem no cache
+            detection (tuple): Par (landmarks, lateralidade) extraído pelo MediaPipe
+        """
+        if self.cache is not None:
+            self.cache.put(key, *detection)
+
+    def __store_result(self, data, landmarks, handedness):
+        """
+        Classifica o gesto de uma imagem a partir dos landmarks detectados e registra o resultado na matriz de confusão.
+
+        Args:
+            data (tuple): Caminho da imagem (ou o frame BGR) e rótulo real
+            landmarks (np.ndarray): Array (21, 3) com os landmarks, ou None quando nenhuma mão foi detectada
+            handedness (str): Lateralidade da mão detectada
+        """
+        real_label = data[1]
+        gesture = None
+        if landmarks is not None:
+            start_time = time.perf_counter()
+            gesture = self.gesture_recognizer.recognize_array(landmarks)
+            self.recognition_time += time.perf_counter() - start_time
+            self.recognition_count += 1
+        self.confusion_matrix.add(real_label, ConfusionMatrix.NOT_DETECTED if gesture is None else gesture)
+
+        if self.recorder is not None:
+            self.recorder.record(landmarks, handedness, gesture, label=real_label)
+
+    def __print_progress(self, done, start_time):
+        """
+        Atualiza a linha de progresso no terminal, com a taxa de imagens por segundo.
+        O total de imagens não é conhecido de antemão, já que os diretórios são percorridos sob demanda.
+
+        Args:
+            done (int): Número de imagens processadas. Se None, força a atualização com o total registrado
+            start_time (float): Instante de início do processamento
+        """
+        now = time.perf_counter()
+        if done is None:
+            done = self.confusion_matrix.total
+        elif now - self.last_progress_time < 0.5:
+            return
+        self.last_progress_time = now
+        elapsed = now - start_time
+        rate = done / elapsed if elapsed > 0 else 0
+        sys.stdout.write(f'\rProcessing {done} images ({rate:.1f} images/s)')
+        sys.stdout.flush()
 
     def get_detection_accuracy(self):
         """
@@ -73,11 +434,7 @@ class Tester:
         Returns:
             float: Proporção de imagens onde uma mão foi detectada em relação ao total
         """
-        detected = 0
-        for data in self.dataset:
-            if data['detected_label'] != -1:
-                detected += 1
-        return detected/len(self.dataset)
+        return self.confusion_matrix.detection_accuracy()
     
     def get_detection_accuracy_by_gesture(self, label):
         """
@@ -89,14 +446,7 @@ class Tester:
         Returns:
             float: Proporção de detecções corretas para o gesto específico
         """
-        detected = 0
-        total = 0
-        for data in self.dataset:
-            if data['real_label'] == label:
-                total += 1
-                if data['detected_label'] == label:
-                    detected += 1
-        return detected/total
+        return self.confusion_matrix.accuracy_by_gesture(label)
     
     def get_detected_precision(self, label):
         """
@@ -108,15 +458,7 @@ class Tester:
         Returns:
             float: Precisão do reconhecimento para o gesto específico
         """
-        true_positives = 0
-        false_positives = 0
-        for data in self.dataset:
-            if data['detected_label'] != -1:
-                if data['real_label'] == label and data['detected_label'] == label:
-                    true_positives += 1
-                elif data['real_label'] != label and data['detected_label'] == label:
-                    false_positives += 1
-        return true_positives / (true_positives + false_positives)
+        return self.confusion_matrix.precision(label)
     
     def get_detected_recall(self, label):
         """
@@ -128,15 +470,7 @@ class Tester:
         Returns:
             float: Recall do reconhecimento para o gesto específico
         """
-        true_positives = 0
-        false_negatives = 0
-        for data in self.dataset:
-            if data['detected_label'] != -1:
-                if data['real_label'] == label and data['detected_label'] == label:
-                    true_positives += 1
-                elif data['real_label'] == label and data['detected_label'] != label:
-                    false_negatives += 1
-        return true_positives / (true_positives + false_negatives)
+        return self.confusion_matrix.recall(label)
                 
     def get_detected_f1_score(self, label):
         """
@@ -148,7 +482,67 @@ class Tester:
         Returns:
             float: F1-score do reconhecimento para o gesto específico
         """
-        precision = self.get_detected_precision(label)
-        recall = self.get_detected_recall(label)
-        score = 2 * ((precision * recall)/(precision + recall))
-        return score
+        return self.confusion_matrix.f1_score(label)
+
+    def get_report(self):
+        """
+        Calcula todas as métricas, por gesto e as médias entre os gestos, numa única passada pela matriz de confusão.
+
+        Returns:
+            dict: Relatório gerado por ConfusionMatrix.report(), com o tempo médio de inferência por imagem em milissegundos
+                e o tempo médio do reconhecimento do gesto por frame com mão em microssegundos (nas gravações de
+                landmarks, o reconhecimento é em lote, então o tempo é dividido entre os frames)
+        """
+        report = self.confusion_matrix.report()
+        report['inference_ms'] = 1000 * self.inference_time / self.inference_count if self.inference_count else 0.0
+        report['recognition_us'] = 1e6 * self.recognition_time / self.recognition_count if self.recognition_count else 0.0
+        return report
+
+    def export_confusion_matrix(self, path):
+        """
+        Grava a matriz de confusão e o relatório de métricas (JSON, ou apenas a matriz se path terminar em .csv).
+
+        Args:
+            path (str): Caminho do arquivo
+        """
+        self.confusion_matrix.export(path)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Avalia o reconhecimento de gestos em diretórios de imagens rotuladas")
+    parser.add_argument("folders", nargs="*", metavar="DIR:LABEL", help="Diretório de imagens e o rótulo (constante do gesto) das suas imagens")
+    parser.add_argument("--frames", nargs="+", default=[], metavar="DIR[:LABEL]", help="Frames gravados por utils.py --output frames")
+    parser.add_argument("--landmarks", nargs="+", default=[], metavar="DIR[:LABEL]", help="Landmarks gravados por utils.py --output landmarks")
+    parser.add_argument("--workers", type=int, default=1, help="Número de processos usados na classificação")
+    parser.add_argument("--cache-dir", help="Diretório do cache de landmarks")
+    parser.add_argument("--model-complexity", type=int, choices=(0, 1), default=0, help="Complexidade do modelo do MediaPipe Hands")
+    parser.add_argument("--decode-scale", type=int, choices=(1, 2, 4, 8), default=1, help="Decodifica as imagens em 1/N da resolução")
+    parser.add_argument("--max-side", type=int, help="Reduz as imagens para que o maior lado tenha no máximo esse tamanho")
+    parser.add_argument("--prefetch", type=int, default=0, help="Threads que decodificam as próximas imagens durante a inferência")
+    parser.add_argument("--record", metavar="DIR", help="Grava os landmarks e o rótulo de cada imagem, para threshold_sweep.py")
+    parser.add_argument("--templates", metavar="PATH", help="Classifica os gestos com o índice de templates gravado por compare_classifiers.py --save, em vez das regras")
+    parser.add_argument("--export", metavar="PATH", help="Grava a matriz de confusão e as métricas (JSON, ou apenas a matriz em .csv)")
+    args = parser.parse_args()
+
+    recorder = LandmarkRecorder(args.record) if args.record else None
+    classifier = None
+    if args.templates:
+        from template_classifier import TemplateClassifier
+        classifier = TemplateClassifier.load(args.templates)
+    tester = Tester(
+        GestureRecognizer(classifier=classifier), recorder=recorder, workers=args.workers, cache_dir=args.cache_dir, model_complexity=args.model_complexity,
+        decode_scale=args.decode_scale, max_side=args.max_side, prefetch=args.prefetch
+    )
+    for folder in args.folders:
+        folder, label = folder.rsplit(':', 1)
+        tester.load_images(folder, int(label))
+    for loader, paths in ((tester.load_frames, args.frames), (tester.load_landmarks, args.landmarks)):
+        for path in paths:
+            path, label = path.rsplit(':', 1) if ':' in path else (path, None)
+            loader(path, None if label is None else int(label))
+    tester.classify_images()
+    if recorder is not None:
+        recorder.close()
+
+    print(json.dumps(tester.get_report(), indent=2))
+    if args.export:
+        tester.export_confusion_matrix(args.export)
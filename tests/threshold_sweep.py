@@ -0,0 +1,224 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from gesture_recognizer import GestureRecognizer, HandLandmark
+from landmark_recorder import LandmarkReplay
+from filter_evaluator import load_segments, run_filter
+from pointer_filters import create_pointer_filter
+
+# Número máximo de elementos (combinações x frames) avaliados de uma vez, para limitar a memória usada
+GRID_CHUNK_ELEMENTS = 20_000_000
+
+def parse_values(values):
+    """
+    Converte os valores de uma opção da linha de comando, aceitando listas ('0.06 0.08') e intervalos ('0.04:0.12:0.01').
+
+    Returns:
+        np.ndarray: Valores em ordem
+    """
+    parsed = []
+    for value in values:
+        if ':' in value:
+            start, stop, step = (float(part) for part in value.split(':'))
+            parsed.extend(np.arange(start, stop + step / 2, step).round(6))
+        else:
+            parsed.append(float(value))
+    return np.array(sorted(set(parsed)), dtype=np.float32)
+
+def load_recordings(recordings):
+    """
+    Carrega os frames com mão detectada de uma ou mais gravações do LandmarkRecorder.
+
+    Args:
+        recordings (list): Pares (diretório, rótulo), com rótulo None para usar os rótulos gravados
+
+    Returns:
+        tuple: Landmarks (N, 21, 3) e rótulos (N,)
+    """
+    landmarks = []
+    labels = []
+    for path, label in recordings:
+        replay = LandmarkReplay(path)
+        detected_landmarks = np.asarray(replay.landmarks[replay.detected], dtype=np.float32)
+        recording_labels = np.asarray(replay.labels[replay.detected]) if label is None else np.full(len(detected_landmarks), label)
+        landmarks.append(detected_landmarks)
+        labels.append(recording_labels.astype(np.int64))
+    return np.concatenate(landmarks), np.concatenate(labels)
+
+def sweep_pinch_thresholds(landmarks, labels, pinch_thresholds, right_pinch_thresholds=None):
+    """
+    Avalia o reconhecimento de gestos para todas as combinações de limiares de pinça.
+
+    Args:
+        landmarks (np.ndarray): Array (N, 21, 3) com os landmarks dos frames com mão detectada
+        labels (np.ndarray): Rótulo real de cada frame
+        pinch_thresholds (np.ndarray): Limiares do clique esquerdo
+        right_pinch_thresholds (np.ndarray): Limiares do clique direito. Se None, cada combinação usa o mesmo limiar nos dois
+
+    Returns:
+        list: Um dicionário por combinação, com os limiares, a precisão, o recall e o F1 de cada rótulo e o F1 médio
+    """
+    if right_pinch_thresholds is None:
+        grid = [(value, value) for value in pinch_thresholds]
+    else:
+        grid = list(itertools.product(pinch_thresholds, right_pinch_thresholds))
+
+    # Os limiares só mudam as condições de distância ligadas aos parâmetros de pinça; as demais mantêm o limiar das regras
+    rule_engine = GestureRecognizer().rule_engine
+    grid = np.array(grid, dtype=np.float32).reshape(-1, 2)
+    grid_thresholds = np.repeat(rule_engine.distance_thresholds[np.newaxis], len(grid), axis=0)
+    grid_thresholds[:, rule_engine.parameter_indices('pinch_threshold')] = grid[:, :1]
+    grid_thresholds[:, rule_engine.parameter_indices('right_pinch_threshold')] = grid[:, 1:]
+
+    class_labels = np.unique(labels)
+    real = labels[np.newaxis] == class_labels[:, np.newaxis, np.newaxis]  # (C, 1, N)
+    support = real.sum(axis=2)[:, 0]
+
+    results = []
+    chunk = max(1, GRID_CHUNK_ELEMENTS // max(1, len(landmarks)))
+    for start in range(0, len(grid), chunk):
+        predictions = rule_engine.evaluate_grid(landmarks, grid_thresholds[start:start + chunk])  # (G, N)
+        predicted = predictions[np.newaxis] == class_labels[:, np.newaxis, np.newaxis]          # (C, G, N)
+        true_positives = (predicted & real).sum(axis=2)
+        predicted_counts = predicted.sum(axis=2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            precision = np.where(predicted_counts > 0, true_positives / predicted_counts, 0.0)
+            recall = np.where(support[:, np.newaxis] > 0, true_positives / support[:, np.newaxis], 0.0)
+            f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+
+        for offset, (left, right) in enumerate(grid[start:start + chunk]):
+            per_label = {
+                str(label): {
+                    'support': int(support[index]),
+                    'precision': float(precision[index, offset]),
+                    'recall': float(recall[index, offset]),
+                    'f1_score': float(f1[index, offset]),
+                }
+                for index, label in enumerate(class_labels)
+            }
+            results.append({
+                'pinch_threshold': round(float(left), 6),
+                'right_pinch_threshold': round(float(right), 6),
+                'labels': per_label,
+                'macro_f1': float(f1[:, offset].mean()) if len(class_labels) else 0.0,
+            })
+    return results
+
+def sweep_smoothing(segments, smoothing_factors):
+    """
+    Mede, para cada fator de suavização, o atraso e a tremulação do cursor nas gravações.
+    Cada fator é simulado com o mesmo EmaFilter usado por --cursor-smoothing, com os instantes gravados de cada frame.
+
+    Args:
+        segments (list): Trechos contínuos com mão detectada, como retornados por filter_evaluator.load_segments
+        smoothing_factors (np.ndarray): Fatores avaliados
+
+    Returns:
+        list: Um dicionário por fator, com o atraso médio (distância entre a posição suavizada e a medida) e a
+            tremulação média (módulo da segunda diferença da posição suavizada), em coordenadas normalizadas
+    """
+    results = []
+    for factor in smoothing_factors:
+        pointer_filter = create_pointer_filter(f'ema:smoothing_factor={float(factor)}')
+        lag = []
+        jitter = []
+        for timestamps, positions in segments:
+            output = run_filter(pointer_filter, timestamps, positions)
+            # O primeiro frame de cada trecho é usado como está, então não entra no atraso
+            lag.append(np.linalg.norm(output[1:] - positions[1:], axis=1))
+            jitter.append(np.linalg.norm(np.diff(output, n=2, axis=0), axis=1))
+        lag = np.concatenate(lag) if lag else np.empty(0)
+        jitter = np.concatenate(jitter) if jitter else np.empty(0)
+        results.append({
+            'smoothing_factor': round(float(factor), 6),
+            'lag': float(lag.mean()) if len(lag) else 0.0,
+            'jitter': float(jitter.mean()) if len(jitter) else 0.0,
+        })
+    return results
+
+def sweep_active_regions(landmarks, region_starts):
+    """
+    Mede, para cada região ativa (início, 1 - início), a fração dos frames em que o cursor ficaria preso na borda da tela.
+
+    Args:
+        landmarks (np.ndarray): Array (N, 21, 3) com os landmarks dos frames com mão detectada
+        region_starts (np.ndarray): Inícios avaliados
+
+    Returns:
+        list: Um dicionário por região, com a fração de frames fora da região
+    """
+    pointer = landmarks[:, HandLandmark.RING_FINGER_MCP, :2]
+    starts = np.asarray(region_starts, dtype=np.float32)[:, np.newaxis, np.newaxis]
+    outside = ((pointer < starts) | (pointer > 1 - starts)).any(axis=2)
+    return [
+        {'active_region': [round(float(start), 6), round(float(1 - start), 6)], 'outside_fraction': float(fraction)}
+        for start, fraction in zip(starts[:, 0, 0], outside.mean(axis=1) if len(pointer) else np.zeros(len(starts)))
+    ]
+
+def write_csv(path, pinch_results):
+    """
+    Grava os resultados da varredura dos limiares de pinça em CSV, uma linha por combinação e rótulo.
+    """
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['pinch_threshold', 'right_pinch_threshold', 'label', 'support', 'precision', 'recall', 'f1_score', 'macro_f1'])
+        for result in pinch_results:
+            for label, metrics in result['labels'].items():
+                writer.writerow([
+                    result['pinch_threshold'], result['right_pinch_threshold'], label, metrics['support'],
+                    metrics['precision'], metrics['recall'], metrics['f1_score'], result['macro_f1'],
+                ])
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Varre os parâmetros do reconhecimento de gestos e do cursor sobre landmarks já gravados")
+    parser.add_argument("recordings", nargs="+", metavar="DIR[:LABEL]", help="Gravações do LandmarkRecorder (por exemplo, de tester.py --record ou utils.py --output landmarks)")
+    parser.add_argument("--pinch", nargs="+", default=['0.03:0.15:0.005'], help="Limiares de pinça: valores ou intervalos início:fim:passo")
+    parser.add_argument("--right-pinch", nargs="+", help="Limiares do clique direito. Se omitido, usa o mesmo limiar do clique esquerdo")
+    parser.add_argument("--smoothing", nargs="+", default=['0:0.95:0.05'], help="Fatores de suavização do cursor")
+    parser.add_argument("--region-start", nargs="+", default=['0:0.3:0.025'], help="Inícios da região ativa (a região vai de início a 1 - início)")
+    parser.add_argument("--top", type=int, default=5, help="Número de combinações de pinça mostradas no terminal")
+    parser.add_argument("--output", help="Arquivo de saída: JSON com todos os resultados, ou .csv com a varredura dos limiares de pinça")
+    args = parser.parse_args()
+
+    recordings = []
+    for recording in args.recordings:
+        path, label = recording.rsplit(':', 1) if ':' in recording else (recording, None)
+        recordings.append((path, None if label is None else int(label)))
+
+    start_time = time.perf_counter()
+    landmarks, labels = load_recordings(recordings)
+    segments = load_segments([path for path, _ in recordings])
+    load_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    pinch_results = sweep_pinch_thresholds(
+        landmarks, labels, parse_values(args.pinch), parse_values(args.right_pinch) if args.right_pinch else None
+    )
+    smoothing_results = sweep_smoothing(segments, parse_values(args.smoothing))
+    region_results = sweep_active_regions(landmarks, parse_values(args.region_start))
+    sweep_time = time.perf_counter() - start_time
+
+    print(f"{len(landmarks)} frames loaded in {load_time:.2f} s, {len(pinch_results)} pinch combinations evaluated in {sweep_time:.2f} s")
+    print("Best pinch thresholds (left, right, macro F1):")
+    for result in sorted(pinch_results, key=lambda result: -result['macro_f1'])[:args.top]:
+        print(f"  {result['pinch_threshold']:.3f} {result['right_pinch_threshold']:.3f} {result['macro_f1']:.3f}")
+    print("Smoothing (factor, lag, jitter):")
+    for result in smoothing_results:
+        print(f"  {result['smoothing_factor']:.2f} {result['lag']:.4f} {result['jitter']:.4f}")
+    print("Active region (region, fraction of frames outside):")
+    for result in region_results:
+        print(f"  {result['active_region'][0]:.3f}-{result['active_region'][1]:.3f} {result['outside_fraction']:.3f}")
+
+    if args.output:
+        if args.output.endswith('.csv'):
+            write_csv(args.output, pinch_results)
+        else:
+            with open(args.output, 'w') as file:
+                json.dump({'pinch': pinch_results, 'smoothing': smoothing_results, 'active_region': region_results}, file, indent=2)
@@ -1,44 +1,207 @@
+import argparse
 import cv2
 import os
+import sys
 import numpy as np
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-def extract_frames(video_path, num_frames, output_folder):
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+def iter_sampled_frames(cap, frame_indices, is_seeking=False):
+    """
+    Lê do vídeo apenas os frames de índices informados.
+
+    No modo sequencial, os frames intermediários são avançados com grab(), sem a conversão para imagem,
+    e apenas os frames amostrados passam por retrieve(). Isso evita o seek até o keyframe anterior e a
+    decodificação repetida que cap.set(cv2.CAP_PROP_POS_FRAMES) faz a cada frame.
+
+    Args:
+        cap: cv2.VideoCapture aberto no início do vídeo
+        frame_indices (np.ndarray): Índices dos frames desejados, em ordem crescente
+        is_seeking (bool): Se True, posiciona o vídeo com CAP_PROP_POS_FRAMES antes de cada leitura
+
+    Yields:
+        tuple: Posição do frame na amostragem, índice do frame no vídeo e o frame BGR
+    """
+    if is_seeking:
+        for idx, frame_no in enumerate(frame_indices):
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_no)
+            ret, frame = cap.read()
+            if ret:
+                yield idx, frame_no, frame
+        return
+
+    position = 0
+    frame = None
+    for idx, frame_no in enumerate(frame_indices):
+        # Índices repetidos (mais frames pedidos do que o vídeo tem) reaproveitam o último frame lido
+        if frame_no < position:
+            if frame is not None:
+                yield idx, frame_no, frame
+            continue
+
+        while position < frame_no:
+            if not cap.grab():
+                return
+            position += 1
+
+        if not cap.grab():
+            return
+        position += 1
+        ret, frame = cap.retrieve()
+        if ret:
+            yield idx, frame_no, frame
+
+def extract_frames(video_path, num_frames, output_folder, output='jpg', label=-1, writers=4, is_seeking=False):
     """
-    Extrai frames de um arquivo de vídeo e os salva como imagens individuais.
+    Extrai frames de um arquivo de vídeo e os salva como imagens individuais ou num dataset para o Tester.
 
-    Esta função abre um arquivo de vídeo, extrai um número específico de frames 
-    distribuídos uniformemente ao longo do vídeo e os salva como arquivos de imagem JPG.
+    Esta função abre um arquivo de vídeo, extrai um número específico de frames
+    distribuídos uniformemente ao longo do vídeo e os salva no formato pedido.
+    O vídeo é decodificado sequencialmente (ver iter_sampled_frames).
 
     Args:
         video_path (str): Caminho para o arquivo de vídeo a ser processado
         num_frames (int): Número de frames a serem extraídos do vídeo
         output_folder (str): Diretório onde os frames extraídos serão salvos
+        output (str): Formato da saída:
+            - 'jpg': um arquivo JPG por frame, codificados e gravados por um pool de threads
+            - 'frames': frames.npy (N, altura, largura, 3) com os frames BGR e labels.npy (N,), gravados sem codificação
+            - 'landmarks': uma gravação do LandmarkRecorder com os landmarks detectados pelo MediaPipe em cada frame
+        label (int): Rótulo real gravado nos datasets 'frames' e 'landmarks'
+        writers (int): Número de threads que codificam e gravam os JPGs
+        is_seeking (bool): Se True, usa o modo antigo, que posiciona o vídeo antes de cada frame
 
-    Os frames são salvos com nomes no formato: timestamp_XXXX_frame.jpg, onde:
+    Returns:
+        int: Número de frames extraídos
+
+    No formato 'jpg', os frames são salvos com nomes no formato: timestamp_XXXX_frame.jpg, onde:
     - timestamp é o momento da extração em segundos desde epoch
     - XXXX é o número sequencial do frame com 4 dígitos
     """
     os.makedirs(output_folder, exist_ok=True)
-    
+
     cap = cv2.VideoCapture(video_path)
-    
+
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-    
+
     if total_frames == 0:
         raise ValueError("Could not open video file or video file is empty")
-    
+
     frame_indices = np.linspace(0, total_frames - 1, num_frames, dtype=int)
-    
+    frames = iter_sampled_frames(cap, frame_indices, is_seeking)
+
+    try:
+        if output == 'jpg':
+            return _write_jpgs(frames, output_folder, writers)
+        if output == 'frames':
+            return _write_frames(frames, num_frames, output_folder, label)
+        if output == 'landmarks':
+            return _write_landmarks(frames, output_folder, label, cap.get(cv2.CAP_PROP_FPS) or 30)
+        raise ValueError(f"Unknown output format: {output}")
+    finally:
+        cap.release()
+
+def _write_jpgs(frames, output_folder, writers):
+    """
+    Codifica e grava os frames como JPG num pool de threads, com no máximo alguns frames por thread em espera.
+
+    Returns:
+        int: Número de frames gravados
+    """
     timestamp = int(time.time())
-    
-    for idx, frame_no in enumerate(frame_indices):
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_no)
-        
-        ret, frame = cap.read()
-        
-        if ret:
+    pending = deque()
+    count = 0
+    with ThreadPoolExecutor(max_workers=writers) as executor:
+        for idx, _, frame in frames:
             output_path = os.path.join(output_folder, f'{timestamp}_{idx:04d}_frame.jpg')
-            cv2.imwrite(output_path, frame)
-            
-    cap.release()
+            pending.append(executor.submit(cv2.imwrite, output_path, frame))
+            count += 1
+            if len(pending) >= writers * 2:
+                pending.popleft().result()
+        for future in pending:
+            future.result()
+    return count
+
+def _write_frames(frames, num_frames, output_folder, label):
+    """
+    Grava os frames BGR diretamente num .npy, sem codificação, para ser aberto com memory map pelo Tester.
+    Se o vídeo terminar antes do esperado, labels.npy indica quantos frames de frames.npy são válidos.
+
+    Returns:
+        int: Número de frames gravados
+    """
+    data = None
+    count = 0
+    for idx, _, frame in frames:
+        if data is None:
+            data = np.lib.format.open_memmap(
+                os.path.join(output_folder, 'frames.npy'), mode='w+', dtype=np.uint8, shape=(num_frames,) + frame.shape
+            )
+        data[count] = frame
+        count += 1
+    if data is not None:
+        data.flush()
+        del data
+    np.save(os.path.join(output_folder, 'labels.npy'), np.full(count, label, dtype=np.int8))
+    return count
+
+def _write_landmarks(frames, output_folder, label, fps):
+    """
+    Detecta a mão em cada frame e grava os landmarks com o LandmarkRecorder.
+    A detecção roda numa thread própria, em paralelo com a decodificação dos próximos frames.
+
+    Returns:
+        int: Número de frames gravados
+    """
+    import mediapipe as mp
+    from gesture_recognizer import landmarks_to_array
+    from landmark_recorder import LandmarkRecorder
+
+    hands = mp.solutions.hands.Hands(
+        static_image_mode=True,
+        model_complexity=0,
+        max_num_hands=1,
+        min_detection_confidence=0.6
+    )
+
+    def detect(frame):
+        results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        if not results.multi_hand_landmarks:
+            return None, None
+        return landmarks_to_array(results.multi_hand_landmarks[0]), results.multi_handedness[0].classification[0].label
+
+    def record_next(recorder):
+        frame_no, future = pending.popleft()
+        landmarks, handedness = future.result()
+        recorder.record(landmarks, handedness, -1, timestamp=frame_no / fps, label=label)
+
+    count = 0
+    pending = deque()
+    with LandmarkRecorder(output_folder) as recorder, ThreadPoolExecutor(max_workers=1) as executor:
+        for _, frame_no, frame in frames:
+            pending.append((frame_no, executor.submit(detect, frame)))
+            count += 1
+            if len(pending) >= 4:
+                record_next(recorder)
+        while pending:
+            record_next(recorder)
+    hands.close()
+    return count
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Extrai frames de um vídeo para montar um dataset")
+    parser.add_argument("video_path", help="Arquivo de vídeo")
+    parser.add_argument("num_frames", type=int, help="Número de frames extraídos, distribuídos uniformemente pelo vídeo")
+    parser.add_argument("output_folder", help="Diretório de saída")
+    parser.add_argument("--output", choices=('jpg', 'frames', 'landmarks'), default='jpg', help="Formato da saída")
+    parser.add_argument("--label", type=int, default=-1, help="Rótulo real gravado nos formatos 'frames' e 'landmarks'")
+    parser.add_argument("--writers", type=int, default=4, help="Threads que codificam e gravam os JPGs")
+    parser.add_argument("--seek", action="store_true", help="Posiciona o vídeo antes de cada frame, em vez de decodificá-lo sequencialmente")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    count = extract_frames(args.video_path, args.num_frames, args.output_folder, args.output, args.label, args.writers, args.seek)
+    print(f"Extracted {count} frames in {time.perf_counter() - start_time:.2f} s")